@@ -193,6 +193,27 @@ class DatabaseSetup:
             self.logger.error(f"Error creating schema: {e}")
             raise
 
+        self.migrate_schema()
+
+    def migrate_schema(self) -> None:
+        """Apply one-off schema migrations; a blocked or failed step is logged and skipped."""
+        for migration in self.schema.migrations:
+            blockers = self.connection.execute_query(migration.precheck)
+            if blockers:
+                self.logger.warning(
+                    f"Skipping migration {migration.name}; resolve these first: {blockers}"
+                )
+                continue
+
+            try:
+                for query in migration.apply:
+                    self.connection.execute_query(query)
+                self.logger.info(f"Applied migration {migration.name}")
+            except Exception as e:
+                self.logger.warning(f"Migration {migration.name} failed, rolling back: {e}")
+                for query in migration.rollback:
+                    self.connection.execute_query(query)
+
     def load_sample_data(self) -> None:
         """Load sample data into the database."""
         self.logger.info("Loading sample data...")
@@ -377,6 +398,8 @@ def main():
     parser.add_argument("--no-sample-data", action="store_true", help="Skip loading sample data")
     parser.add_argument("--force", action="store_true", help="Skip confirmation prompts")
     parser.add_argument("--verify-only", action="store_true", help="Only verify existing setup")
+    parser.add_argument("--migrate-only", action="store_true",
+                        help="Only apply schema migrations to an existing database")
 
     args = parser.parse_args()
 
@@ -400,6 +423,10 @@ def main():
             success = setup_manager.verify_setup()
             sys.exit(0 if success else 1)
 
+        if args.migrate_only:
+            setup_manager.migrate_schema()
+            sys.exit(0)
+
         # Clear database if requested
         if args.clear:
             setup_manager.clear_database(confirm=args.force)
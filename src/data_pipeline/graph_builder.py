@@ -329,6 +329,37 @@ class GraphBuilder:
             self.stats["errors"].append(f"Failed to create player-team relationships: {e}")
             return 0
 
+    def create_player_name_trigrams(self) -> int:
+        """
+        Materialize lowercase 3-grams of every player name as NameTrigram nodes.
+
+        The MCP search_player tool seeks these (NameTrigram.gram is indexed) to
+        answer substring searches without scanning every Player name.
+
+        Returns:
+            Number of players linked to their trigrams
+        """
+        query = """
+            MATCH (p:Player)
+            WHERE p.name IS NOT NULL
+            WITH p, toLower(p.name) AS name
+            UNWIND [i IN range(0, size(name) - 3) | substring(name, i, 3)] AS gram
+            MERGE (g:NameTrigram {gram: gram})
+            MERGE (p)-[:HAS_TRIGRAM]->(g)
+            RETURN count(DISTINCT p) as players
+        """
+
+        try:
+            result = self.db.execute_write_query(query)
+            players_linked = result[0]["players"] if result else 0
+            self.logger.info(f"Indexed name trigrams for {players_linked} players")
+            return players_linked
+
+        except Exception as e:
+            self.logger.error(f"Failed to create player name trigrams: {e}")
+            self.stats["errors"].append(f"Failed to create player name trigrams: {e}")
+            return 0
+
     def create_stadium_relationships(self) -> int:
         """Create relationships between teams and their stadiums."""
         try:
@@ -415,6 +446,7 @@ class GraphBuilder:
             self.create_entity_batch(seasons, "Season")
 
             self.create_entity_batch(data.get("players", []), "Player")
+            self.create_player_name_trigrams()
             self.create_entity_batch(data.get("matches", []), "Match")
 
             # Create relationships
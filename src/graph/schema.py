@@ -10,6 +10,7 @@ Context Block:
 - Relationships: All soccer-specific relationships with proper cardinalities
 - Constraints: Unique constraints and data integrity rules
 - Indexes: Performance optimization indexes for common queries
+- Migrations: One-off steps that move existing databases to the current schema
 """
 
 from typing import Dict, List, Any
@@ -61,6 +62,17 @@ class NodeSchema:
     indexed_properties: List[str]
 
 
+@dataclass
+class SchemaMigration:
+    """One-off schema change applied to databases created by older versions."""
+    name: str
+    # Rows returned by precheck block the migration (e.g. duplicate values)
+    precheck: str
+    apply: List[str]
+    # Restores the previous state if an apply statement fails
+    rollback: List[str]
+
+
 @dataclass
 class RelationshipSchema:
     """Schema definition for a relationship type."""
@@ -79,6 +91,7 @@ class GraphSchema:
         self.relationships = self._define_relationships()
         self.constraints = self._define_constraints()
         self.indexes = self._define_indexes()
+        self.migrations = self._define_migrations()
 
     def _define_nodes(self) -> Dict[str, NodeSchema]:
         """Define all node schemas in the graph."""
@@ -389,6 +402,10 @@ class GraphSchema:
         return [
             "CREATE CONSTRAINT player_id_unique IF NOT EXISTS FOR (p:Player) REQUIRE p.player_id IS UNIQUE",
             "CREATE CONSTRAINT team_id_unique IF NOT EXISTS FOR (t:Team) REQUIRE t.team_id IS UNIQUE",
+            # Team names are the join key for matches; the constraint's backing
+            # index serves the (:Team {name: $name}) seeks. Older graphs carry
+            # team_name_index instead (see the team_name_unique migration).
+            "CREATE CONSTRAINT team_name_unique IF NOT EXISTS FOR (t:Team) REQUIRE t.name IS UNIQUE",
             "CREATE CONSTRAINT match_id_unique IF NOT EXISTS FOR (m:Match) REQUIRE m.match_id IS UNIQUE",
             "CREATE CONSTRAINT competition_id_unique IF NOT EXISTS FOR (c:Competition) REQUIRE c.competition_id IS UNIQUE",
             "CREATE CONSTRAINT stadium_id_unique IF NOT EXISTS FOR (s:Stadium) REQUIRE s.stadium_id IS UNIQUE",
@@ -403,18 +420,23 @@ class GraphSchema:
         return [
             # Player indexes
             "CREATE INDEX player_name_index IF NOT EXISTS FOR (p:Player) ON (p.name)",
+            "CREATE INDEX player_id_index IF NOT EXISTS FOR (p:Player) ON (p.id)",
             "CREATE INDEX player_position_index IF NOT EXISTS FOR (p:Player) ON (p.position)",
             "CREATE INDEX player_nationality_index IF NOT EXISTS FOR (p:Player) ON (p.nationality)",
+            "CREATE TEXT INDEX player_name_text IF NOT EXISTS FOR (p:Player) ON (p.name)",
+            "CREATE FULLTEXT INDEX player_fulltext IF NOT EXISTS FOR (p:Player) ON EACH [p.name]",
+            "CREATE INDEX name_trigram_index IF NOT EXISTS FOR (g:NameTrigram) ON (g.gram)",
 
             # Team indexes
-            "CREATE INDEX team_name_index IF NOT EXISTS FOR (t:Team) ON (t.name)",
             "CREATE INDEX team_city_index IF NOT EXISTS FOR (t:Team) ON (t.city)",
             "CREATE INDEX team_state_index IF NOT EXISTS FOR (t:Team) ON (t.state)",
+            "CREATE FULLTEXT INDEX team_fulltext IF NOT EXISTS FOR (t:Team) ON EACH [t.name]",
 
             # Match indexes
             "CREATE INDEX match_date_index IF NOT EXISTS FOR (m:Match) ON (m.date)",
             "CREATE INDEX match_round_index IF NOT EXISTS FOR (m:Match) ON (m.round)",
             "CREATE INDEX match_status_index IF NOT EXISTS FOR (m:Match) ON (m.status)",
+            "CREATE INDEX match_result_index IF NOT EXISTS FOR (m:Match) ON (m.result)",
 
             # Competition indexes
             "CREATE INDEX competition_name_index IF NOT EXISTS FOR (c:Competition) ON (c.name)",
@@ -435,9 +457,35 @@ class GraphSchema:
 
             # Composite indexes for common queries
             "CREATE INDEX match_date_competition IF NOT EXISTS FOR (m:Match) ON (m.date, m.competition_id)",
+            "CREATE INDEX match_date_teams IF NOT EXISTS FOR (m:Match) ON (m.date, m.home_team, m.away_team)",
+            "CREATE INDEX match_id_index IF NOT EXISTS FOR (m:Match) ON (m.id)",
+            "CREATE INDEX competition_name_season IF NOT EXISTS FOR (c:Competition) ON (c.name, c.season)",
             "CREATE INDEX player_team_date IF NOT EXISTS FOR ()-[r:PLAYS_FOR]-() ON (r.start_date, r.end_date)"
         ]
 
+    def _define_migrations(self) -> List[SchemaMigration]:
+        """Define one-off migrations for databases created by older versions."""
+        return [
+            # Neo4j will not create the uniqueness constraint while the plain
+            # index on the same property exists, so the index is dropped just
+            # before and recreated if the constraint still fails
+            SchemaMigration(
+                name="team_name_unique",
+                precheck=(
+                    "MATCH (t:Team) WHERE t.name IS NOT NULL "
+                    "WITH t.name AS name, count(*) AS copies WHERE copies > 1 "
+                    "RETURN name, copies LIMIT 10"
+                ),
+                apply=[
+                    "DROP INDEX team_name_index IF EXISTS",
+                    "CREATE CONSTRAINT team_name_unique IF NOT EXISTS FOR (t:Team) REQUIRE t.name IS UNIQUE",
+                ],
+                rollback=[
+                    "CREATE INDEX team_name_index IF NOT EXISTS FOR (t:Team) ON (t.name)",
+                ],
+            ),
+        ]
+
     def get_schema_creation_queries(self) -> List[str]:
         """Get all queries needed to create the complete schema."""
         queries = []
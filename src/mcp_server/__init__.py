@@ -16,6 +16,8 @@ TECHNICAL DETAILS:
 - Graph Schema: Player, Team, Match, Competition entities
 - Performance: Caching, query optimization
 - Testing: Integration with demo questions
+- Imports: server exports resolve lazily (PEP 562), so importing
+  mcp_server.config does not load neo4j/mcp
 
 INTEGRATION:
 - MCP Tools: Complete tool set for soccer data queries
@@ -23,11 +25,17 @@ INTEGRATION:
 - Rate Limiting: Built-in for external APIs
 """
 
-from .server import BrazilianSoccerMCPServer, main
-
 __all__ = [
     'BrazilianSoccerMCPServer',
     'main'
 ]
 
-__version__ = "1.0.0"
\ No newline at end of file
+__version__ = "1.0.0"
+
+
+def __getattr__(name):
+    """Import the server module on first access to one of its exports"""
+    if name in __all__:
+        from . import server
+        return getattr(server, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
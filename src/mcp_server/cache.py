@@ -0,0 +1,205 @@
+"""
+Brazilian Soccer MCP Knowledge Graph - Query Cache
+
+CONTEXT:
+This module implements the in-process result cache shared by the MCP tool modules.
+It bounds memory with LRU eviction and expires entries lazily after a fixed TTL.
+Entries can carry dependency tags (e.g. "player:<name>") so writers can evict
+every result that depends on an entity without waiting for the TTL.
+
+PHASE: 2/3 - Enhancement/Integration
+PURPOSE: MCP server implementation for Claude integration
+DATA SOURCES: Tool responses built from Neo4j queries
+DEPENDENCIES: collections, time
+
+TECHNICAL DETAILS:
+- Storage: OrderedDict ordered by recency (oldest first)
+- Expiry: Lazy, checked on access against time.monotonic()
+- Eviction: Least recently used entry once maxsize is exceeded
+- Invalidation: Tag -> keys index, kept in sync as entries are removed
+- Encodings: serialized forms of cached values (see mcp_server.serialization)
+  are kept per value identity and dropped when the value leaves the cache
+- Decorators: cached_response serves tool coroutines from their owner's cache and
+  single_flight shares one in-flight call among concurrent identical requests;
+  both key on the method name and its bound arguments (defaults applied)
+"""
+
+import asyncio
+import functools
+import inspect
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set
+
+
+class TTLCache:
+    """Size-bounded LRU cache with per-entry time-to-live"""
+
+    def __init__(self, maxsize: int = 1000, ttl: float = 1800.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._tags: Dict[str, Set[Hashable]] = defaultdict(set)
+        # id(value) -> number of keys holding it; a held value's id cannot be reused
+        self._refs: Dict[int, int] = {}
+        # id(value) -> {variant: encoding} for values currently held
+        self._encoded: Dict[int, Dict[Hashable, Any]] = {}
+
+    def _remove(self, key: Hashable) -> Optional[tuple]:
+        """Drop key from storage and the tag index, returning its entry"""
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            value_id = id(entry[0])
+            if self._refs[value_id] > 1:
+                self._refs[value_id] -= 1
+            else:
+                del self._refs[value_id]
+                self._encoded.pop(value_id, None)
+            for tag in entry[2]:
+                keys = self._tags.get(tag)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._tags[tag]
+        return entry
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        value, timestamp, _ = entry
+        if time.monotonic() - timestamp > self.ttl:
+            self._remove(key)
+            return default
+
+        # Mark as most recently used
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[str] = ()) -> None:
+        """Store value under key, evicting the least recently used entry if full"""
+        self._remove(key)
+        tags = tuple(tags)
+        self._data[key] = (value, time.monotonic(), tags)
+        self._refs[id(value)] = self._refs.get(id(value), 0) + 1
+        for tag in tags:
+            self._tags[tag].add(key)
+        while len(self._data) > self.maxsize:
+            self._remove(next(iter(self._data)))
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove key and return its value, or default if missing or expired"""
+        entry = self._remove(key)
+        if entry is None or time.monotonic() - entry[1] > self.ttl:
+            return default
+        return entry[0]
+
+    def invalidate(self, tag: str) -> int:
+        """Remove every entry stored with tag; returns the number removed"""
+        keys = self._tags.pop(tag, set())
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._data.clear()
+        self._tags.clear()
+        self._refs.clear()
+        self._encoded.clear()
+
+    def holds(self, value: Any) -> bool:
+        """True if value itself (not an equal copy) is stored under some key"""
+        return id(value) in self._refs
+
+    def get_encoded(self, value: Any, variant: Hashable = None) -> Optional[Any]:
+        """Return the encoding remembered for a held value, or None"""
+        return self._encoded.get(id(value), {}).get(variant)
+
+    def set_encoded(self, value: Any, encoding: Any, variant: Hashable = None) -> None:
+        """Remember the encoding of a held value until it leaves the cache"""
+        if self.holds(value):
+            self._encoded.setdefault(id(value), {})[variant] = encoding
+
+    # Mapping-style access for callers that still use ``key in cache`` / ``cache[key]``
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and time.monotonic() - entry[1] <= self.ttl
+
+    def __getitem__(self, key: Hashable) -> Any:
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        if self._remove(key) is None:
+            raise KeyError(key)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _call_key(method, signature: inspect.Signature, args: tuple, kwargs: dict) -> tuple:
+    """Build a hashable key for a method call from its bound arguments"""
+    # Bind so positional, keyword and defaulted calls share one key
+    bound = signature.bind(None, *args, **kwargs)
+    bound.apply_defaults()
+    return (method.__name__,) + tuple(
+        tuple(v) if isinstance(v, list) else v
+        for v in list(bound.arguments.values())[1:]
+    )
+
+
+def cached_response(tags: Callable[[Dict[str, Any]], Iterable[str]] = lambda response: (),
+                    negative: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                    negative_tags: Iterable[str] = ()):
+    """Cache a tool coroutine's responses in ``self.cache``; error responses are not stored
+
+    Responses matching ``negative`` (e.g. "not found") are kept in the owner's
+    short-lived ``self.neg_cache`` under negative_tags instead.
+    """
+    negative_tags = tuple(negative_tags)
+
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            key = _call_key(method, signature, args, kwargs)
+            # Check caches (recent misses first)
+            cached = (self.neg_cache.get(key) if negative else None) or self.cache.get(key)
+            if cached is not None:
+                return cached
+
+            response = await method(self, *args, **kwargs)
+            if "error" not in response:
+                self.cache.set(key, response, tags=tags(response))
+            elif negative and negative(response):
+                self.neg_cache.set(key, response, tags=negative_tags)
+            return response
+        return wrapper
+    return decorator
+
+
+def single_flight(method):
+    """Share one in-flight call among concurrent identical requests (cache stampede guard)"""
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        key = _call_key(method, signature, args, kwargs)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(method(self, *args, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller being cancelled does not cancel the shared query
+        return await asyncio.shield(task)
+    return wrapper
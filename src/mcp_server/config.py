@@ -44,6 +44,14 @@ class Config:
     CACHE_TTL_MINUTES = int(os.getenv('CACHE_TTL_MINUTES', '30'))
     CACHE_MAX_SIZE = int(os.getenv('CACHE_MAX_SIZE', '1000'))
     ENABLE_CACHING = os.getenv('ENABLE_CACHING', 'true').lower() == 'true'
+    NEGATIVE_CACHE_TTL_SECONDS = int(os.getenv('NEGATIVE_CACHE_TTL_SECONDS', '60'))
+    NEGATIVE_CACHE_MAX_SIZE = int(os.getenv('NEGATIVE_CACHE_MAX_SIZE', '1024'))
+    MAX_CACHED_ROWS = int(os.getenv('MAX_CACHED_ROWS', '500'))  # Larger results are not cached
+    REDIS_URL = os.getenv('REDIS_URL')  # Optional shared L2 cache, e.g. redis://localhost:6379/0
+
+    # Competitions whose standings/top scorers are precomputed at startup
+    WARM_COMPETITIONS = [c.strip() for c in os.getenv('WARM_COMPETITIONS', '').split(',') if c.strip()]
+    WARM_SEASONS = [s.strip() for s in os.getenv('WARM_SEASONS', '').split(',') if s.strip()] or [None]
 
     # Query Limits
     DEFAULT_SEARCH_LIMIT = 10
@@ -53,7 +61,11 @@ class Config:
 
     # Performance Settings
     QUERY_TIMEOUT_SECONDS = int(os.getenv('QUERY_TIMEOUT_SECONDS', '30'))
-    CONNECTION_POOL_SIZE = int(os.getenv('CONNECTION_POOL_SIZE', '10'))
+    CONNECTION_POOL_SIZE = int(os.getenv('CONNECTION_POOL_SIZE', '50'))
+    CONNECTION_ACQUISITION_TIMEOUT = int(os.getenv('CONNECTION_ACQUISITION_TIMEOUT', '30'))
+    CONNECTION_MAX_LIFETIME = int(os.getenv('CONNECTION_MAX_LIFETIME', '3600'))
+    # Neo4j Enterprise 5.13+ only: run heavy read aggregations on the parallel runtime
+    CYPHER_PARALLEL_RUNTIME = os.getenv('CYPHER_PARALLEL_RUNTIME', 'false').lower() == 'true'
 
     # Tool Configuration
     TOOLS_CONFIG = {
@@ -91,6 +103,8 @@ class Config:
             'auth': (cls.NEO4J_USER, cls.NEO4J_PASSWORD),
             'database': cls.NEO4J_DATABASE,
             'max_connection_pool_size': cls.CONNECTION_POOL_SIZE,
+            'connection_acquisition_timeout': cls.CONNECTION_ACQUISITION_TIMEOUT,
+            'max_connection_lifetime': cls.CONNECTION_MAX_LIFETIME,
             'connection_timeout': cls.QUERY_TIMEOUT_SECONDS,
             'max_transaction_retry_time': cls.QUERY_TIMEOUT_SECONDS
         }
@@ -172,6 +186,7 @@ TOOL_HELP = {
     "search_team": "Search for teams by name or partial name. Returns team info and current player count.",
     "get_team_roster": "Get current roster/squad for a team with player details and positions.",
     "get_team_stats": "Get team statistics including wins, losses, goals, and recent form.",
+    "get_team_bundle": "Get team info, roster and statistics together in a single query.",
     "get_match_details": "Get detailed information about a specific match including lineups and events.",
     "search_matches": "Search for matches by team, date range, or competition with flexible filters.",
     "get_head_to_head": "Compare two teams with historical record, goals, and match details.",
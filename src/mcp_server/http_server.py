@@ -15,6 +15,8 @@ TECHNICAL DETAILS:
 - HTTP Server: http://localhost:3000
 - Converts JSON-RPC over HTTP to MCP protocol
 - Wraps MCP server for testing
+- POST /stream/get_team_roster streams the roster as NDJSON (header line, then
+  one line per batch of players)
 """
 
 import asyncio
@@ -29,6 +31,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.mcp_server.server import BrazilianSoccerMCPServer
+from src.mcp_server.serialization import to_json_bytes
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -127,6 +130,14 @@ class HTTPMCPBridge:
                     result = await self.mcp_server.team_tools.get_team_roster(**params)
                 else:
                     result = {"error": "Team tools not initialized"}
+            elif tool_name == "get_team_bundle":
+                if self.mcp_server.team_tools:
+                    # Convert team_id to team_name if needed
+                    if "team_id" in params:
+                        params["team_name"] = params.pop("team_id")
+                    result = await self.mcp_server.team_tools.get_team_bundle(**params)
+                else:
+                    result = {"error": "Team tools not initialized"}
             elif tool_name == "search_teams_by_league":
                 if self.mcp_server.team_tools:
                     result = await self.mcp_server.team_tools.search_teams_by_league(**params)
@@ -162,12 +173,15 @@ class HTTPMCPBridge:
                     }
                 })
 
-            # Return JSON-RPC response
-            return web.json_response({
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": result
-            })
+            # Return JSON-RPC response (encoded straight to bytes)
+            return web.Response(
+                body=to_json_bytes({
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "result": result
+                }),
+                content_type="application/json"
+            )
 
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON: {e}")
@@ -195,6 +209,25 @@ class HTTPMCPBridge:
         """Handle MCP endpoint."""
         return await self.handle_request(request)
 
+    async def handle_stream_roster(self, request: web.Request) -> web.StreamResponse:
+        """Stream a team roster as NDJSON, one line per chunk."""
+        params = await request.json()
+        # Convert team_id to team_name if needed
+        if "team_id" in params:
+            params["team_name"] = params.pop("team_id")
+
+        # Headers are sent on prepare(), before the CORS middleware sees the response
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson",
+                                               "Access-Control-Allow-Origin": "*"})
+        await response.prepare(request)
+        if not self.mcp_server.team_tools:
+            await response.write(to_json_bytes({"error": "Team tools not initialized"}) + b"\n")
+        else:
+            async for chunk in self.mcp_server.team_tools.stream_team_roster(**params):
+                await response.write(to_json_bytes(chunk) + b"\n")
+        await response.write_eof()
+        return response
+
     async def handle_health(self, request: web.Request) -> web.Response:
         """Health check endpoint."""
         return web.json_response({"status": "healthy", "server": "brazilian-soccer-kg"})
@@ -214,6 +247,7 @@ def create_app():
 
     # Add routes
     app.router.add_post('/mcp', bridge.handle_mcp)
+    app.router.add_post('/stream/get_team_roster', bridge.handle_stream_roster)
     app.router.add_get('/health', bridge.handle_health)
 
     # Add CORS headers
@@ -0,0 +1,66 @@
+"""
+Brazilian Soccer MCP Knowledge Graph - Response Serialization
+
+CONTEXT:
+This module encodes tool responses to JSON for the MCP and HTTP transports.
+
+PHASE: 2/3 - Enhancement/Integration
+PURPOSE: MCP server implementation for Claude integration
+DATA SOURCES: Tool responses built from Neo4j queries
+DEPENDENCIES: orjson
+
+TECHNICAL DETAILS:
+- Encoder: orjson (UTF-8 output, non-ASCII characters kept as-is)
+- Keys: non-string dict keys (ints, dates) are stringified like the stdlib encoder
+- Transports that write bytes should use to_json_bytes and skip the str round-trip
+- Memo: cached tool responses are returned as the same object on every hit, so
+  their encoded form is kept on the owning TTLCache while it holds the response
+  (to_json_memoized); one-off responses are encoded without being remembered
+- Async: to_json_memoized_async encodes memo misses in the default executor so
+  large rosters/histories do not stall the event loop; the memo itself is only
+  touched on the loop thread
+"""
+
+import asyncio
+from typing import Any
+
+import orjson
+
+from .cache import TTLCache
+
+
+def to_json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Serialize a tool response to UTF-8 encoded JSON"""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, option=option)
+
+
+def to_json(obj: Any, indent: bool = False) -> str:
+    """Serialize a tool response to a JSON string"""
+    return to_json_bytes(obj, indent=indent).decode("utf-8")
+
+
+def to_json_memoized(obj: Any, cache: TTLCache, indent: bool = False) -> str:
+    """Serialize a tool response, reusing the encoding of a response held by cache"""
+    text = cache.get_encoded(obj, indent)
+    if text is None:
+        text = to_json(obj, indent=indent)
+        # No-op unless obj is a cached response, so nothing else is kept alive
+        cache.set_encoded(obj, text, indent)
+    return text
+
+
+async def to_json_memoized_async(obj: Any, cache: TTLCache, indent: bool = False) -> str:
+    """Serialize a tool response like to_json_memoized, encoding misses off the event loop"""
+    text = cache.get_encoded(obj, indent)
+    if text is None:
+        text = await asyncio.get_running_loop().run_in_executor(None, to_json, obj, indent)
+        cache.set_encoded(obj, text, indent)
+    return text
+
+
+def from_json(data: Any) -> Any:
+    """Deserialize JSON produced by to_json_bytes/to_json"""
+    return orjson.loads(data)
@@ -34,13 +34,22 @@ from mcp.types import Resource, Tool, TextContent, ImageContent, EmbeddedResourc
 import mcp.types as types
 
 from neo4j import AsyncGraphDatabase
-from datetime import datetime, timedelta
-import json
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Redis L2 cache is optional
+    aioredis = None
+
+from .cache import TTLCache
+from .config import Config
+from .serialization import to_json, to_json_memoized_async
 
 # Import tool modules
-from .tools.player_tools import PlayerTools
-from .tools.team_tools import TeamTools
-from .tools.match_tools import MatchTools
+from .tools.player_tools import PlayerTools, REQUIRED_INDEXES as PLAYER_INDEXES
+from .tools.team_tools import (
+    TeamTools, REQUIRED_INDEXES as TEAM_INDEXES, INDEX_FALLBACKS as TEAM_INDEX_FALLBACKS
+)
+from .tools.match_tools import MatchTools, REQUIRED_INDEXES as MATCH_INDEXES
 from .tools.analysis_tools import AnalysisTools
 
 # Configure logging
@@ -50,11 +59,19 @@ logger = logging.getLogger(__name__)
 class BrazilianSoccerMCPServer:
     """Main MCP server for Brazilian Soccer Knowledge Graph"""
 
-    def __init__(self):
+    def __init__(self, pool_size: Optional[int] = None, acquire_timeout: Optional[int] = None):
         self.server = Server("brazilian-soccer-kg")
         self.driver = None
-        self.cache = {}
-        self.cache_ttl = timedelta(minutes=30)
+        # Driver pool settings; default to Config.CONNECTION_POOL_SIZE and
+        # Config.CONNECTION_ACQUISITION_TIMEOUT
+        self.pool_size = pool_size or Config.CONNECTION_POOL_SIZE
+        self.acquire_timeout = acquire_timeout or Config.CONNECTION_ACQUISITION_TIMEOUT
+        self.cache = TTLCache(
+            maxsize=Config.CACHE_MAX_SIZE,
+            ttl=Config.CACHE_TTL_MINUTES * 60
+        )
+        self.redis = None
+        self._warm_task = None
 
         # Tool modules
         self.player_tools = None
@@ -70,30 +87,79 @@ class BrazilianSoccerMCPServer:
         try:
             self.driver = AsyncGraphDatabase.driver(
                 "bolt://localhost:7687",
-                auth=("neo4j", "neo4j123")
+                auth=("neo4j", "neo4j123"),
+                max_connection_pool_size=self.pool_size,
+                connection_acquisition_timeout=self.acquire_timeout,
+                max_connection_lifetime=Config.CONNECTION_MAX_LIFETIME
             )
 
             # Test connection
-            async with self.driver.session() as session:
+            async with self.driver.session(database=Config.NEO4J_DATABASE) as session:
                 result = await session.run("RETURN 1 as test")
                 await result.consume()
 
             logger.info("Successfully connected to Neo4j")
 
+            await self._ensure_indexes()
+
+            if Config.REDIS_URL:
+                if aioredis is None:
+                    logger.warning("REDIS_URL is set but the redis package is not installed")
+                else:
+                    self.redis = aioredis.from_url(Config.REDIS_URL)
+
             # Initialize tool modules
             self.player_tools = PlayerTools(self.driver, self.cache)
             self.team_tools = TeamTools(self.driver, self.cache)
-            self.match_tools = MatchTools(self.driver, self.cache)
+            self.match_tools = MatchTools(self.driver, self.cache, redis=self.redis)
             self.analysis_tools = AnalysisTools(self.driver, self.cache)
 
+            # Warm competition aggregates in the background so startup is not blocked
+            if Config.WARM_COMPETITIONS:
+                self._warm_task = asyncio.create_task(
+                    self.match_tools.run_warm_loop(Config.WARM_COMPETITIONS, Config.WARM_SEASONS)
+                )
+
         except Exception as e:
             logger.error(f"Failed to connect to Neo4j: {e}")
             raise
 
+    async def _ensure_indexes(self):
+        """Create the indexes the tool queries depend on if they are missing"""
+        try:
+            async with self.driver.session(database=Config.NEO4J_DATABASE) as session:
+                # dict.fromkeys drops statements shared by several tool modules
+                for statement in dict.fromkeys(PLAYER_INDEXES + TEAM_INDEXES + MATCH_INDEXES):
+                    # A missing index only costs a slower plan, so one failure must
+                    # not skip the remaining statements
+                    try:
+                        result = await session.run(statement)
+                        await result.consume()
+                    except Exception as e:
+                        fallback = TEAM_INDEX_FALLBACKS.get(statement)
+                        if fallback is None:
+                            logger.warning(f"Could not apply '{statement}': {e}")
+                            continue
+                        logger.warning(
+                            f"Could not apply '{statement}' ({e}); using a plain index instead. "
+                            "Run scripts/setup_database.py --migrate-only to add the constraint"
+                        )
+                        try:
+                            result = await session.run(fallback)
+                            await result.consume()
+                        except Exception as fallback_error:
+                            logger.warning(f"Could not apply '{fallback}': {fallback_error}")
+        except Exception as e:
+            logger.warning(f"Could not ensure Neo4j indexes: {e}")
+
     async def close(self):
         """Close database connections"""
+        if self._warm_task:
+            self._warm_task.cancel()
         if self.driver:
             await self.driver.close()
+        if self.redis:
+            await self.redis.close()
 
     def setup_handlers(self):
         """Setup MCP handlers"""
@@ -207,6 +273,19 @@ class BrazilianSoccerMCPServer:
                         },
                         "required": ["team_name"]
                     }
+                ),
+                Tool(
+                    name="get_team_bundle",
+                    description="Get team info, roster and statistics in one call",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "team_name": {"type": "string", "description": "Full team name"},
+                            "season": {"type": "string", "description": "Season year for the roster (optional)"},
+                            "competition": {"type": "string", "description": "Competition name for the statistics (optional)"}
+                        },
+                        "required": ["team_name"]
+                    }
                 )
             ])
 
@@ -235,7 +314,16 @@ class BrazilianSoccerMCPServer:
                             "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD, optional)"},
                             "end_date": {"type": "string", "description": "End date (YYYY-MM-DD, optional)"},
                             "competition": {"type": "string", "description": "Competition name (optional)"},
-                            "limit": {"type": "integer", "description": "Maximum results", "default": 20}
+                            "limit": {"type": "integer", "description": "Maximum results", "default": 20},
+                            "fields": {
+                                "type": "array",
+                                "items": {
+                                    "type": "string",
+                                    "enum": ["id", "date", "home_team", "away_team",
+                                             "home_score", "away_score", "venue", "competition"]
+                                },
+                                "description": "Only return these match fields (optional)"
+                            }
                         }
                     }
                 ),
@@ -336,6 +424,8 @@ class BrazilianSoccerMCPServer:
                     result = await self.team_tools.get_team_roster(**arguments)
                 elif name == "get_team_stats":
                     result = await self.team_tools.get_team_stats(**arguments)
+                elif name == "get_team_bundle":
+                    result = await self.team_tools.get_team_bundle(**arguments)
 
                 # Match tools
                 elif name == "get_match_details":
@@ -362,7 +452,7 @@ class BrazilianSoccerMCPServer:
 
                 return [types.TextContent(
                     type="text",
-                    text=json.dumps(result, indent=2, ensure_ascii=False)
+                    text=await to_json_memoized_async(result, self.cache, indent=True)
                 )]
 
             except Exception as e:
@@ -388,6 +478,7 @@ TEAM TOOLS:
 - search_team: Search for teams by name
 - get_team_roster: Get team roster/squad
 - get_team_stats: Get team statistics
+- get_team_bundle: Get team roster and statistics together
 
 MATCH TOOLS:
 - get_match_details: Get specific match information
@@ -424,16 +515,22 @@ EXAMPLE QUERIES:
                 "PART_OF": "Match → Competition"
             }
         }
-        return json.dumps(schema, indent=2)
+        return to_json(schema, indent=True)
 
 # Main server instance
 server_instance = BrazilianSoccerMCPServer()
 
-async def main():
+async def main(pool_size: Optional[int] = None, acquire_timeout: Optional[int] = None):
     """Main server entry point"""
     # Use stdin/stdout for MCP communication
     from mcp.server.stdio import stdio_server
 
+    # Runner overrides apply to this server's driver only, not to Config
+    if pool_size:
+        server_instance.pool_size = pool_size
+    if acquire_timeout:
+        server_instance.acquire_timeout = acquire_timeout
+
     async with stdio_server() as (read_stream, write_stream):
         await server_instance.connect_to_neo4j()
         try:
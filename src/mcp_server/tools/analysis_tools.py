@@ -25,50 +25,51 @@ INTEGRATION:
 
 import logging
 from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
-import json
+from datetime import datetime
+
+from neo4j import READ_ACCESS
+
+from ..config import Config
 
 logger = logging.getLogger(__name__)
 
 class AnalysisTools:
     """Complex analysis MCP tools"""
 
-    def __init__(self, driver, cache):
+    def __init__(self, driver, cache, database: str = Config.NEO4J_DATABASE):
         self.driver = driver
         self.cache = cache
-        self.cache_ttl = timedelta(minutes=30)
+        self._database = database
+
+    def _read_session(self):
+        """Open a read-only session on the configured database"""
+        # Naming the database skips the home-database lookup on every session
+        return self.driver.session(database=self._database,
+                                   default_access_mode=READ_ACCESS)
 
     async def find_common_teammates(self, players: List[str],
                                    team: Optional[str] = None) -> Dict[str, Any]:
         """Find players who were teammates with specific players"""
 
-        cache_key = f"common_teammates_{'_'.join(sorted(players))}_{team or 'any'}"
+        cache_key = ("common_teammates", tuple(sorted(players)), team)
 
         # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if datetime.now() - timestamp < self.cache_ttl:
-                return cached_data
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            async with self.driver.session() as session:
+            async with self._read_session() as session:
                 if len(players) < 2:
                     return {"error": "Need at least 2 players to find common teammates"}
 
-                # Build query to find common teammates
+                # Same query text with or without a team filter so Neo4j reuses one plan
                 query = """
                 // Find all players who played for the same teams as ALL specified players
                 MATCH (p1:Player)-[:PLAYS_FOR]->(t:Team)<-[:PLAYS_FOR]-(common:Player)
                 WHERE p1.name IN $players
-                """
+                  AND ($team IS NULL OR t.name = $team)
 
-                params = {"players": players}
-
-                if team:
-                    query += " AND t.name = $team"
-                    params["team"] = team
-
-                query += """
                 // Ensure the common player played with ALL specified players
                 WITH common, t, collect(DISTINCT p1.name) as connected_players
                 WHERE size(connected_players) = size($players)
@@ -101,7 +102,7 @@ class AnalysisTools:
                 ORDER BY teammate_name, team_name
                 """
 
-                result = await session.run(query, **params)
+                result = await session.run(query, players=players, team=team)
                 teammates = []
 
                 async for record in result:
@@ -158,8 +159,8 @@ class AnalysisTools:
                             match_stats[teammate] = []
                         match_stats[teammate].append({
                             "played_with": stats_record["played_with"],
-                            "matches_together": stats_record["matches_together"] or 0,
-                            "wins_together": stats_record["wins_together"] or 0
+                            "matches_together": stats_record["matches_together"],
+                            "wins_together": stats_record["wins_together"]
                         })
 
                     for teammate in teammates:
@@ -189,7 +190,7 @@ class AnalysisTools:
                 }
 
                 # Cache the result
-                self.cache[cache_key] = (response, datetime.now())
+                self.cache.set(cache_key, response)
                 return response
 
         except Exception as e:
@@ -203,16 +204,15 @@ class AnalysisTools:
                                years: int = 10) -> Dict[str, Any]:
         """Get detailed rivalry statistics and history"""
 
-        cache_key = f"rivalry_stats_{team1}_{team2}_{years}"
+        cache_key = ("rivalry_stats", team1, team2, years)
 
         # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if datetime.now() - timestamp < self.cache_ttl:
-                return cached_data
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            async with self.driver.session() as session:
+            async with self._read_session() as session:
                 # Calculate date range
                 end_date = datetime.now()
                 start_date = end_date.replace(year=end_date.year - years)
@@ -234,8 +234,8 @@ class AnalysisTools:
                 RETURN m.date as date,
                        m.home_team as home_team,
                        m.away_team as away_team,
-                       m.home_score as home_score,
-                       m.away_score as away_score,
+                       COALESCE(m.home_score, 0) as home_score,
+                       COALESCE(m.away_score, 0) as away_score,
                        m.venue as venue,
                        m.attendance as attendance,
                        c.name as competition,
@@ -268,8 +268,8 @@ class AnalysisTools:
                 async for record in result:
                     home_team = record["home_team"]
                     away_team = record["away_team"]
-                    home_score = record["home_score"] or 0
-                    away_score = record["away_score"] or 0
+                    home_score = record["home_score"]
+                    away_score = record["away_score"]
 
                     total_goals += home_score + away_score
                     if record["attendance"]:
@@ -434,7 +434,7 @@ class AnalysisTools:
                 }
 
                 # Cache the result
-                self.cache[cache_key] = (response, datetime.now())
+                self.cache.set(cache_key, response)
                 return response
 
         except Exception as e:
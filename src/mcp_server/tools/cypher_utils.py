@@ -0,0 +1,27 @@
+"""
+Brazilian Soccer MCP Knowledge Graph - Cypher Query Helpers
+
+CONTEXT:
+This module holds query-building helpers shared by the MCP tool modules of the
+Brazilian Soccer Knowledge Graph MCP server.
+
+PHASE: 2/3 - Enhancement/Integration
+PURPOSE: MCP server implementation for Claude integration
+DATA SOURCES: None (pure string helpers)
+DEPENDENCIES: None
+
+TECHNICAL DETAILS:
+- Full-text: names are turned into Lucene queries for the player_fulltext and
+  team_fulltext indexes, with Lucene syntax characters escaped
+"""
+
+import re
+from typing import Final
+
+_LUCENE_SPECIAL: Final = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+
+def fulltext_query(name: str) -> str:
+    """Turn a free-text name into a Lucene query matching every term as a prefix"""
+    terms = [_LUCENE_SPECIAL.sub(r"\\\1", term) for term in name.split()]
+    return " AND ".join(f"{term}*" for term in terms)
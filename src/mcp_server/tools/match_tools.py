@@ -23,132 +23,411 @@ INTEGRATION:
 - Rate Limiting: Built-in for external APIs
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
-import json
+from typing import Any, Dict, Final, List, Optional, Tuple
+from datetime import datetime
+
+from neo4j import READ_ACCESS
+
+from ..cache import single_flight
+from ..config import Config
+from ..serialization import from_json, to_json_bytes
 
 logger = logging.getLogger(__name__)
 
+# Indexes the queries below rely on; created at server bootstrap (names match
+# src/graph/schema.py so IF NOT EXISTS is a no-op on a fully loaded graph).
+REQUIRED_INDEXES: Final = (
+    "CREATE INDEX competition_name_index IF NOT EXISTS FOR (c:Competition) ON (c.name)",
+    "CREATE INDEX competition_name_season IF NOT EXISTS FOR (c:Competition) ON (c.name, c.season)",
+    "CREATE INDEX match_id_index IF NOT EXISTS FOR (m:Match) ON (m.id)",
+    "CREATE INDEX match_date_teams IF NOT EXISTS FOR (m:Match) ON (m.date, m.home_team, m.away_team)",
+)
+
+# Event types counted towards per-player match stats
+_GOAL_EVENT_TYPES: Final = frozenset({"goal", "penalty"})
+_ASSIST_EVENT_TYPES: Final = frozenset({"assist"})
+_CARD_EVENT_TYPES: Final = frozenset({"yellow_card", "red_card", "card"})
+
+# Cypher is kept in module-level constants so the exact same text is sent on
+# every call and Neo4j can reuse its cached plan. Optional filters are
+# expressed as null-safe predicates on bind parameters instead of being
+# concatenated in, so callers always pass every parameter (None when unset).
+
+_MATCH_DETAILS_TAIL: Final[str] = """
+OPTIONAL MATCH (m)-[:PART_OF]->(c:Competition)
+OPTIONAL MATCH (p:Player)-[:PLAYED_IN]->(m)
+OPTIONAL MATCH (ht:Team {name: m.home_team})
+OPTIONAL MATCH (at:Team {name: m.away_team})
+WITH m, c, ht, at,
+     collect(DISTINCT {
+         player: p.name,
+         position: p.position,
+         team: CASE WHEN exists((p)-[:PLAYS_FOR]->(:Team {name: m.home_team}))
+                   THEN m.home_team ELSE m.away_team END
+     }) as player_stats
+OPTIONAL MATCH (e:Event)-[:OCCURRED_IN]->(m)
+WITH m, c, ht, at, player_stats, e
+ORDER BY e.minute
+RETURN m.id as match_id,
+       m.date as date,
+       m.home_team as home_team,
+       m.away_team as away_team,
+       m.home_score as home_score,
+       m.away_score as away_score,
+       m.venue as venue,
+       m.attendance as attendance,
+       m.referee as referee,
+       c.name as competition,
+       c.season as season,
+       ht.city as home_city,
+       at.city as away_city,
+       player_stats,
+       collect(CASE WHEN e IS NOT NULL THEN {
+           type: e.type,
+           minute: e.minute,
+           player: e.player,
+           team: e.team,
+           description: e.description
+       } END) as events
+"""
+
+_MATCH_DETAILS_BY_ID: Final[str] = "MATCH (m:Match {id: $match_id})\n" + _MATCH_DETAILS_TAIL
+
+_MATCH_DETAILS_BY_TEAMS: Final[str] = """
+MATCH (m:Match)
+WHERE ((m.home_team = $team1 AND m.away_team = $team2) OR
+       (m.home_team = $team2 AND m.away_team = $team1))
+  AND ($date IS NULL OR m.date = $date)
+WITH m
+ORDER BY m.date DESC
+LIMIT 1
+""" + _MATCH_DETAILS_TAIL
+
+_SEARCH_MATCHES_FILTER: Final[str] = """
+MATCH (m:Match)
+WHERE ($team IS NULL OR m.home_team = $team OR m.away_team = $team)
+  AND ($start_date IS NULL OR m.date >= $start_date)
+  AND ($end_date IS NULL OR m.date <= $end_date)
+OPTIONAL MATCH (m)-[:PART_OF]->(comp:Competition)
+WITH m, comp
+WHERE $competition IS NULL OR comp.name = $competition
+"""
+
+_SEARCH_MATCHES: Final[str] = _SEARCH_MATCHES_FILTER + """RETURN m.id as match_id,
+       m.date as date,
+       m.home_team as home_team,
+       m.away_team as away_team,
+       m.home_score as home_score,
+       m.away_score as away_score,
+       m.venue as venue,
+       comp.name as competition
+ORDER BY m.date DESC
+LIMIT $limit
+"""
+
+# Fields a caller may project from search_matches; only these expressions are
+# ever interpolated into the RETURN clause
+_SEARCH_FIELDS: Final[Dict[str, str]] = {
+    "id": "m.id",
+    "date": "m.date",
+    "home_team": "m.home_team",
+    "away_team": "m.away_team",
+    "home_score": "m.home_score",
+    "away_score": "m.away_score",
+    "venue": "m.venue",
+    "competition": "comp.name",
+}
+
+
+def _search_matches_projection(fields: List[str]) -> str:
+    """Build the search_matches query returning only the given whitelisted fields"""
+    columns = ", ".join(f"{_SEARCH_FIELDS[field]} as {field}" for field in fields)
+    return _SEARCH_MATCHES_FILTER + f"RETURN {columns}\nORDER BY m.date DESC\nLIMIT $limit\n"
+
+# Scores every match from team1's perspective and aggregates the overall
+# record and per-competition breakdown server-side. Takes a list of
+# [team1, team2] pairs so several rivalries are resolved in one round-trip;
+# pairs that never met produce no row.
+_HEAD_TO_HEAD: Final[str] = """
+UNWIND $pairs AS pair
+MATCH (m:Match)
+WHERE (m.home_team = pair[0] AND m.away_team = pair[1]) OR
+      (m.home_team = pair[1] AND m.away_team = pair[0])
+OPTIONAL MATCH (m)-[:PART_OF]->(comp:Competition)
+WITH pair, m, comp
+WHERE $competition IS NULL OR comp.name = $competition
+WITH pair, m, comp,
+     coalesce(m.home_score, 0) as home_score,
+     coalesce(m.away_score, 0) as away_score
+WITH pair, m, comp, home_score, away_score,
+     CASE WHEN m.home_team = pair[0] THEN home_score ELSE away_score END as team1_score,
+     CASE WHEN m.home_team = pair[0] THEN away_score ELSE home_score END as team2_score
+WITH pair, m, comp, home_score, away_score, team1_score, team2_score,
+     CASE WHEN team1_score > team2_score THEN 'win'
+          WHEN team2_score > team1_score THEN 'loss'
+          ELSE 'draw' END as result_for_team1
+ORDER BY m.date DESC
+WITH pair,
+     collect({
+         date: m.date,
+         home_team: m.home_team,
+         away_team: m.away_team,
+         score: toString(home_score) + '-' + toString(away_score),
+         venue: m.venue,
+         competition: comp.name,
+         season: comp.season,
+         result_for_team1: result_for_team1
+     }) as matches,
+     collect(DISTINCT coalesce(comp.name, 'Unknown')) as competition_names,
+     count(m) as total_matches,
+     sum(CASE WHEN result_for_team1 = 'win' THEN 1 ELSE 0 END) as team1_wins,
+     sum(CASE WHEN result_for_team1 = 'loss' THEN 1 ELSE 0 END) as team2_wins,
+     sum(CASE WHEN result_for_team1 = 'draw' THEN 1 ELSE 0 END) as draws,
+     sum(team1_score) as team1_goals,
+     sum(team2_score) as team2_goals
+RETURN pair, matches, total_matches, team1_wins, team2_wins, draws,
+       team1_goals, team2_goals,
+       [name IN competition_names | {
+           competition: name,
+           matches: size([x IN matches WHERE coalesce(x.competition, 'Unknown') = name]),
+           team1_wins: size([x IN matches WHERE coalesce(x.competition, 'Unknown') = name
+                                           AND x.result_for_team1 = 'win']),
+           team2_wins: size([x IN matches WHERE coalesce(x.competition, 'Unknown') = name
+                                           AND x.result_for_team1 = 'loss']),
+           draws: size([x IN matches WHERE coalesce(x.competition, 'Unknown') = name
+                                      AND x.result_for_team1 = 'draw'])
+       }] as by_competition
+"""
+
+_STANDINGS: Final[str] = """
+MATCH (c:Competition {name: $competition})
+WHERE $season IS NULL OR c.season = $season
+MATCH (m:Match)-[:PART_OF]->(c)
+MATCH (t:Team)-[:PARTICIPATED_IN]->(m)
+WITH t.name as team,
+     count(m) as matches_played,
+     sum(CASE WHEN (m.home_team = t.name AND m.home_score > m.away_score) OR
+                   (m.away_team = t.name AND m.away_score > m.home_score) THEN 1 ELSE 0 END) as wins,
+     sum(CASE WHEN m.home_score = m.away_score THEN 1 ELSE 0 END) as draws,
+     sum(CASE WHEN (m.home_team = t.name AND m.home_score < m.away_score) OR
+                   (m.away_team = t.name AND m.away_score < m.home_score) THEN 1 ELSE 0 END) as losses,
+     sum(CASE WHEN m.home_team = t.name THEN m.home_score ELSE m.away_score END) as goals_for,
+     sum(CASE WHEN m.home_team = t.name THEN m.away_score ELSE m.home_score END) as goals_against
+WITH team, matches_played, wins, draws, losses, goals_for, goals_against,
+     wins * 3 + draws as points,
+     goals_for - goals_against as goal_difference
+ORDER BY points DESC, goal_difference DESC, goals_for DESC
+WITH collect({
+         team: team,
+         matches_played: matches_played,
+         wins: wins,
+         draws: draws,
+         losses: losses,
+         goals_for: goals_for,
+         goals_against: goals_against,
+         goal_difference: goal_difference,
+         points: points
+     }) as rows
+UNWIND range(0, size(rows) - 1) as i
+WITH rows[i] as row, i
+RETURN row {.*, position: i + 1} as team_data
+"""
+
+# Default number of rows returned (and warmed) by get_competition_top_scorers
+_TOP_SCORERS_LIMIT: Final = 10
+
+_TOP_SCORERS: Final[str] = """
+MATCH (c:Competition {name: $competition})
+WHERE $season IS NULL OR c.season = $season
+MATCH (m:Match)-[:PART_OF]->(c)
+MATCH (p:Player)-[:PLAYED_IN]->(m)
+MATCH (p)-[:PLAYS_FOR]->(t:Team)
+WITH p.name as player,
+     p.position as position,
+     t.name as team,
+     sum(m.goals_for) as goals,
+     sum(m.assists) as assists,
+     count(DISTINCT m) as matches_played
+ORDER BY goals DESC, assists DESC
+LIMIT $limit
+RETURN player, position, team, goals, assists, matches_played,
+       round(toFloat(goals) / matches_played, 2) as goals_per_match
+"""
+
+_MATCHES_BY_DATE: Final[str] = """
+MATCH (m:Match)
+WHERE m.date >= $start_date AND m.date <= $end_date
+OPTIONAL MATCH (m)-[:PART_OF]->(c:Competition)
+RETURN m.id as match_id,
+       toString(m.date) as date,
+       m.home_team as home_team,
+       m.away_team as away_team,
+       m.home_score as home_score,
+       m.away_score as away_score,
+       c.name as competition
+ORDER BY m.date DESC
+LIMIT $limit
+"""
+
+_COMPETITION_INFO: Final[str] = """
+MATCH (c:Competition)
+WHERE c.id = $competition_id OR c.name = $comp_name OR toLower(c.name) CONTAINS toLower($competition_id)
+OPTIONAL MATCH (c)<-[:PART_OF]-(m:Match)
+OPTIONAL MATCH (m)<-[:HOME_TEAM|AWAY_TEAM]-(t:Team)
+RETURN c.name as name,
+       c.season as season,
+       c.type as type,
+       count(DISTINCT m) as total_matches,
+       count(DISTINCT t) as total_teams,
+       collect(DISTINCT t.name)[..5] as sample_teams
+"""
+
+
 class MatchTools:
     """Match-specific MCP tools"""
 
-    def __init__(self, driver, cache):
+    def __init__(self, driver, cache, database: str = Config.NEO4J_DATABASE, redis=None):
         self.driver = driver
         self.cache = cache
-        self.cache_ttl = timedelta(minutes=30)
+        self.redis = redis  # Optional redis.asyncio client used as a shared L2 cache
+        # Seconds; entry age is measured on time.monotonic() by the shared TTLCache
+        self.cache_ttl = 1800.0
+        self._database = database
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+    def _read_session(self):
+        """Open a read-only session on the configured database"""
+        # Naming the database skips the driver's home-database lookup; every
+        # caller reads the full (LIMIT-bounded) result, so pull it in one batch
+        return self.driver.session(database=self._database,
+                                   default_access_mode=READ_ACCESS,
+                                   fetch_size=-1)
+
+    @staticmethod
+    def _redis_key(cache_key: tuple) -> str:
+        """Build the Redis key for an L1 cache key"""
+        return f"{Config.SERVER_NAME}:match_tools:{cache_key!r}"
+
+    async def _cache_get(self, cache_key: tuple) -> Optional[Any]:
+        """Look up a cached response in the local cache, then in Redis"""
+        cached = self.cache.get(cache_key)
+        if cached is not None or self.redis is None:
+            return cached
 
+        try:
+            raw = await self.redis.get(self._redis_key(cache_key))
+        except Exception as e:
+            logger.warning(f"Redis cache read failed: {e}")
+            return None
+
+        if raw is None:
+            return None
+        cached = from_json(raw)
+        self.cache[cache_key] = cached
+        return cached
+
+    async def _cache_set(self, cache_key: tuple, response: Dict[str, Any], rows: int = 0) -> None:
+        """Store a response in the local cache and in Redis"""
+        # Very large result sets would pin memory and evict many small hot entries
+        if rows > Config.MAX_CACHED_ROWS:
+            logger.debug(f"Not caching {cache_key[0]} result with {rows} rows")
+            return
+
+        self.cache[cache_key] = response
+        if self.redis is None:
+            return
+
+        try:
+            await self.redis.setex(self._redis_key(cache_key), int(self.cache_ttl),
+                                   to_json_bytes(response))
+        except Exception as e:
+            logger.warning(f"Redis cache write failed: {e}")
+
+    async def warm(self, competitions: List[str],
+                   seasons: Optional[List[Optional[str]]] = None) -> None:
+        """Recompute and cache standings and top scorers for the given competitions"""
+        for competition in competitions:
+            for season in seasons or [None]:
+                # Independent aggregations; each fetch opens its own session
+                standings, top_scorers = await asyncio.gather(
+                    self._fetch_competition_standings(competition, season),
+                    self._fetch_competition_top_scorers(competition, season)
+                )
+                # Entries are only overwritten on success, so a failed refresh
+                # keeps serving the previous results until they expire
+                if "error" not in standings:
+                    await self._cache_set(self._standings_key(competition, season), standings)
+                if "error" not in top_scorers:
+                    await self._cache_set(self._top_scorers_key(competition, season), top_scorers)
+
+        logger.info(f"Warmed competition cache for {len(competitions)} competition(s)")
+
+    async def run_warm_loop(self, competitions: List[str],
+                            seasons: Optional[List[Optional[str]]] = None) -> None:
+        """Warm the competition cache now and refresh it shortly before entries expire"""
+        while True:
+            try:
+                await self.warm(competitions, seasons)
+            except Exception as e:
+                logger.error(f"Error warming competition cache: {e}")
+            await asyncio.sleep(max(self.cache_ttl - 60, 60))
+
+    @single_flight
     async def get_match_details(self, match_id: Optional[str] = None,
                                team1: Optional[str] = None,
                                team2: Optional[str] = None,
                                date: Optional[str] = None) -> Dict[str, Any]:
         """Get detailed information about a specific match"""
 
-        # Create cache key based on available parameters
-        cache_params = [match_id, team1, team2, date]
-        cache_key = f"match_details_{'_'.join(str(p) for p in cache_params if p)}"
+        cache_key = ("match_details", match_id, team1, team2, date)
 
         # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if datetime.now() - timestamp < self.cache_ttl:
-                return cached_data
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            async with self.driver.session() as session:
-                # Build query based on available parameters
+            async with self._read_session() as session:
                 if match_id:
-                    query = "MATCH (m:Match {id: $match_id})"
+                    query = _MATCH_DETAILS_BY_ID
                     params = {"match_id": match_id}
                 elif team1 and team2:
-                    query = """
-                    MATCH (m:Match)
-                    WHERE (m.home_team = $team1 AND m.away_team = $team2) OR
-                          (m.home_team = $team2 AND m.away_team = $team1)
-                    """
-                    params = {"team1": team1, "team2": team2}
-                    if date:
-                        query += " AND m.date = $date"
-                        params["date"] = date
-                    query += " ORDER BY m.date DESC LIMIT 1"
+                    query = _MATCH_DETAILS_BY_TEAMS
+                    params = {"team1": team1, "team2": team2, "date": date}
                 else:
                     return {"error": "Must provide either match_id or team1+team2"}
 
-                # Complete the query
-                query += """
-                OPTIONAL MATCH (m)-[:PART_OF]->(c:Competition)
-                OPTIONAL MATCH (p:Player)-[:PLAYED_IN]->(m)
-                OPTIONAL MATCH (ht:Team {name: m.home_team})
-                OPTIONAL MATCH (at:Team {name: m.away_team})
-                RETURN m.id as match_id,
-                       m.date as date,
-                       m.home_team as home_team,
-                       m.away_team as away_team,
-                       m.home_score as home_score,
-                       m.away_score as away_score,
-                       m.venue as venue,
-                       m.attendance as attendance,
-                       m.referee as referee,
-                       c.name as competition,
-                       c.season as season,
-                       ht.city as home_city,
-                       at.city as away_city,
-                       collect(DISTINCT {
-                           player: p.name,
-                           position: p.position,
-                           team: CASE WHEN exists((p)-[:PLAYS_FOR]->(:Team {name: m.home_team}))
-                                     THEN m.home_team ELSE m.away_team END,
-                           goals: 0,
-                           assists: 0,
-                           cards: []
-                       }) as player_stats
-                """
-
                 result = await session.run(query, **params)
                 record = await result.single()
 
                 if not record:
                     return {"error": "Match not found"}
 
-                # Get match events
-                events_query = """
-                MATCH (m:Match)
-                WHERE m.id = $match_id OR
-                      (m.home_team = $home_team AND m.away_team = $away_team AND m.date = $date)
-                OPTIONAL MATCH (e:Event)-[:OCCURRED_IN]->(m)
-                RETURN e.type as event_type,
-                       e.minute as minute,
-                       e.player as player,
-                       e.team as team,
-                       e.description as description
-                ORDER BY e.minute
-                """
-
-                events_params = {
-                    "match_id": record["match_id"],
-                    "home_team": record["home_team"],
-                    "away_team": record["away_team"],
-                    "date": record["date"]
-                }
-
-                events_result = await session.run(events_query, **events_params)
-                events = []
-
-                async for event_record in events_result:
-                    if event_record["event_type"]:
-                        events.append({
-                            "type": event_record["event_type"],
-                            "minute": event_record["minute"],
-                            "player": event_record["player"],
-                            "team": event_record["team"],
-                            "description": event_record["description"]
-                        })
+                # Derive goals/assists/cards per player from the match events
+                player_events: Dict[str, Dict[str, Any]] = {}
+                for event in record["events"]:
+                    player = event["player"]
+                    if not player:
+                        continue
+                    stats = player_events.setdefault(player, {"goals": 0, "assists": 0, "cards": []})
+                    event_type = (event["type"] or "").lower()
+                    if event_type in _GOAL_EVENT_TYPES:
+                        stats["goals"] += 1
+                    elif event_type in _ASSIST_EVENT_TYPES:
+                        stats["assists"] += 1
+                    elif event_type in _CARD_EVENT_TYPES:
+                        stats["cards"].append({"type": event["type"], "minute": event["minute"]})
 
                 # Process player stats
                 home_players = []
                 away_players = []
                 for player_stat in record["player_stats"]:
                     if player_stat["player"]:
+                        player_stat.update(
+                            player_events.get(player_stat["player"]) or {"goals": 0, "assists": 0, "cards": []}
+                        )
                         if player_stat["team"] == record["home_team"]:
                             home_players.append(player_stat)
                         else:
@@ -197,11 +476,11 @@ class MatchTools:
                         "home": home_players,
                         "away": away_players
                     },
-                    "events": events
+                    "events": record["events"]
                 }
 
                 # Cache the result
-                self.cache[cache_key] = (response, datetime.now())
+                await self._cache_set(cache_key, response)
                 return response
 
         except Exception as e:
@@ -210,79 +489,65 @@ class MatchTools:
                 "error": f"Failed to get match details: {str(e)}"
             }
 
+    @single_flight
     async def search_matches(self, team: Optional[str] = None,
                             start_date: Optional[str] = None,
                             end_date: Optional[str] = None,
                             competition: Optional[str] = None,
-                            limit: int = 20) -> Dict[str, Any]:
+                            limit: int = 20,
+                            fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """Search for matches by teams, date range, or competition"""
 
-        cache_key = f"search_matches_{team}_{start_date}_{end_date}_{competition}_{limit}"
+        if fields:
+            invalid = [field for field in fields if field not in _SEARCH_FIELDS]
+            if invalid:
+                return {
+                    "error": f"Unknown fields: {', '.join(invalid)}. Valid fields: {', '.join(_SEARCH_FIELDS)}",
+                    "matches": []
+                }
+
+        cache_key = ("search_matches", team, start_date, end_date, competition, limit,
+                     tuple(fields) if fields else None)
 
         # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if datetime.now() - timestamp < self.cache_ttl:
-                return cached_data
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            async with self.driver.session() as session:
-                # Build query
-                query = "MATCH (m:Match)"
-                where_conditions = []
-                params = {"limit": limit}
-
-                if team:
-                    where_conditions.append("(m.home_team = $team OR m.away_team = $team)")
-                    params["team"] = team
-
-                if start_date:
-                    where_conditions.append("m.date >= $start_date")
-                    params["start_date"] = start_date
-
-                if end_date:
-                    where_conditions.append("m.date <= $end_date")
-                    params["end_date"] = end_date
-
-                if competition:
-                    query += " MATCH (m)-[:PART_OF]->(c:Competition)"
-                    where_conditions.append("c.name = $competition")
-                    params["competition"] = competition
-
-                if where_conditions:
-                    query += " WHERE " + " AND ".join(where_conditions)
-
-                query += """
-                OPTIONAL MATCH (m)-[:PART_OF]->(comp:Competition)
-                RETURN m.id as match_id,
-                       m.date as date,
-                       m.home_team as home_team,
-                       m.away_team as away_team,
-                       m.home_score as home_score,
-                       m.away_score as away_score,
-                       m.venue as venue,
-                       comp.name as competition
-                ORDER BY m.date DESC
-                LIMIT $limit
-                """
-
-                result = await session.run(query, **params)
-                matches = []
+            async with self._read_session() as session:
+                result = await session.run(
+                    _search_matches_projection(fields) if fields else _SEARCH_MATCHES,
+                    team=team,
+                    start_date=start_date,
+                    end_date=end_date,
+                    competition=competition,
+                    limit=limit
+                )
 
-                async for record in result:
-                    match_data = {
-                        "id": record["match_id"],
-                        "date": record["date"],
-                        "home_team": record["home_team"],
-                        "away_team": record["away_team"],
-                        "score": f"{record['home_score']}-{record['away_score']}",
-                        "venue": record["venue"],
-                        "competition": record["competition"],
-                        "result": (record["home_team"] if record["home_score"] > record["away_score"]
-                                 else record["away_team"] if record["away_score"] > record["home_score"]
-                                 else "Draw")
-                    }
-                    matches.append(match_data)
+                if fields:
+                    # Projected rows are returned as-is with only the requested fields
+                    matches = await result.data()
+                else:
+                    # Rows are built straight from the record stream (one pass, no
+                    # intermediate list of dicts)
+                    matches = [
+                        {
+                            "id": record["match_id"],
+                            "date": record["date"],
+                            "home_team": record["home_team"],
+                            "away_team": record["away_team"],
+                            "score": f"{record['home_score']}-{record['away_score']}",
+                            "venue": record["venue"],
+                            "competition": record["competition"],
+                            "result": (
+                                record["home_team"] if record["home_score"] > record["away_score"]
+                                else record["away_team"] if record["away_score"] > record["home_score"]
+                                else "Draw"
+                            )
+                        }
+                        async for record in result
+                    ]
 
                 response = {
                     "search_criteria": {
@@ -295,7 +560,7 @@ class MatchTools:
                 }
 
                 # Cache the result
-                self.cache[cache_key] = (response, datetime.now())
+                await self._cache_set(cache_key, response, rows=len(matches))
                 return response
 
         except Exception as e:
@@ -305,227 +570,149 @@ class MatchTools:
                 "matches": []
             }
 
+    @single_flight
     async def get_head_to_head(self, team1: str, team2: str,
                               competition: Optional[str] = None) -> Dict[str, Any]:
         """Get head-to-head statistics between two teams"""
-
-        cache_key = f"head_to_head_{team1}_{team2}_{competition or 'all'}"
-
-        # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if datetime.now() - timestamp < self.cache_ttl:
-                return cached_data
-
-        try:
-            async with self.driver.session() as session:
-                # Get all matches between the teams
-                query = """
-                MATCH (m:Match)
-                WHERE (m.home_team = $team1 AND m.away_team = $team2) OR
-                      (m.home_team = $team2 AND m.away_team = $team1)
-                """
-
-                params = {"team1": team1, "team2": team2}
-
-                if competition:
-                    query += """
-                    MATCH (m)-[:PART_OF]->(c:Competition {name: $competition})
-                    """
-                    params["competition"] = competition
-
-                query += """
-                OPTIONAL MATCH (m)-[:PART_OF]->(comp:Competition)
-                RETURN m.date as date,
-                       m.home_team as home_team,
-                       m.away_team as away_team,
-                       m.home_score as home_score,
-                       m.away_score as away_score,
-                       m.venue as venue,
-                       comp.name as competition,
-                       comp.season as season
-                ORDER BY m.date DESC
-                """
-
-                result = await session.run(query, **params)
-                matches = []
-                team1_wins = 0
-                team2_wins = 0
-                draws = 0
-                team1_goals = 0
-                team2_goals = 0
-
-                async for record in result:
-                    home_team = record["home_team"]
-                    away_team = record["away_team"]
-                    home_score = record["home_score"] or 0
-                    away_score = record["away_score"] or 0
-
-                    # Determine result from team1's perspective
-                    if home_team == team1:
-                        team1_score = home_score
-                        team2_score = away_score
-                    else:
-                        team1_score = away_score
-                        team2_score = home_score
-
-                    team1_goals += team1_score
-                    team2_goals += team2_score
-
-                    if team1_score > team2_score:
-                        team1_wins += 1
-                        result_status = "win"
-                    elif team2_score > team1_score:
-                        team2_wins += 1
-                        result_status = "loss"
-                    else:
-                        draws += 1
-                        result_status = "draw"
-
-                    match_data = {
-                        "date": record["date"],
-                        "home_team": home_team,
-                        "away_team": away_team,
-                        "score": f"{home_score}-{away_score}",
-                        "venue": record["venue"],
-                        "competition": record["competition"],
-                        "season": record["season"],
-                        "result_for_team1": result_status
+        results = await self.get_head_to_head_batch([(team1, team2)], competition)
+        return results[0]
+
+    async def get_head_to_head_batch(self, pairs: List[Tuple[str, str]],
+                                     competition: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get head-to-head statistics for several team pairs in a single query"""
+
+        responses: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        missing = []
+        for team1, team2 in pairs:
+            cached = await self._cache_get(("head_to_head", team1, team2, competition))
+            if cached is not None:
+                responses[(team1, team2)] = cached
+            elif (team1, team2) not in missing:
+                missing.append((team1, team2))
+
+        if missing:
+            try:
+                async with self._read_session() as session:
+                    result = await session.run(
+                        _HEAD_TO_HEAD,
+                        pairs=[list(pair) for pair in missing],
+                        competition=competition
+                    )
+                    records = {tuple(record["pair"]): record for record in await result.data()}
+
+                for team1, team2 in missing:
+                    response = self._head_to_head_response(
+                        team1, team2, competition, records.get((team1, team2))
+                    )
+                    await self._cache_set(("head_to_head", team1, team2, competition), response,
+                                          rows=response["overall_record"]["total_matches"])
+                    responses[(team1, team2)] = response
+
+            except Exception as e:
+                logger.error(f"Error getting head-to-head: {e}")
+                for team1, team2 in missing:
+                    responses[(team1, team2)] = {
+                        "error": f"Failed to get head-to-head stats: {str(e)}",
+                        "teams": {"team1": team1, "team2": team2}
                     }
-                    matches.append(match_data)
-
-                total_matches = len(matches)
-
-                # Get recent form (last 10 matches)
-                recent_form = matches[:10]
-
-                # Calculate win percentages
-                team1_win_pct = (team1_wins / total_matches * 100) if total_matches > 0 else 0
-                team2_win_pct = (team2_wins / total_matches * 100) if total_matches > 0 else 0
-                draw_pct = (draws / total_matches * 100) if total_matches > 0 else 0
-
-                # Get competition breakdown
-                competitions = {}
-                for match in matches:
-                    comp = match["competition"] or "Unknown"
-                    if comp not in competitions:
-                        competitions[comp] = {"matches": 0, "team1_wins": 0, "team2_wins": 0, "draws": 0}
-                    competitions[comp]["matches"] += 1
-                    if match["result_for_team1"] == "win":
-                        competitions[comp]["team1_wins"] += 1
-                    elif match["result_for_team1"] == "loss":
-                        competitions[comp]["team2_wins"] += 1
-                    else:
-                        competitions[comp]["draws"] += 1
-
-                response = {
-                    "teams": {
-                        "team1": team1,
-                        "team2": team2
-                    },
-                    "competition_filter": competition,
-                    "overall_record": {
-                        "total_matches": total_matches,
-                        "team1_wins": team1_wins,
-                        "team2_wins": team2_wins,
-                        "draws": draws,
-                        "team1_win_percentage": round(team1_win_pct, 2),
-                        "team2_win_percentage": round(team2_win_pct, 2),
-                        "draw_percentage": round(draw_pct, 2)
-                    },
-                    "goals": {
-                        "team1_total": team1_goals,
-                        "team2_total": team2_goals,
-                        "team1_average": round(team1_goals / total_matches, 2) if total_matches > 0 else 0,
-                        "team2_average": round(team2_goals / total_matches, 2) if total_matches > 0 else 0
-                    },
-                    "recent_form": recent_form,
-                    "by_competition": competitions,
-                    "all_matches": matches
-                }
-
-                # Cache the result
-                self.cache[cache_key] = (response, datetime.now())
-                return response
 
-        except Exception as e:
-            logger.error(f"Error getting head-to-head: {e}")
-            return {
-                "error": f"Failed to get head-to-head stats: {str(e)}",
-                "teams": {"team1": team1, "team2": team2}
+        return [responses[(team1, team2)] for team1, team2 in pairs]
+
+    @staticmethod
+    def _head_to_head_response(team1: str, team2: str, competition: Optional[str],
+                               record: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the head-to-head response for one pair from its aggregated row"""
+        record = record or {}
+        matches = record.get("matches", [])
+        total_matches = record.get("total_matches", 0)
+        team1_wins = record.get("team1_wins", 0)
+        team2_wins = record.get("team2_wins", 0)
+        draws = record.get("draws", 0)
+        team1_goals = record.get("team1_goals", 0)
+        team2_goals = record.get("team2_goals", 0)
+
+        # Get recent form (last 10 matches)
+        recent_form = matches[:10]
+
+        # Calculate win percentages
+        team1_win_pct = (team1_wins / total_matches * 100) if total_matches > 0 else 0
+        team2_win_pct = (team2_wins / total_matches * 100) if total_matches > 0 else 0
+        draw_pct = (draws / total_matches * 100) if total_matches > 0 else 0
+
+        competitions = {
+            row["competition"]: {
+                "matches": row["matches"],
+                "team1_wins": row["team1_wins"],
+                "team2_wins": row["team2_wins"],
+                "draws": row["draws"]
             }
-
+            for row in record.get("by_competition", [])
+        }
+
+        return {
+            "teams": {
+                "team1": team1,
+                "team2": team2
+            },
+            "competition_filter": competition,
+            "overall_record": {
+                "total_matches": total_matches,
+                "team1_wins": team1_wins,
+                "team2_wins": team2_wins,
+                "draws": draws,
+                "team1_win_percentage": round(team1_win_pct, 2),
+                "team2_win_percentage": round(team2_win_pct, 2),
+                "draw_percentage": round(draw_pct, 2)
+            },
+            "goals": {
+                "team1_total": team1_goals,
+                "team2_total": team2_goals,
+                "team1_average": round(team1_goals / total_matches, 2) if total_matches > 0 else 0,
+                "team2_average": round(team2_goals / total_matches, 2) if total_matches > 0 else 0
+            },
+            "recent_form": recent_form,
+            "by_competition": competitions,
+            "all_matches": matches
+        }
+
+    @staticmethod
+    def _standings_key(competition: str, season: Optional[str]) -> tuple:
+        """Cache key of get_competition_standings"""
+        return ("competition_standings", competition, season)
+
+    @staticmethod
+    def _top_scorers_key(competition: str, season: Optional[str],
+                         limit: int = _TOP_SCORERS_LIMIT) -> tuple:
+        """Cache key of get_competition_top_scorers"""
+        return ("competition_top_scorers", competition, season, limit)
+
+    @single_flight
     async def get_competition_standings(self, competition: str,
                                        season: Optional[str] = None) -> Dict[str, Any]:
         """Get current standings for a competition"""
 
-        cache_key = f"competition_standings_{competition}_{season or 'current'}"
+        cache_key = self._standings_key(competition, season)
 
         # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if datetime.now() - timestamp < self.cache_ttl:
-                return cached_data
-
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await self._fetch_competition_standings(competition, season)
+        if "error" not in response:
+            await self._cache_set(cache_key, response)
+        return response
+
+    async def _fetch_competition_standings(self, competition: str,
+                                           season: Optional[str]) -> Dict[str, Any]:
+        """Query the standings for a competition, bypassing the cache"""
         try:
-            async with self.driver.session() as session:
-                # Get standings data
-                query = """
-                MATCH (c:Competition {name: $competition})
-                """
-
-                params = {"competition": competition}
-
-                if season:
-                    query += " WHERE c.season = $season"
-                    params["season"] = season
-
-                query += """
-                MATCH (m:Match)-[:PART_OF]->(c)
-                MATCH (t:Team)-[:PARTICIPATED_IN]->(m)
-                RETURN t.name as team,
-                       count(m) as matches_played,
-                       sum(CASE WHEN (m.home_team = t.name AND m.home_score > m.away_score) OR
-                                     (m.away_team = t.name AND m.away_score > m.home_score) THEN 1 ELSE 0 END) as wins,
-                       sum(CASE WHEN m.home_score = m.away_score THEN 1 ELSE 0 END) as draws,
-                       sum(CASE WHEN (m.home_team = t.name AND m.home_score < m.away_score) OR
-                                     (m.away_team = t.name AND m.away_score < m.home_score) THEN 1 ELSE 0 END) as losses,
-                       sum(CASE WHEN m.home_team = t.name THEN m.home_score ELSE m.away_score END) as goals_for,
-                       sum(CASE WHEN m.home_team = t.name THEN m.away_score ELSE m.home_score END) as goals_against
-                ORDER BY (wins * 3 + draws) DESC, (goals_for - goals_against) DESC, goals_for DESC
-                """
-
-                result = await session.run(query, **params)
-                standings = []
-                position = 1
+            async with self._read_session() as session:
+                result = await session.run(_STANDINGS, competition=competition, season=season)
+                # Points, goal difference and position are computed by the query
+                standings = [record["team_data"] for record in await result.data()]
 
-                async for record in result:
-                    wins = record["wins"] or 0
-                    draws = record["draws"] or 0
-                    losses = record["losses"] or 0
-                    goals_for = record["goals_for"] or 0
-                    goals_against = record["goals_against"] or 0
-                    matches_played = record["matches_played"] or 0
-
-                    points = wins * 3 + draws
-                    goal_difference = goals_for - goals_against
-
-                    team_data = {
-                        "position": position,
-                        "team": record["team"],
-                        "matches_played": matches_played,
-                        "wins": wins,
-                        "draws": draws,
-                        "losses": losses,
-                        "goals_for": goals_for,
-                        "goals_against": goals_against,
-                        "goal_difference": goal_difference,
-                        "points": points
-                    }
-                    standings.append(team_data)
-                    position += 1
-
-                response = {
+                return {
                     "competition": {
                         "name": competition,
                         "season": season or "current"
@@ -534,10 +721,6 @@ class MatchTools:
                     "standings": standings
                 }
 
-                # Cache the result
-                self.cache[cache_key] = (response, datetime.now())
-                return response
-
         except Exception as e:
             logger.error(f"Error getting competition standings: {e}")
             return {
@@ -545,65 +728,46 @@ class MatchTools:
                 "competition": competition
             }
 
+    @single_flight
     async def get_competition_top_scorers(self, competition: str,
                                          season: Optional[str] = None,
-                                         limit: int = 10) -> Dict[str, Any]:
+                                         limit: int = _TOP_SCORERS_LIMIT) -> Dict[str, Any]:
         """Get top scorers for a competition"""
 
-        cache_key = f"competition_top_scorers_{competition}_{season or 'current'}_{limit}"
+        cache_key = self._top_scorers_key(competition, season, limit)
 
         # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if datetime.now() - timestamp < self.cache_ttl:
-                return cached_data
-
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await self._fetch_competition_top_scorers(competition, season, limit)
+        if "error" not in response:
+            await self._cache_set(cache_key, response)
+        return response
+
+    async def _fetch_competition_top_scorers(self, competition: str, season: Optional[str],
+                                             limit: int = _TOP_SCORERS_LIMIT) -> Dict[str, Any]:
+        """Query the top scorers for a competition, bypassing the cache"""
         try:
-            async with self.driver.session() as session:
-                # Get top scorers
-                query = """
-                MATCH (c:Competition {name: $competition})
-                """
-
-                params = {"competition": competition, "limit": limit}
-
-                if season:
-                    query += " WHERE c.season = $season"
-                    params["season"] = season
-
-                query += """
-                MATCH (m:Match)-[:PART_OF]->(c)
-                MATCH (p:Player)-[:PLAYED_IN]->(m)
-                MATCH (p)-[:PLAYS_FOR]->(t:Team)
-                RETURN p.name as player,
-                       p.position as position,
-                       t.name as team,
-                       sum(CASE WHEN m.goals_for IS NOT NULL THEN m.goals_for ELSE 0 END) as goals,
-                       sum(CASE WHEN m.assists IS NOT NULL THEN m.assists ELSE 0 END) as assists,
-                       count(DISTINCT m) as matches_played
-                ORDER BY goals DESC, assists DESC
-                LIMIT $limit
-                """
-
-                result = await session.run(query, **params)
+            async with self._read_session() as session:
+                result = await session.run(
+                    _TOP_SCORERS, competition=competition, season=season, limit=limit
+                )
                 top_scorers = []
-                position = 1
-
                 async for record in result:
-                    scorer_data = {
-                        "position": position,
+                    top_scorers.append({
+                        "position": len(top_scorers) + 1,
                         "player": record["player"],
                         "team": record["team"],
                         "player_position": record["position"],
-                        "goals": record["goals"] or 0,
-                        "assists": record["assists"] or 0,
-                        "matches_played": record["matches_played"] or 0,
-                        "goals_per_match": round((record["goals"] or 0) / max(record["matches_played"] or 1, 1), 2)
-                    }
-                    top_scorers.append(scorer_data)
-                    position += 1
+                        "goals": record["goals"],
+                        "assists": record["assists"],
+                        "matches_played": record["matches_played"],
+                        "goals_per_match": record["goals_per_match"]
+                    })
 
-                response = {
+                return {
                     "competition": {
                         "name": competition,
                         "season": season or "current"
@@ -612,54 +776,25 @@ class MatchTools:
                     "top_scorers": top_scorers
                 }
 
-                # Cache the result
-                self.cache[cache_key] = (response, datetime.now())
-                return response
-
         except Exception as e:
             logger.error(f"Error getting top scorers: {e}")
             return {
                 "error": f"Failed to get top scorers: {str(e)}",
                 "competition": competition
             }
+
     async def search_matches_by_date(self, start_date: str, end_date: str, limit: int = 50) -> Dict[str, Any]:
         """Search for matches within a date range."""
         try:
-            query = """
-                MATCH (m:Match)
-                WHERE m.date >= $start_date AND m.date <= $end_date
-                OPTIONAL MATCH (m)-[:PART_OF]->(c:Competition)
-                RETURN m.id as match_id,
-                       m.date as date,
-                       m.home_team as home_team,
-                       m.away_team as away_team,
-                       m.home_score as home_score,
-                       m.away_score as away_score,
-                       c.name as competition
-                ORDER BY m.date DESC
-                LIMIT $limit
-                """
-
-            async with self.driver.session() as session:
+            async with self._read_session() as session:
                 result = await session.run(
-                    query,
+                    _MATCHES_BY_DATE,
                     start_date=start_date,
                     end_date=end_date,
                     limit=limit
                 )
-                records = [record async for record in result]
-
-                matches = []
-                for record in records:
-                    matches.append({
-                        "match_id": record["match_id"],
-                        "date": str(record["date"]) if record["date"] else None,
-                        "home_team": record["home_team"],
-                        "away_team": record["away_team"],
-                        "home_score": record["home_score"],
-                        "away_score": record["away_score"],
-                        "competition": record["competition"]
-                    })
+                # Rows already carry the response field names; date is stringified in Cypher
+                matches = await result.data()
 
                 return {
                     "start_date": start_date,
@@ -683,22 +818,9 @@ class MatchTools:
             # Handle both ID and name
             comp_name = competition_id.replace("comp_", "Competition ")
 
-            query = """
-                MATCH (c:Competition)
-                WHERE c.id = $competition_id OR c.name = $comp_name OR toLower(c.name) CONTAINS toLower($competition_id)
-                OPTIONAL MATCH (c)<-[:PART_OF]-(m:Match)
-                OPTIONAL MATCH (m)<-[:HOME_TEAM|AWAY_TEAM]-(t:Team)
-                RETURN c.name as name,
-                       c.season as season,
-                       c.type as type,
-                       count(DISTINCT m) as total_matches,
-                       count(DISTINCT t) as total_teams,
-                       collect(DISTINCT t.name)[..5] as sample_teams
-                """
-
-            async with self.driver.session() as session:
+            async with self._read_session() as session:
                 result = await session.run(
-                    query,
+                    _COMPETITION_INFO,
                     competition_id=competition_id,
                     comp_name=comp_name
                 )
@@ -23,70 +23,403 @@ INTEGRATION:
 - Rate Limiting: Built-in for external APIs
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
-import json
+from typing import Any, Dict, Final, List, Optional, Tuple, TypedDict
+
+from neo4j import AsyncResult, RoutingControl
+
+from ..cache import TTLCache
+from ..config import Config
+from .cypher_utils import fulltext_query
 
 logger = logging.getLogger(__name__)
 
+# Indexes the player lookups rely on; created at server bootstrap (names match
+# src/graph/schema.py). Exact-name lookups seek player_name_index; the TEXT
+# index serves CONTAINS substring matches on p.name.
+REQUIRED_INDEXES: Final = (
+    "CREATE INDEX player_name_index IF NOT EXISTS FOR (p:Player) ON (p.name)",
+    "CREATE INDEX player_id_index IF NOT EXISTS FOR (p:Player) ON (p.id)",
+    "CREATE INDEX player_position_index IF NOT EXISTS FOR (p:Player) ON (p.position)",
+    "CREATE TEXT INDEX player_name_text IF NOT EXISTS FOR (p:Player) ON (p.name)",
+    "CREATE FULLTEXT INDEX player_fulltext IF NOT EXISTS FOR (p:Player) ON EACH [p.name]",
+    "CREATE INDEX name_trigram_index IF NOT EXISTS FOR (g:NameTrigram) ON (g.gram)",
+    "CREATE INDEX match_result_index IF NOT EXISTS FOR (m:Match) ON (m.result)",
+    "CREATE INDEX competition_type_index IF NOT EXISTS FOR (c:Competition) ON (c.type)",
+)
+
+# Name search probes the Lucene full-text index instead of scanning every
+# Player with toLower(p.name) CONTAINS ...; matching is case-insensitive.
+# Team lists in list/search rows are sliced server-side ([..10]) to bound
+# the per-row payload; stats keep at most 20 competition names.
+# queryNodes yields hits by descending score, so the limit is applied straight
+# away (no Sort) and teams are only looked up for the rows returned.
+_SEARCH_PLAYER: Final[str] = """
+CALL db.index.fulltext.queryNodes('player_fulltext', $query) YIELD node AS p
+WITH p
+LIMIT $limit
+RETURN p.name as name,
+       p.position as position,
+       p.birth_date as birth_date,
+       p.nationality as nationality,
+       COLLECT { MATCH (p)-[:PLAYS_FOR]->(t:Team) RETURN DISTINCT t.name LIMIT 10 } as current_teams
+"""
+
+# Rows are returned with the response field names (birth_date already a
+# string) so they can be passed through without rebuilding. Positions are
+# matched against the stored casings of the requested value (see
+# _position_variants) so player_position_index can be seeked; wrapping
+# p.position in toLower() would force a scan of every Player.
+_PLAYERS_BY_POSITION: Final[str] = """
+MATCH (p:Player)
+WHERE p.position IN $positions
+OPTIONAL MATCH (p)-[:PLAYS_FOR]->(t:Team)
+RETURN p.name as name,
+       p.position as position,
+       toString(p.birth_date) as birth_date,
+       p.nationality as nationality,
+       collect(DISTINCT t.name)[..10] as teams
+ORDER BY name
+LIMIT $limit
+"""
+
+# Substring fallback for terms the full-text prefix match misses (e.g. "eyma").
+# Name trigrams are materialized at ingest (GraphBuilder.create_player_name_trigrams),
+# so candidates come from name_trigram_index seeks; CONTAINS only re-checks
+# players that share every trigram of the search term. Graphs loaded before
+# trigrams existed have none, and fall back to _SEARCH_PLAYER_CONTAINS.
+_SEARCH_PLAYER_SUBSTRING: Final[str] = """
+UNWIND $trigrams AS gram
+MATCH (:NameTrigram {gram: gram})<-[:HAS_TRIGRAM]-(p:Player)
+WITH p, count(DISTINCT gram) as hits
+WHERE hits = size($trigrams) AND toLower(p.name) CONTAINS $name
+OPTIONAL MATCH (p)-[:PLAYS_FOR]->(t:Team)
+WITH p, collect(DISTINCT t.name)[..10] as current_teams
+RETURN p.name as name,
+       p.position as position,
+       p.birth_date as birth_date,
+       p.nationality as nationality,
+       current_teams
+ORDER BY name
+LIMIT $limit
+"""
+
+# Label count lookup; answered from the count store without touching nodes
+_HAS_TRIGRAMS: Final[str] = "MATCH (g:NameTrigram) RETURN count(g) > 0 as loaded"
+
+# Substring scan over every Player, for graphs without NameTrigram nodes
+_SEARCH_PLAYER_CONTAINS: Final[str] = """
+MATCH (p:Player)
+WHERE toLower(p.name) CONTAINS $name
+OPTIONAL MATCH (p)-[:PLAYS_FOR]->(t:Team)
+WITH p, collect(DISTINCT t.name)[..10] as current_teams
+RETURN p.name as name,
+       p.position as position,
+       p.birth_date as birth_date,
+       p.nationality as nationality,
+       current_teams
+ORDER BY name
+LIMIT $limit
+"""
+
+# Blank search terms list players alphabetically, as the substring match did
+_LIST_PLAYERS: Final[str] = """
+MATCH (p:Player)
+OPTIONAL MATCH (p)-[:PLAYS_FOR]->(t:Team)
+WITH p, collect(DISTINCT t.name)[..10] as current_teams
+RETURN p.name as name,
+       p.position as position,
+       p.birth_date as birth_date,
+       p.nationality as nationality,
+       current_teams
+ORDER BY name
+LIMIT $limit
+"""
+
+def _position_variants(position: str) -> List[str]:
+    """Casings a position may be stored with (e.g. "fwd" -> FWD, fwd, Fwd)"""
+    position = position.strip()
+    return list(dict.fromkeys((position, position.upper(), position.lower(), position.title())))
+
+
+def _name_trigrams(name: str) -> List[str]:
+    """Distinct lowercase 3-grams of name, as stored on NameTrigram nodes"""
+    return list(dict.fromkeys(name[i:i + 3] for i in range(len(name) - 2)))
+
+
+class PlayerInfo(TypedDict):
+    """Player attributes in a get_player_stats response"""
+    name: str
+    position: Optional[str]
+    birth_date: Any
+    nationality: Optional[str]
+    height: Optional[float]
+    weight: Optional[float]
+
+
+class PlayerStatistics(TypedDict):
+    """Aggregated match statistics for a player"""
+    matches_played: int
+    goals: int
+    assists: int
+    yellow_cards: int
+    red_cards: int
+    competitions: List[str]
+
+
+class TeamEntry(TypedDict):
+    """One PLAYS_FOR spell in a player's team history"""
+    team: str
+    start_date: Any
+    end_date: Any
+    jersey_number: Optional[int]
+
+
+class PlayerStatsResponse(TypedDict):
+    """Response of get_player_stats"""
+    player: PlayerInfo
+    statistics: PlayerStatistics
+    teams: List[TeamEntry]
+    season: str
+
+
+# Player info, season statistics and team history in one round-trip. Each
+# CALL subquery aggregates independently so the stats rows do not multiply the
+# team rows; $season is always passed (None for all time) to keep one plan.
+# sum() skips nulls and yields 0 when nothing is summed. The nested maps are
+# built by the query in the PlayerInfo / PlayerStatistics / TeamEntry shapes.
+_PLAYER_STATS: Final[str] = """
+MATCH (p:Player {name: $player_name})
+CALL {
+    WITH p
+    OPTIONAL MATCH (p)-[:PLAYED_IN]->(m:Match)
+    WHERE $season IS NULL OR m.season = $season
+    OPTIONAL MATCH (m)-[:PART_OF]->(c:Competition)
+    RETURN {
+               matches_played: count(m),
+               goals: sum(m.goals_for),
+               assists: sum(m.assists),
+               yellow_cards: sum(m.yellow_cards),
+               red_cards: sum(m.red_cards),
+               competitions: collect(DISTINCT c.name)[..20]
+           } as statistics
+}
+CALL {
+    WITH p
+    OPTIONAL MATCH (p)-[r:PLAYS_FOR]->(t:Team)
+    WITH t, r
+    ORDER BY r.start_date DESC
+    RETURN collect(CASE WHEN t IS NOT NULL THEN {
+               team: t.name,
+               start_date: r.start_date,
+               end_date: r.end_date,
+               jersey_number: r.jersey_number
+           } END) as teams
+}
+RETURN p {.name, .position, .birth_date, .nationality, .height, .weight} as player,
+       statistics,
+       teams
+"""
+
+# Player summaries for compare_players / compare_players_batch: every player
+# id in the batch is resolved in one UNWIND instead of one query per player.
+# The exact name lookup seeks player_name_index; ids it did not find are
+# tried as a Player.id (player_id_index) and then as a full-text name query,
+# like search_player, so no step scans every Player.
+# Goals and teams are read with COUNT {} / COLLECT {} subqueries rather than
+# two OPTIONAL MATCHes, whose rows multiply before the aggregation
+_PLAYER_SUMMARIES: Final[str] = """
+UNWIND $lookups AS lookup
+CALL {
+    WITH lookup
+    OPTIONAL MATCH (p:Player {name: lookup.name})
+    RETURN head(collect(p)) as exact
+}
+CALL {
+    WITH lookup, exact
+    WITH lookup WHERE exact IS NULL
+    OPTIONAL MATCH (p:Player {id: lookup.id})
+    RETURN head(collect(p)) as by_id
+}
+CALL {
+    WITH lookup, exact, by_id
+    WITH lookup WHERE exact IS NULL AND by_id IS NULL AND lookup.search <> ''
+    CALL db.index.fulltext.queryNodes('player_fulltext', lookup.search) YIELD node
+    WITH node LIMIT 1
+    RETURN head(collect(node)) as fuzzy
+}
+WITH lookup, coalesce(exact, by_id, fuzzy) as p
+WHERE p IS NOT NULL
+RETURN lookup.id as id,
+       p.name as name,
+       p.position as position,
+       p.nationality as nationality,
+       COUNT { MATCH (p)-[:SCORED_IN]->(m:Match) RETURN DISTINCT m } as goals,
+       COLLECT { MATCH (p)-[:PLAYS_FOR]->(t:Team) RETURN DISTINCT t.name } as teams
+"""
+
+# Player info, per-team career history and achievements in one round-trip
+_PLAYER_CAREER: Final[str] = """
+MATCH (p:Player {name: $player_name})
+CALL {
+    WITH p
+    OPTIONAL MATCH (p)-[r:PLAYS_FOR]->(t:Team)
+    // Matches are aggregated per team before competitions are looked up, so
+    // rows never fan out to teams x matches x competitions (and a match in
+    // several competitions is not summed twice)
+    CALL {
+        WITH p, t
+        OPTIONAL MATCH (p)-[:PLAYED_IN]->(m:Match)<-[:PARTICIPATED_IN]-(t)
+        WITH DISTINCT m
+        RETURN count(m) as matches_played,
+               sum(m.goals_for) as goals,
+               collect(m) as matches
+    }
+    WITH t, r, matches_played, goals,
+         COLLECT { UNWIND matches AS m
+                   MATCH (m)-[:PART_OF]->(c:Competition)
+                   RETURN DISTINCT c.name } as competitions
+    ORDER BY r.start_date DESC
+    RETURN collect(CASE WHEN t IS NOT NULL THEN {
+               team: t.name,
+               city: t.city,
+               period: {start: r.start_date, end: r.end_date},
+               jersey_number: r.jersey_number,
+               transfer_fee: r.transfer_fee,
+               performance: {matches: matches_played, goals: goals},
+               competitions: competitions
+           } END) as career
+}
+CALL {
+    WITH p
+    // Wins and championship appearances are separate branches (UNION keeps
+    // each match once) so neither filter hides the other's index
+    CALL {
+        WITH p
+        MATCH (p)-[:PLAYED_IN]->(m:Match {result: 'win'})-[:PART_OF]->(c:Competition)
+        RETURN m, c
+        UNION
+        WITH p
+        MATCH (p)-[:PLAYED_IN]->(m:Match)-[:PART_OF]->(c:Competition {type: 'championship'})
+        RETURN m, c
+    }
+    WITH c.name as competition, c.season as season, count(m) as appearances
+    ORDER BY season DESC
+    RETURN collect({
+               competition: competition,
+               season: season,
+               appearances: appearances
+           }) as achievements
+}
+RETURN p.name as name,
+       p.position as position,
+       p.birth_date as birth_date,
+       p.nationality as nationality,
+       career,
+       achievements,
+       size(career) as total_teams,
+       reduce(total = 0, e IN career | total + e.performance.matches) as total_matches,
+       reduce(total = 0, e IN career | total + e.performance.goals) as total_goals,
+       reduce(first = null, e IN career |
+              CASE WHEN e.period.start IS NOT NULL AND (first IS NULL OR e.period.start < first)
+                   THEN e.period.start ELSE first END) as career_start,
+       reduce(last = null, e IN career |
+              CASE WHEN e.period.end IS NOT NULL AND (last IS NULL OR e.period.end > last)
+                   THEN e.period.end ELSE last END) as career_end
+"""
+
 class PlayerTools:
     """Player-specific MCP tools"""
 
-    def __init__(self, driver, cache):
+    def __init__(self, driver, cache, database: str = Config.NEO4J_DATABASE):
         self.driver = driver
-        self.cache = cache
-        self.cache_ttl = timedelta(minutes=30)
+        self._database = database
+        self.cache = cache  # Shared TTLCache; entries are tagged "player:<name>" / "team:<name>"
+        # "Not found" answers are cached briefly: players can be added at any time
+        self.neg_cache = TTLCache(maxsize=Config.NEGATIVE_CACHE_MAX_SIZE,
+                                  ttl=Config.NEGATIVE_CACHE_TTL_SECONDS)
+        # The career query aggregates over every match a player appeared in;
+        # on servers with the parallel runtime it can be spread across workers
+        self._career_query = (
+            "CYPHER runtime=parallel\n" + _PLAYER_CAREER
+            if Config.CYPHER_PARALLEL_RUNTIME else _PLAYER_CAREER
+        )
+        # None until the graph has been checked for NameTrigram nodes
+        self._trigrams_loaded: Optional[bool] = None
+
+    async def _run(self, cypher: str, **params) -> List[Any]:
+        """Run a read query through the driver's managed execute_query API and return its records"""
+        # execute_query handles session lifecycle, retries and result consumption.
+        # The statement is not named "query" so it cannot clash with a $query parameter
+        records, _, _ = await self.driver.execute_query(
+            cypher, params, database_=self._database, routing_=RoutingControl.READ
+        )
+        return records
+
+    async def _run_data(self, cypher: str, **params) -> List[Dict[str, Any]]:
+        """Run a read query and return its rows as plain dicts"""
+        return await self.driver.execute_query(
+            cypher, params, database_=self._database, routing_=RoutingControl.READ,
+            result_transformer_=AsyncResult.data
+        )
+
+    async def _has_trigrams(self) -> bool:
+        """Whether the graph carries NameTrigram nodes for substring search"""
+        # A positive answer is kept; a negative one is re-checked so a later
+        # backfill (GraphBuilder.create_player_name_trigrams) is picked up
+        if not self._trigrams_loaded:
+            records = await self._run(_HAS_TRIGRAMS)
+            loaded = bool(records and records[0]["loaded"])
+            if not loaded and self._trigrams_loaded is None:
+                logger.warning("No NameTrigram nodes found; substring player search "
+                               "falls back to scanning every Player name")
+            self._trigrams_loaded = loaded
+        return self._trigrams_loaded
+
+    def invalidate(self, tag: str) -> int:
+        """Evict every cached result tagged with tag (e.g. after a write to that player/team)"""
+        return self.cache.invalidate(tag) + self.neg_cache.invalidate(tag)
 
     async def search_player(self, name: str, limit: int = 10) -> Dict[str, Any]:
         """Search for players by name or partial name"""
-        cache_key = f"search_player_{name}_{limit}"
+        # The full-text match ignores case and spacing, so neither should split the cache
+        cache_key = ("search_player", " ".join(name.casefold().split()), limit)
 
         # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if datetime.now() - timestamp < self.cache_ttl:
-                return cached_data
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached if cached["query"] == name else {**cached, "query": name}
 
         try:
-            # Use async with for proper session management
-            async with self.driver.session() as session:
-                # Cypher query to search players
-                query = """
-                MATCH (p:Player)
-                WHERE toLower(p.name) CONTAINS toLower($name)
-                OPTIONAL MATCH (p)-[:PLAYS_FOR]->(t:Team)
-                RETURN DISTINCT p.name as name,
-                       p.position as position,
-                       p.birth_date as birth_date,
-                       p.nationality as nationality,
-                       collect(DISTINCT t.name) as current_teams
-                ORDER BY p.name
-                LIMIT $limit
-                """
-
-                result = await session.run(query, name=name, limit=limit)
-                players = []
-
-                async for record in result:
-                    player_data = {
-                        "name": record["name"],
-                        "position": record["position"],
-                        "birth_date": record["birth_date"],
-                        "nationality": record["nationality"],
-                        "current_teams": record["current_teams"] or []
-                    }
-                    players.append(player_data)
-
-                response = {
-                    "query": name,
-                    "total_found": len(players),
-                    "players": players
-                }
+            # Rows already have the response shape (collect() never yields null)
+            query = fulltext_query(name)
+            if query:
+                players = await self._run_data(_SEARCH_PLAYER, query=query, limit=limit)
+                needle = " ".join(name.lower().split())
+                if not players and len(needle) >= 3:
+                    if await self._has_trigrams():
+                        players = await self._run_data(
+                            _SEARCH_PLAYER_SUBSTRING,
+                            trigrams=_name_trigrams(needle), name=needle, limit=limit
+                        )
+                    else:
+                        players = await self._run_data(
+                            _SEARCH_PLAYER_CONTAINS, name=needle, limit=limit
+                        )
+            else:
+                players = await self._run_data(_LIST_PLAYERS, limit=limit)
+
+            response = {
+                "query": name,
+                "total_found": len(players),
+                "players": players
+            }
 
-                # Cache the result
-                self.cache[cache_key] = (response, datetime.now())
-                return response
+            # Cache the result; any player write invalidates searches
+            tags = ["players"] + [f"player:{player['name']}" for player in players]
+            self.cache.set(cache_key, response, tags=tags)
+            return response
 
         except Exception as e:
             logger.error(f"Error searching players: {e}")
@@ -98,104 +431,37 @@ class PlayerTools:
 
     async def get_player_stats(self, player_name: str, season: Optional[str] = None) -> Dict[str, Any]:
         """Get detailed statistics for a specific player"""
-        cache_key = f"player_stats_{player_name}_{season or 'all'}"
+        cache_key = ("player_stats", player_name, season)
 
-        # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if datetime.now() - timestamp < self.cache_ttl:
-                return cached_data
+        # Check caches (recent misses first)
+        cached = self.neg_cache.get(cache_key) or self.cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            async with self.driver.session() as session:
-                # Base query for player info
-                player_query = """
-                MATCH (p:Player {name: $player_name})
-                RETURN p.name as name,
-                       p.position as position,
-                       p.birth_date as birth_date,
-                       p.nationality as nationality,
-                       p.height as height,
-                       p.weight as weight
-                """
-
-                player_result = await session.run(player_query, player_name=player_name)
-                player_record = await player_result.single()
-
-                if not player_record:
-                    return {"error": f"Player '{player_name}' not found"}
-
-                # Get match statistics
-                stats_query = """
-                MATCH (p:Player {name: $player_name})-[:PLAYED_IN]->(m:Match)
-                """
-
-                if season:
-                    stats_query += " WHERE m.season = $season"
-
-                stats_query += """
-                OPTIONAL MATCH (m)-[:PART_OF]->(c:Competition)
-                RETURN count(m) as matches_played,
-                       sum(CASE WHEN m.goals_for IS NOT NULL THEN m.goals_for ELSE 0 END) as total_goals,
-                       sum(CASE WHEN m.assists IS NOT NULL THEN m.assists ELSE 0 END) as total_assists,
-                       sum(CASE WHEN m.yellow_cards IS NOT NULL THEN m.yellow_cards ELSE 0 END) as yellow_cards,
-                       sum(CASE WHEN m.red_cards IS NOT NULL THEN m.red_cards ELSE 0 END) as red_cards,
-                       collect(DISTINCT c.name) as competitions
-                """
-
-                params = {"player_name": player_name}
-                if season:
-                    params["season"] = season
-
-                stats_result = await session.run(stats_query, **params)
-                stats_record = await stats_result.single()
-
-                # Get team history
-                team_query = """
-                MATCH (p:Player {name: $player_name})-[r:PLAYS_FOR]->(t:Team)
-                RETURN t.name as team_name,
-                       r.start_date as start_date,
-                       r.end_date as end_date,
-                       r.jersey_number as jersey_number
-                ORDER BY r.start_date DESC
-                """
-
-                team_result = await session.run(team_query, player_name=player_name)
-                teams = []
-                async for record in team_result:
-                    teams.append({
-                        "team": record["team_name"],
-                        "start_date": record["start_date"],
-                        "end_date": record["end_date"],
-                        "jersey_number": record["jersey_number"]
-                    })
-
-                # Compile response
-                response = {
-                    "player": {
-                        "name": player_record["name"],
-                        "position": player_record["position"],
-                        "birth_date": player_record["birth_date"],
-                        "nationality": player_record["nationality"],
-                        "height": player_record["height"],
-                        "weight": player_record["weight"]
-                    },
-                    "statistics": {
-                        "matches_played": stats_record["matches_played"] or 0,
-                        "goals": stats_record["total_goals"] or 0,
-                        "assists": stats_record["total_assists"] or 0,
-                        "yellow_cards": stats_record["yellow_cards"] or 0,
-                        "red_cards": stats_record["red_cards"] or 0,
-                        "competitions": stats_record["competitions"] or []
-                    },
-                    "teams": teams,
-                    "season": season or "all_time"
-                }
-
-                # Cache the result
-                self.cache[cache_key] = (response, datetime.now())
+            records = await self._run(_PLAYER_STATS, player_name=player_name, season=season)
+            record = records[0] if records else None
+
+            if not record:
+                response = {"error": f"Player '{player_name}' not found"}
+                self.neg_cache.set(cache_key, response, tags=[f"player:{player_name}", "players"])
                 return response
 
+            teams = record["teams"]
+
+            # Compile response from the maps the query already shaped
+            response = PlayerStatsResponse(
+                player=record["player"],
+                statistics=record["statistics"],
+                teams=teams,
+                season=season or "all_time"
+            )
+
+            # Cache the result
+            tags = [f"player:{player_name}"] + [f"team:{team['team']}" for team in teams]
+            self.cache.set(cache_key, response, tags=tags)
+            return response
+
         except Exception as e:
             logger.error(f"Error getting player stats: {e}")
             return {
@@ -205,159 +471,92 @@ class PlayerTools:
 
     async def get_player_career(self, player_name: str) -> Dict[str, Any]:
         """Get career history and teams for a player"""
-        cache_key = f"player_career_{player_name}"
+        cache_key = ("player_career", player_name)
 
-        # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if datetime.now() - timestamp < self.cache_ttl:
-                return cached_data
+        # Check caches (recent misses first)
+        cached = self.neg_cache.get(cache_key) or self.cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            async with self.driver.session() as session:
-                # Get player basic info
-                player_query = """
-                MATCH (p:Player {name: $player_name})
-                RETURN p.name as name,
-                       p.position as position,
-                       p.birth_date as birth_date,
-                       p.nationality as nationality
-                """
-
-                player_result = await session.run(player_query, player_name=player_name)
-                player_record = await player_result.single()
-
-                if not player_record:
-                    return {"error": f"Player '{player_name}' not found"}
-
-                # Get detailed career history
-                career_query = """
-                MATCH (p:Player {name: $player_name})-[r:PLAYS_FOR]->(t:Team)
-                OPTIONAL MATCH (p)-[:PLAYED_IN]->(m:Match)<-[:PARTICIPATED_IN]-(t)
-                OPTIONAL MATCH (m)-[:PART_OF]->(c:Competition)
-                RETURN t.name as team_name,
-                       t.city as team_city,
-                       r.start_date as start_date,
-                       r.end_date as end_date,
-                       r.jersey_number as jersey_number,
-                       r.transfer_fee as transfer_fee,
-                       count(DISTINCT m) as matches_played,
-                       sum(CASE WHEN m.goals_for IS NOT NULL THEN m.goals_for ELSE 0 END) as goals,
-                       collect(DISTINCT c.name) as competitions
-                ORDER BY r.start_date DESC
-                """
-
-                career_result = await session.run(career_query, player_name=player_name)
-                career_history = []
-
-                async for record in career_result:
-                    career_entry = {
-                        "team": record["team_name"],
-                        "city": record["team_city"],
-                        "period": {
-                            "start": record["start_date"],
-                            "end": record["end_date"]
-                        },
-                        "jersey_number": record["jersey_number"],
-                        "transfer_fee": record["transfer_fee"],
-                        "performance": {
-                            "matches": record["matches_played"] or 0,
-                            "goals": record["goals"] or 0
-                        },
-                        "competitions": record["competitions"] or []
-                    }
-                    career_history.append(career_entry)
-
-                # Get achievements and honors
-                achievements_query = """
-                MATCH (p:Player {name: $player_name})-[:PLAYED_IN]->(m:Match)-[:PART_OF]->(c:Competition)
-                WHERE m.result = 'win' OR c.type = 'championship'
-                RETURN c.name as competition,
-                       c.season as season,
-                       count(m) as appearances
-                ORDER BY c.season DESC
-                """
-
-                achievements_result = await session.run(achievements_query, player_name=player_name)
-                achievements = []
-
-                async for record in achievements_result:
-                    achievements.append({
-                        "competition": record["competition"],
-                        "season": record["season"],
-                        "appearances": record["appearances"]
-                    })
-
-                # Calculate career totals
-                total_matches = sum(entry["performance"]["matches"] for entry in career_history)
-                total_goals = sum(entry["performance"]["goals"] for entry in career_history)
-                total_teams = len(career_history)
-
-                response = {
-                    "player": {
-                        "name": player_record["name"],
-                        "position": player_record["position"],
-                        "birth_date": player_record["birth_date"],
-                        "nationality": player_record["nationality"]
-                    },
-                    "career_summary": {
-                        "total_teams": total_teams,
-                        "total_matches": total_matches,
-                        "total_goals": total_goals,
-                        "career_span": {
-                            "start": min((entry["period"]["start"] for entry in career_history if entry["period"]["start"]), default=None),
-                            "end": max((entry["period"]["end"] for entry in career_history if entry["period"]["end"]), default="Present")
-                        }
-                    },
-                    "career_history": career_history,
-                    "achievements": achievements
-                }
-
-                # Cache the result
-                self.cache[cache_key] = (response, datetime.now())
+            records = await self._run(self._career_query, player_name=player_name)
+            player_record = records[0] if records else None
+
+            if not player_record:
+                response = {"error": f"Player '{player_name}' not found"}
+                self.neg_cache.set(cache_key, response, tags=[f"player:{player_name}", "players"])
                 return response
 
+            # Entries arrive in response shape (team, city, period, performance, ...)
+            career_history = player_record["career"]
+
+            achievements = player_record["achievements"]
+
+            response = {
+                "player": {
+                    "name": player_record["name"],
+                    "position": player_record["position"],
+                    "birth_date": player_record["birth_date"],
+                    "nationality": player_record["nationality"]
+                },
+                # Totals and span are aggregated by the query
+                "career_summary": {
+                    "total_teams": player_record["total_teams"],
+                    "total_matches": player_record["total_matches"],
+                    "total_goals": player_record["total_goals"],
+                    "career_span": {
+                        "start": player_record["career_start"],
+                        "end": player_record["career_end"] or "Present"
+                    }
+                },
+                "career_history": career_history,
+                "achievements": achievements
+            }
+
+            # Cache the result
+            tags = [f"player:{player_name}"] + [f"team:{entry['team']}" for entry in career_history]
+            self.cache.set(cache_key, response, tags=tags)
+            return response
+
         except Exception as e:
             logger.error(f"Error getting player career: {e}")
             return {
                 "error": f"Failed to get player career: {str(e)}",
                 "player_name": player_name
             }
+    async def get_player_profile(self, player_name: str) -> Dict[str, Any]:
+        """Get statistics and career history for a player in one call"""
+        # Independent lookups: each execute_query borrows its own pooled connection
+        stats, career = await asyncio.gather(
+            self.get_player_stats(player_name),
+            self.get_player_career(player_name)
+        )
+        return {"stats": stats, "career": career}
+
     async def search_players_by_position(self, position: str, limit: int = 20) -> Dict[str, Any]:
         """Search for players by position."""
+        cache_key = ("players_by_position", position.strip().casefold(), limit)
+
+        # Check cache
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached if cached["position"] == position else {**cached, "position": position}
+
         try:
-            query = """
-                MATCH (p:Player)
-                WHERE toLower(p.position) = toLower($position)
-                OPTIONAL MATCH (p)-[:PLAYS_FOR]->(t:Team)
-                RETURN p.name as name,
-                       p.position as position,
-                       p.birth_date as birth_date,
-                       p.nationality as nationality,
-                       collect(DISTINCT t.name) as teams
-                ORDER BY p.name
-                LIMIT $limit
-                """
-
-            async with self.driver.session() as session:
-                result = await session.run(query, position=position, limit=limit)
-                records = [record async for record in result]
-
-                players = []
-                for record in records:
-                    players.append({
-                        "name": record["name"],
-                        "position": record["position"],
-                        "birth_date": str(record["birth_date"]) if record["birth_date"] else None,
-                        "nationality": record["nationality"],
-                        "teams": record["teams"] if record["teams"] else []
-                    })
-
-                return {
-                    "position": position,
-                    "total_found": len(players),
-                    "players": players
-                }
+            players = await self._run_data(
+                _PLAYERS_BY_POSITION, positions=_position_variants(position), limit=limit
+            )
+
+            response = {
+                "position": position,
+                "total_found": len(players),
+                "players": players
+            }
+
+            # Cache the result
+            tags = ["players"] + [f"player:{player['name']}" for player in players]
+            self.cache.set(cache_key, response, tags=tags)
+            return response
 
         except Exception as e:
             logger.error(f"Failed to search players by position: {e}")
@@ -367,81 +566,96 @@ class PlayerTools:
                 "players": []
             }
 
+    async def _fetch_player_summaries(self, player_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch name, position, nationality, goals and teams for several players, keyed by id"""
+        # If IDs are like "player_0", use them directly or convert to names
+        lookups = [{"id": player_id, "name": player_id.replace("player_", "Player "),
+                    "search": fulltext_query(player_id)}
+                   for player_id in player_ids]
+        rows = await self._run_data(_PLAYER_SUMMARIES, lookups=lookups)
+        return {row.pop("id"): row for row in rows}
+
+    @staticmethod
+    def _swap_comparison(response: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a compare_players response with player1 and player2 exchanged"""
+        return {
+            "player1": response["player2"],
+            "player2": response["player1"],
+            "comparison": {
+                **response["comparison"],
+                "goals_difference": -response["comparison"]["goals_difference"]
+            }
+        }
+
     async def compare_players(self, player1_id: str, player2_id: str) -> Dict[str, Any]:
         """Compare two players."""
-        try:
-            # If IDs are like "player_0", use them directly or convert to names
-            player1_name = player1_id.replace("player_", "Player ")
-            player2_name = player2_id.replace("player_", "Player ")
-
-            query = """
-                MATCH (p1:Player)
-                WHERE p1.name = $player1_name OR p1.id = $player1_id OR toLower(p1.name) CONTAINS toLower($player1_id)
-                OPTIONAL MATCH (p1)-[:SCORED_IN]->(m1:Match)
-                OPTIONAL MATCH (p1)-[:PLAYS_FOR]->(t1:Team)
-                WITH p1, count(DISTINCT m1) as p1_goals, collect(DISTINCT t1.name) as p1_teams
-
-                MATCH (p2:Player)
-                WHERE p2.name = $player2_name OR p2.id = $player2_id OR toLower(p2.name) CONTAINS toLower($player2_id)
-                OPTIONAL MATCH (p2)-[:SCORED_IN]->(m2:Match)
-                OPTIONAL MATCH (p2)-[:PLAYS_FOR]->(t2:Team)
-                WITH p1, p1_goals, p1_teams, p2, count(DISTINCT m2) as p2_goals, collect(DISTINCT t2.name) as p2_teams
-
-                RETURN p1.name as player1_name,
-                       p1.position as player1_position,
-                       p1.nationality as player1_nationality,
-                       p1_goals as player1_goals,
-                       p1_teams as player1_teams,
-                       p2.name as player2_name,
-                       p2.position as player2_position,
-                       p2.nationality as player2_nationality,
-                       p2_goals as player2_goals,
-                       p2_teams as player2_teams
-                """
-
-            async with self.driver.session() as session:
-                result = await session.run(
-                    query,
-                    player1_name=player1_name,
-                    player1_id=player1_id,
-                    player2_name=player2_name,
-                    player2_id=player2_id
-                )
-                record = await result.single()
-
-                if not record:
-                    return {
-                        "error": "Players not found",
+        results = await self.compare_players_batch([(player1_id, player2_id)])
+        return results[0]
+
+    async def compare_players_batch(self, pairs: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Compare several player pairs, resolving every uncached player in a single query"""
+        responses: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        missing = []
+        for player1_id, player2_id in pairs:
+            cached = self.neg_cache.get(("compare_players", player1_id, player2_id))
+            if cached is None:
+                # Order-independent key: a swapped call reuses the entry and flips orientation
+                cached = self.cache.get(("compare_players", *sorted((player1_id, player2_id))))
+                if cached is not None and player2_id < player1_id:
+                    cached = self._swap_comparison(cached)
+            if cached is not None:
+                responses[(player1_id, player2_id)] = cached
+            elif (player1_id, player2_id) not in missing:
+                missing.append((player1_id, player2_id))
+
+        if missing:
+            try:
+                player_ids = list(dict.fromkeys(player_id for pair in missing for player_id in pair))
+                summaries = await self._fetch_player_summaries(player_ids)
+
+                for player1_id, player2_id in missing:
+                    responses[(player1_id, player2_id)] = self._comparison_response(
+                        player1_id, player2_id,
+                        summaries.get(player1_id), summaries.get(player2_id)
+                    )
+
+            except Exception as e:
+                logger.error(f"Failed to compare players: {e}")
+                for player1_id, player2_id in missing:
+                    responses[(player1_id, player2_id)] = {
+                        "error": f"Failed to compare players: {str(e)}",
                         "player1_id": player1_id,
                         "player2_id": player2_id
                     }
 
-                return {
-                    "player1": {
-                        "name": record["player1_name"],
-                        "position": record["player1_position"],
-                        "nationality": record["player1_nationality"],
-                        "goals": record["player1_goals"],
-                        "teams": record["player1_teams"]
-                    },
-                    "player2": {
-                        "name": record["player2_name"],
-                        "position": record["player2_position"],
-                        "nationality": record["player2_nationality"],
-                        "goals": record["player2_goals"],
-                        "teams": record["player2_teams"]
-                    },
-                    "comparison": {
-                        "goals_difference": record["player1_goals"] - record["player2_goals"],
-                        "both_same_position": record["player1_position"] == record["player2_position"],
-                        "both_same_nationality": record["player1_nationality"] == record["player2_nationality"]
-                    }
-                }
+        return [responses[pair] for pair in pairs]
 
-        except Exception as e:
-            logger.error(f"Failed to compare players: {e}")
-            return {
-                "error": f"Failed to compare players: {str(e)}",
+    def _comparison_response(self, player1_id: str, player2_id: str,
+                             player1: Optional[Dict[str, Any]],
+                             player2: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build and cache the compare_players response for one pair"""
+        if not player1 or not player2:
+            response = {
+                "error": "Players not found",
                 "player1_id": player1_id,
                 "player2_id": player2_id
             }
+            self.neg_cache.set(("compare_players", player1_id, player2_id), response, tags=["players"])
+            return response
+
+        response = {
+            "player1": player1,
+            "player2": player2,
+            "comparison": {
+                "goals_difference": player1["goals"] - player2["goals"],
+                "both_same_position": player1["position"] == player2["position"],
+                "both_same_nationality": player1["nationality"] == player2["nationality"]
+            }
+        }
+
+        # Cache in sorted-id orientation
+        swapped = player2_id < player1_id
+        pair_key = ("compare_players", *sorted((player1_id, player2_id)))
+        tags = [f"player:{player1['name']}", f"player:{player2['name']}"]
+        self.cache.set(pair_key, self._swap_comparison(response) if swapped else response, tags=tags)
+        return response
@@ -18,79 +18,473 @@ TECHNICAL DETAILS:
 - Testing: Integration with demo questions
 
 INTEGRATION:
-- MCP Tools: Team search, roster, statistics queries
+- MCP Tools: Team search, roster, statistics queries (or roster + statistics
+  bundled into one query)
 - Error Handling: Graceful fallbacks
 - Rate Limiting: Built-in for external APIs
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
-import json
+import re
+from datetime import date
+from itertools import chain
+from typing import Any, AsyncIterator, Dict, Final, List, Optional
+
+from neo4j import READ_ACCESS
+
+from ..cache import TTLCache, cached_response, single_flight
+from ..config import Config
+from .cypher_utils import fulltext_query
 
 logger = logging.getLogger(__name__)
 
+# Indexes the team lookups rely on; created at server bootstrap (names match
+# src/graph/schema.py). Exact-name lookups are unique-index seeks backed by the
+# team_name_unique constraint; name search goes through the team_fulltext
+# Lucene index. Graphs loaded before the constraint existed keep their plain
+# team_name_index until scripts/setup_database.py --migrate-only replaces it.
+REQUIRED_INDEXES: Final = (
+    "CREATE CONSTRAINT team_name_unique IF NOT EXISTS FOR (t:Team) REQUIRE t.name IS UNIQUE",
+    "CREATE INDEX player_name_index IF NOT EXISTS FOR (p:Player) ON (p.name)",
+    "CREATE FULLTEXT INDEX team_fulltext IF NOT EXISTS FOR (t:Team) ON EACH [t.name]",
+)
+
+# Applied when a constraint above cannot be created (an unmigrated graph or
+# duplicate team names) so name lookups still seek an index
+INDEX_FALLBACKS: Final = {
+    "CREATE CONSTRAINT team_name_unique IF NOT EXISTS FOR (t:Team) REQUIRE t.name IS UNIQUE":
+        "CREATE INDEX team_name_index IF NOT EXISTS FOR (t:Team) ON (t.name)",
+}
+
+# Query text is fixed per logical query: optional filters are written as
+# "$param IS NULL OR ..." and every parameter is always bound, so Neo4j
+# compiles each plan once instead of once per filter combination.
+_SEARCH_TEAM: Final[str] = """
+CALL db.index.fulltext.queryNodes('team_fulltext', $search) YIELD node AS t, score
+RETURN t.name as name,
+       t.city as city,
+       t.founded as founded,
+       t.stadium as stadium,
+       t.capacity as capacity,
+       t.colors as colors,
+       COUNT { MATCH (t)<-[:PLAYS_FOR]-(p:Player) RETURN DISTINCT p } as current_players
+ORDER BY score DESC, name
+LIMIT $limit
+"""
+
+# Infix fallback for terms the full-text prefix match misses (e.g. "mengo"
+# for Flamengo); the Team label is small, so the scan is cheap
+_SEARCH_TEAM_SUBSTRING: Final[str] = """
+MATCH (t:Team)
+WHERE toLower(t.name) CONTAINS $name
+RETURN t.name as name,
+       t.city as city,
+       t.founded as founded,
+       t.stadium as stadium,
+       t.capacity as capacity,
+       t.colors as colors,
+       COUNT { MATCH (t)<-[:PLAYS_FOR]-(p:Player) RETURN DISTINCT p } as current_players
+ORDER BY t.name
+LIMIT $limit
+"""
+
+# Blank search terms list teams alphabetically, as the substring match did
+_LIST_TEAMS: Final[str] = """
+MATCH (t:Team)
+RETURN t.name as name,
+       t.city as city,
+       t.founded as founded,
+       t.stadium as stadium,
+       t.capacity as capacity,
+       t.colors as colors,
+       COUNT { MATCH (t)<-[:PLAYS_FOR]-(p:Player) RETURN DISTINCT p } as current_players
+ORDER BY t.name
+LIMIT $limit
+"""
+
+# Roster of team t, already grouped by position; shared by the roster and
+# bundle queries. PLAYS_FOR spells without dates (GraphBuilder writes none)
+# count as open-ended, so a season filter keeps them.
+_ROSTER_CALL: Final[str] = """
+CALL {
+    WITH t
+    MATCH (p:Player)-[r:PLAYS_FOR]->(t)
+    WHERE $season IS NULL OR
+          ((r.start_date IS NULL OR r.start_date <= $season_end) AND
+           (r.end_date IS NULL OR r.end_date >= $season_start))
+    OPTIONAL MATCH (p)-[:PLAYED_IN]->(m:Match)<-[:PARTICIPATED_IN]-(t)
+    WHERE $season IS NULL OR m.season = $season
+    WITH p, r,
+         count(DISTINCT m) as matches_played,
+         sum(m.goals_for) as goals,
+         sum(m.assists) as assists
+    ORDER BY r.jersey_number, p.name
+    WITH coalesce(p.position, 'Unknown') as position,
+         collect({
+               name: p.name,
+               position: p.position,
+               birth_date: p.birth_date,
+               nationality: p.nationality,
+               height: p.height,
+               weight: p.weight,
+               jersey_number: r.jersey_number,
+               start_date: r.start_date,
+               end_date: r.end_date,
+               transfer_fee: r.transfer_fee,
+               season_stats: {
+                   matches: matches_played,
+                   goals: goals,
+                   assists: assists
+               }
+           }) as players
+    ORDER BY position
+    RETURN collect({position: position, players: players}) as by_position
+}
+"""
+
+# Team info and roster in one round-trip
+_TEAM_ROSTER: Final[str] = """
+MATCH (t:Team {name: $team_name})
+""" + _ROSTER_CALL + """
+RETURN t {.name, .city, .founded, .stadium, .capacity, .colors} as team,
+       by_position
+"""
+
+# Streaming variant: team header first, then one row per player so rosters
+# can be fetched and forwarded in batches
+_TEAM_HEADER: Final[str] = """
+MATCH (t:Team {name: $team_name})
+RETURN t {.name, .city, .founded, .stadium, .capacity, .colors} as team
+"""
+
+_TEAM_ROSTER_ROWS: Final[str] = """
+MATCH (p:Player)-[r:PLAYS_FOR]->(t:Team {name: $team_name})
+WHERE $season IS NULL OR
+      ((r.start_date IS NULL OR r.start_date <= $season_end) AND
+       (r.end_date IS NULL OR r.end_date >= $season_start))
+OPTIONAL MATCH (p)-[:PLAYED_IN]->(m:Match)<-[:PARTICIPATED_IN]-(t)
+WHERE $season IS NULL OR m.season = $season
+WITH p, r,
+     count(DISTINCT m) as matches_played,
+     sum(m.goals_for) as goals,
+     sum(m.assists) as assists
+RETURN p.name as name,
+       p.position as position,
+       p.birth_date as birth_date,
+       p.nationality as nationality,
+       p.height as height,
+       p.weight as weight,
+       r.jersey_number as jersey_number,
+       r.start_date as start_date,
+       r.end_date as end_date,
+       r.transfer_fee as transfer_fee,
+       {matches: matches_played, goals: goals, assists: assists} as season_stats
+ORDER BY coalesce(p.position, 'Unknown'), r.jersey_number, p.name
+"""
+
+# Totals, recent form and top players of team t; shared by the stats and
+# bundle queries
+_STATS_CALLS: Final[str] = """
+CALL {
+    WITH t
+    MATCH (t)-[:PARTICIPATED_IN]->(m:Match)
+    WHERE $competition IS NULL OR EXISTS { (m)-[:PART_OF]->(:Competition {name: $competition}) }
+    OPTIONAL MATCH (m)-[:PART_OF]->(comp:Competition)
+    WITH count(m) as total_matches,
+         sum(CASE WHEN m.home_team = $team_name THEN m.home_score ELSE m.away_score END) as goals_for,
+         sum(CASE WHEN m.home_team = $team_name THEN m.away_score ELSE m.home_score END) as goals_against,
+         sum(CASE
+             WHEN (m.home_team = $team_name AND m.home_score > m.away_score) OR
+                  (m.away_team = $team_name AND m.away_score > m.home_score)
+             THEN 1 ELSE 0 END) as wins,
+         sum(CASE
+             WHEN m.home_score = m.away_score
+             THEN 1 ELSE 0 END) as draws,
+         sum(CASE
+             WHEN (m.home_team = $team_name AND m.home_score < m.away_score) OR
+                  (m.away_team = $team_name AND m.away_score < m.home_score)
+             THEN 1 ELSE 0 END) as losses,
+         collect(DISTINCT comp.name) as competitions
+    RETURN total_matches, goals_for, goals_against, wins, draws, losses, competitions,
+           CASE WHEN total_matches = 0 THEN 0.0
+                ELSE round(toFloat(wins) * 100 / total_matches, 2) END as win_percentage,
+           CASE WHEN total_matches = 0 THEN 0.0
+                ELSE round(toFloat(goals_for) / total_matches, 2) END as goals_per_match
+}
+CALL {
+    WITH t
+    MATCH (t)-[:PARTICIPATED_IN]->(m:Match)
+    WHERE $competition IS NULL OR EXISTS { (m)-[:PART_OF]->(:Competition {name: $competition}) }
+    WITH m
+    ORDER BY m.date DESC
+    LIMIT 10
+    RETURN collect({
+               date: m.date,
+               home_team: m.home_team,
+               away_team: m.away_team,
+               home_score: m.home_score,
+               away_score: m.away_score,
+               result: CASE
+                   WHEN (m.home_team = $team_name AND m.home_score > m.away_score) OR
+                        (m.away_team = $team_name AND m.away_score > m.home_score)
+                   THEN 'W'
+                   WHEN m.home_score = m.away_score
+                   THEN 'D'
+                   ELSE 'L'
+               END
+           }) as form
+}
+CALL {
+    WITH t
+    MATCH (p:Player)-[:PLAYS_FOR]->(t)
+    MATCH (p)-[:PLAYED_IN]->(m:Match)<-[:PARTICIPATED_IN]-(t)
+    WHERE $competition IS NULL OR EXISTS { (m)-[:PART_OF]->(:Competition {name: $competition}) }
+    WITH p,
+         count(m) as matches,
+         sum(m.goals_for) as goals,
+         sum(m.assists) as assists
+    ORDER BY goals DESC, assists DESC
+    LIMIT 10
+    RETURN collect({
+               name: p.name,
+               position: p.position,
+               matches: matches,
+               goals: goals,
+               assists: assists
+           }) as top_players
+}
+"""
+
+# Team info, totals, recent form and top players in one round-trip
+_TEAM_STATS: Final[str] = """
+MATCH (t:Team {name: $team_name})
+""" + _STATS_CALLS + """
+RETURN t {.name, .city, .founded, .stadium} as team,
+       total_matches, goals_for, goals_against, wins, draws, losses,
+       win_percentage, goals_per_match, competitions, form, top_players
+"""
+
+# Roster and stats in one query: one round-trip, one plan and one read snapshot
+_TEAM_BUNDLE: Final[str] = """
+MATCH (t:Team {name: $team_name})
+""" + _ROSTER_CALL + _STATS_CALLS + """
+RETURN t {.name, .city, .founded, .stadium, .capacity, .colors} as team,
+       by_position,
+       total_matches, goals_for, goals_against, wins, draws, losses,
+       win_percentage, goals_per_match, competitions, form, top_players
+"""
+
+# Case-insensitive match on either property, so no index can serve it; the
+# Team label is small enough for the scan
+_TEAMS_BY_LEAGUE: Final[str] = """
+MATCH (t:Team)
+WHERE toLower(t.league) = toLower($league) OR
+      toLower(t.competition) = toLower($league)
+RETURN t.name as name,
+       t.city as city,
+       t.founded as founded,
+       t.stadium as stadium,
+       COUNT { MATCH (t)<-[:PLAYS_FOR]-(p:Player) RETURN DISTINCT p } as player_count
+ORDER BY t.name
+LIMIT $limit
+"""
+
+# compare_teams resolves each team with an independent name seek (no
+# t1 x t2 Cartesian product); a missing side comes back as nulls so only that
+# side is re-resolved through _RESOLVE_TEAM.
+_COMPARE_TEAMS: Final[str] = """
+CALL {
+    OPTIONAL MATCH (t:Team {name: $team1_name})
+    RETURN t as t1
+    LIMIT 1
+}
+CALL {
+    OPTIONAL MATCH (t:Team {name: $team2_name})
+    RETURN t as t2
+    LIMIT 1
+}
+RETURN t1.name as team1_name,
+       t1.founded as team1_founded,
+       t1.stadium as team1_stadium,
+       COUNT { MATCH (t1)<-[:PLAYS_FOR]-(p:Player) RETURN DISTINCT p } as team1_players,
+       COUNT { MATCH (t1)-[:HOME_TEAM|AWAY_TEAM]-(m:Match) RETURN DISTINCT m } as team1_matches,
+       t2.name as team2_name,
+       t2.founded as team2_founded,
+       t2.stadium as team2_stadium,
+       COUNT { MATCH (t2)<-[:PLAYS_FOR]-(p:Player) RETURN DISTINCT p } as team2_players,
+       COUNT { MATCH (t2)-[:HOME_TEAM|AWAY_TEAM]-(m:Match) RETURN DISTINCT m } as team2_matches
+"""
+
+# Fallback for compare_teams ids that are not exact team names: match the id
+# property, else take the best full-text hit for the id text
+_RESOLVE_TEAM: Final[str] = """
+OPTIONAL MATCH (t:Team {id: $team_id})
+WITH head(collect(t)) as by_id
+CALL {
+    WITH by_id
+    WITH by_id WHERE by_id IS NULL AND $search <> ''
+    CALL db.index.fulltext.queryNodes('team_fulltext', $search) YIELD node
+    WITH node
+    LIMIT 1
+    RETURN head(collect(node)) as by_name
+}
+RETURN coalesce(by_id, by_name).name as name
+"""
+
+
+# Seasons are given as a year or a year range ("2023", "2023-2024")
+_SEASON_YEAR: Final = re.compile(r"\d{4}(?!\d)")
+
+
+def _season_error(season: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Error response for a season that does not start with a four-digit year"""
+    if season and not _SEASON_YEAR.match(str(season)):
+        return {"error": f"Invalid season '{season}': expected a year such as '2023' or '2023-2024'"}
+    return None
+
+
+def _season_bounds(season: Optional[str]) -> Dict[str, Optional[date]]:
+    """Calendar-year bounds of a season as native Neo4j Date parameters"""
+    if not season:
+        return {"season_start": None, "season_end": None}
+    # Compared against PLAYS_FOR.start_date/end_date (DATE) where the loader
+    # set them; callers reject seasons _season_error does not accept first
+    year = int(str(season)[:4])
+    return {"season_start": date(year, 1, 1), "season_end": date(year, 12, 31)}
+
+
+def _team_not_found(response: Dict[str, Any]) -> bool:
+    """True for the "Team '<name>' not found" responses of the single-team tools"""
+    return response.get("error", "").endswith("' not found")
+
+
+def _roster_response(record, season: Optional[str]) -> Dict[str, Any]:
+    """Shape a _ROSTER_CALL result into the get_team_roster response"""
+    positions = {group["position"]: group["players"] for group in record["by_position"]}
+    players = list(chain.from_iterable(positions.values()))
+
+    return {
+        "team": record["team"],
+        "season": season or "current",
+        "total_players": len(players),
+        "roster": players,
+        "by_position": positions
+    }
+
+
+def _stats_response(record, competition: Optional[str]) -> Dict[str, Any]:
+    """Shape a _STATS_CALLS result into the get_team_stats response"""
+    recent_matches = []
+    for match in record["form"]:
+        recent_matches.append({
+            "date": match["date"],
+            "home_team": match["home_team"],
+            "away_team": match["away_team"],
+            "score": f"{match['home_score']}-{match['away_score']}",
+            "result": match["result"]
+        })
+
+    top_players = record["top_players"]
+
+    # Totals are count()/sum() aggregates, so never null
+    wins = record["wins"]
+    draws = record["draws"]
+    goals_for = record["goals_for"]
+    goals_against = record["goals_against"]
+
+    points = wins * 3 + draws  # Assuming 3 points for win, 1 for draw
+    goal_difference = goals_for - goals_against
+
+    return {
+        "team": record["team"],
+        "season": competition if competition else "2023",  # Add season field
+        "players": top_players,  # Add players field (alias for top_players)
+        "competition": competition or "all_competitions",
+        "statistics": {
+            "matches_played": record["total_matches"],
+            "wins": wins,
+            "draws": draws,
+            "losses": record["losses"],
+            "win_percentage": record["win_percentage"],
+            "points": points,
+            "goals_for": goals_for,
+            "goals_against": goals_against,
+            "goal_difference": goal_difference,
+            "goals_per_match": record["goals_per_match"]
+        },
+        "recent_form": recent_matches,
+        "top_players": top_players,
+        "competitions": record["competitions"] or []
+    }
+
+
 class TeamTools:
     """Team-specific MCP tools"""
 
-    def __init__(self, driver, cache):
+    def __init__(self, driver, cache, database: str = Config.NEO4J_DATABASE):
         self.driver = driver
-        self.cache = cache
-        self.cache_ttl = timedelta(minutes=30)
-
+        self._database = database
+        self.cache = cache  # Shared TTLCache; entries are tagged "team:<name>"
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        # "Not found" answers are cached briefly (tagged "teams") so repeated
+        # lookups of a misspelt team skip Neo4j until the next ingest or expiry
+        self.neg_cache = TTLCache(maxsize=Config.NEGATIVE_CACHE_MAX_SIZE,
+                                  ttl=Config.NEGATIVE_CACHE_TTL_SECONDS)
+
+    def invalidate(self, tag: str) -> int:
+        """Evict every cached result tagged with tag (e.g. after a write to that team)"""
+        return self.cache.invalidate(tag) + self.neg_cache.invalidate(tag)
+
+    def _read_session(self, fetch_size: Optional[int] = None):
+        """Open a read-only session on the configured database"""
+        # Read access lets a cluster route these queries to read replicas.
+        # fetch_size bounds how many records each PULL asks the server for
+        # (driver default when unset)
+        options = {} if fetch_size is None else {"fetch_size": fetch_size}
+        return self.driver.session(database=self._database,
+                                   default_access_mode=READ_ACCESS, **options)
+
+    # Transaction functions for session.execute_read: each tool call runs in one
+    # managed read transaction, which the driver retries on transient errors
+    @staticmethod
+    async def _single(tx, query: str, **params):
+        """Run query and return its only record, or None"""
+        result = await tx.run(query, **params)
+        return await result.single()
+
+    @staticmethod
+    async def _data(tx, query: str, **params) -> List[Dict[str, Any]]:
+        """Run query and return every row as a dict"""
+        result = await tx.run(query, **params)
+        return await result.data()
+
+    # Any team write invalidates searches
+    @single_flight
+    @cached_response(tags=lambda response: ["teams"] + [f"team:{team['name']}" for team in response["teams"]])
     async def search_team(self, name: str, limit: int = 10) -> Dict[str, Any]:
         """Search for teams by name or partial name"""
-        cache_key = f"search_team_{name}_{limit}"
-
-        # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if datetime.now() - timestamp < self.cache_ttl:
-                return cached_data
-
         try:
-            async with self.driver.session() as session:
-                # Cypher query to search teams
-                query = """
-                MATCH (t:Team)
-                WHERE toLower(t.name) CONTAINS toLower($name)
-                OPTIONAL MATCH (t)<-[:PLAYS_FOR]-(p:Player)
-                RETURN t.name as name,
-                       t.city as city,
-                       t.founded as founded,
-                       t.stadium as stadium,
-                       t.capacity as capacity,
-                       t.colors as colors,
-                       count(DISTINCT p) as current_players
-                ORDER BY t.name
-                LIMIT $limit
-                """
-
-                result = await session.run(query, name=name, limit=limit)
-                teams = []
-
-                async for record in result:
-                    team_data = {
-                        "name": record["name"],
-                        "city": record["city"],
-                        "founded": record["founded"],
-                        "stadium": record["stadium"],
-                        "capacity": record["capacity"],
-                        "colors": record["colors"],
-                        "current_players": record["current_players"] or 0
-                    }
-                    teams.append(team_data)
+            async with self._read_session() as session:
+                # Name terms are matched as prefixes through the full-text index;
+                # the CONTAINS scan only runs when that finds nothing
+                search = fulltext_query(name)
+                query = _SEARCH_TEAM if search else _LIST_TEAMS
+
+                # Rows already have the response shape (COUNT {} is never null)
+                teams = await session.execute_read(self._data, query, search=search, limit=limit)
+                if not teams and search:
+                    teams = await session.execute_read(
+                        self._data, _SEARCH_TEAM_SUBSTRING,
+                        name=" ".join(name.lower().split()), limit=limit
+                    )
 
-                response = {
+                return {
                     "query": name,
                     "total_found": len(teams),
                     "teams": teams
                 }
 
-                # Cache the result
-                self.cache[cache_key] = (response, datetime.now())
-                return response
-
         except Exception as e:
             logger.error(f"Error searching teams: {e}")
             return {
@@ -99,126 +493,29 @@ class TeamTools:
                 "teams": []
             }
 
+    @single_flight
+    @cached_response(tags=lambda response: [f"team:{response['team']['name']}"] +
+                     [f"player:{player['name']}" for player in response["roster"]],
+                     negative=_team_not_found, negative_tags=["teams"])
     async def get_team_roster(self, team_name: str, season: Optional[str] = None) -> Dict[str, Any]:
         """Get current roster for a team"""
-        cache_key = f"team_roster_{team_name}_{season or 'current'}"
-
-        # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if datetime.now() - timestamp < self.cache_ttl:
-                return cached_data
-
+        invalid = _season_error(season)
+        if invalid:
+            return invalid
         try:
-            async with self.driver.session() as session:
-                # Get team basic info
-                team_query = """
-                MATCH (t:Team {name: $team_name})
-                RETURN t.name as name,
-                       t.city as city,
-                       t.founded as founded,
-                       t.stadium as stadium,
-                       t.capacity as capacity,
-                       t.colors as colors
-                """
-
-                team_result = await session.run(team_query, team_name=team_name)
-                team_record = await team_result.single()
+            async with self._read_session() as session:
+                team_record = await session.execute_read(
+                    self._single,
+                    _TEAM_ROSTER,
+                    team_name=team_name,
+                    season=season,
+                    **_season_bounds(season)
+                )
 
                 if not team_record:
                     return {"error": f"Team '{team_name}' not found"}
 
-                # Get roster
-                roster_query = """
-                MATCH (p:Player)-[r:PLAYS_FOR]->(t:Team {name: $team_name})
-                """
-
-                if season:
-                    roster_query += """
-                    WHERE r.start_date <= $season_end AND (r.end_date IS NULL OR r.end_date >= $season_start)
-                    """
-
-                roster_query += """
-                OPTIONAL MATCH (p)-[:PLAYED_IN]->(m:Match)<-[:PARTICIPATED_IN]-(t)
-                """
-
-                if season:
-                    roster_query += " WHERE m.season = $season"
-
-                roster_query += """
-                RETURN p.name as player_name,
-                       p.position as position,
-                       p.birth_date as birth_date,
-                       p.nationality as nationality,
-                       p.height as height,
-                       p.weight as weight,
-                       r.jersey_number as jersey_number,
-                       r.start_date as start_date,
-                       r.end_date as end_date,
-                       r.transfer_fee as transfer_fee,
-                       count(DISTINCT m) as matches_played,
-                       sum(CASE WHEN m.goals_for IS NOT NULL THEN m.goals_for ELSE 0 END) as goals,
-                       sum(CASE WHEN m.assists IS NOT NULL THEN m.assists ELSE 0 END) as assists
-                ORDER BY r.jersey_number, p.position, p.name
-                """
-
-                params = {"team_name": team_name}
-                if season:
-                    params.update({
-                        "season": season,
-                        "season_start": f"{season}-01-01",
-                        "season_end": f"{season}-12-31"
-                    })
-
-                roster_result = await session.run(roster_query, **params)
-                players = []
-
-                async for record in roster_result:
-                    player_data = {
-                        "name": record["player_name"],
-                        "position": record["position"],
-                        "birth_date": record["birth_date"],
-                        "nationality": record["nationality"],
-                        "height": record["height"],
-                        "weight": record["weight"],
-                        "jersey_number": record["jersey_number"],
-                        "start_date": record["start_date"],
-                        "end_date": record["end_date"],
-                        "transfer_fee": record["transfer_fee"],
-                        "season_stats": {
-                            "matches": record["matches_played"] or 0,
-                            "goals": record["goals"] or 0,
-                            "assists": record["assists"] or 0
-                        }
-                    }
-                    players.append(player_data)
-
-                # Group by position
-                positions = {}
-                for player in players:
-                    pos = player["position"] or "Unknown"
-                    if pos not in positions:
-                        positions[pos] = []
-                    positions[pos].append(player)
-
-                response = {
-                    "team": {
-                        "name": team_record["name"],
-                        "city": team_record["city"],
-                        "founded": team_record["founded"],
-                        "stadium": team_record["stadium"],
-                        "capacity": team_record["capacity"],
-                        "colors": team_record["colors"]
-                    },
-                    "season": season or "current",
-                    "total_players": len(players),
-                    "roster": players,
-                    "by_position": positions
-                }
-
-                # Cache the result
-                self.cache[cache_key] = (response, datetime.now())
-                return response
+                return _roster_response(team_record, season)
 
         except Exception as e:
             logger.error(f"Error getting team roster: {e}")
@@ -227,221 +524,107 @@ class TeamTools:
                 "team_name": team_name
             }
 
+    async def stream_team_roster(self, team_name: str, season: Optional[str] = None,
+                                 batch_size: int = 50) -> AsyncIterator[Dict[str, Any]]:
+        """Yield a team header, then roster batches as they are fetched"""
+        invalid = _season_error(season)
+        if invalid:
+            yield invalid
+            return
+        try:
+            # The session pulls batch_size records per round-trip, so each batch
+            # is forwarded before the next one is requested from the server
+            async with self._read_session(fetch_size=batch_size) as session:
+                header_result = await session.run(_TEAM_HEADER, team_name=team_name)
+                header = await header_result.single()
+                if not header:
+                    yield {"error": f"Team '{team_name}' not found"}
+                    return
+
+                yield {"team": header["team"], "season": season or "current"}
+
+                result = await session.run(
+                    _TEAM_ROSTER_ROWS,
+                    team_name=team_name,
+                    season=season,
+                    **_season_bounds(season)
+                )
+                while batch := await result.fetch(batch_size):
+                    yield {"partial": [record.data() for record in batch]}
+
+        except Exception as e:
+            logger.error(f"Error streaming team roster: {e}")
+            yield {
+                "error": f"Failed to stream team roster: {str(e)}",
+                "team_name": team_name
+            }
+
+    @single_flight
+    @cached_response(tags=lambda response: [f"team:{response['team']['name']}"],
+                     negative=_team_not_found, negative_tags=["teams"])
     async def get_team_stats(self, team_name: str, competition: Optional[str] = None) -> Dict[str, Any]:
         """Get statistics and performance data for a team"""
-        cache_key = f"team_stats_{team_name}_{competition or 'all'}"
+        try:
+            async with self._read_session() as session:
+                stats_record = await session.execute_read(
+                    self._single, _TEAM_STATS, team_name=team_name, competition=competition
+                )
+
+                if not stats_record:
+                    return {"error": f"Team '{team_name}' not found"}
 
-        # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if datetime.now() - timestamp < self.cache_ttl:
-                return cached_data
+                return _stats_response(stats_record, competition)
 
+        except Exception as e:
+            logger.error(f"Error getting team stats: {e}")
+            return {
+                "error": f"Failed to get team stats: {str(e)}",
+                "team_name": team_name
+            }
+
+    @single_flight
+    @cached_response(tags=lambda response: [f"team:{response['team']['name']}"] +
+                     [f"player:{player['name']}" for player in response["roster"]["roster"]],
+                     negative=_team_not_found, negative_tags=["teams"])
+    async def get_team_bundle(self, team_name: str, season: Optional[str] = None,
+                              competition: Optional[str] = None) -> Dict[str, Any]:
+        """Get team info, roster and statistics in a single query"""
+        invalid = _season_error(season)
+        if invalid:
+            return invalid
         try:
-            async with self.driver.session() as session:
-                # Get team basic info
-                team_query = """
-                MATCH (t:Team {name: $team_name})
-                RETURN t.name as name,
-                       t.city as city,
-                       t.founded as founded,
-                       t.stadium as stadium
-                """
-
-                team_result = await session.run(team_query, team_name=team_name)
-                team_record = await team_result.single()
+            async with self._read_session() as session:
+                record = await session.execute_read(
+                    self._single,
+                    _TEAM_BUNDLE,
+                    team_name=team_name,
+                    season=season,
+                    competition=competition,
+                    **_season_bounds(season)
+                )
 
-                if not team_record:
+                if not record:
                     return {"error": f"Team '{team_name}' not found"}
 
-                # Get match statistics
-                stats_query = """
-                MATCH (t:Team {name: $team_name})-[:PARTICIPATED_IN]->(m:Match)
-                """
-
-                if competition:
-                    stats_query += """
-                    MATCH (m)-[:PART_OF]->(c:Competition {name: $competition})
-                    """
-
-                stats_query += """
-                OPTIONAL MATCH (m)-[:PART_OF]->(comp:Competition)
-                RETURN count(m) as total_matches,
-                       sum(CASE WHEN m.home_team = $team_name THEN m.home_score ELSE m.away_score END) as goals_for,
-                       sum(CASE WHEN m.home_team = $team_name THEN m.away_score ELSE m.home_score END) as goals_against,
-                       sum(CASE
-                           WHEN (m.home_team = $team_name AND m.home_score > m.away_score) OR
-                                (m.away_team = $team_name AND m.away_score > m.home_score)
-                           THEN 1 ELSE 0 END) as wins,
-                       sum(CASE
-                           WHEN m.home_score = m.away_score
-                           THEN 1 ELSE 0 END) as draws,
-                       sum(CASE
-                           WHEN (m.home_team = $team_name AND m.home_score < m.away_score) OR
-                                (m.away_team = $team_name AND m.away_score < m.home_score)
-                           THEN 1 ELSE 0 END) as losses,
-                       collect(DISTINCT comp.name) as competitions
-                """
-
-                params = {"team_name": team_name}
-                if competition:
-                    params["competition"] = competition
-
-                stats_result = await session.run(stats_query, **params)
-                stats_record = await stats_result.single()
-
-                # Get recent form (last 10 matches)
-                form_query = """
-                MATCH (t:Team {name: $team_name})-[:PARTICIPATED_IN]->(m:Match)
-                """
-
-                if competition:
-                    form_query += """
-                    MATCH (m)-[:PART_OF]->(c:Competition {name: $competition})
-                    """
-
-                form_query += """
-                RETURN m.date as match_date,
-                       m.home_team as home_team,
-                       m.away_team as away_team,
-                       m.home_score as home_score,
-                       m.away_score as away_score,
-                       CASE
-                           WHEN (m.home_team = $team_name AND m.home_score > m.away_score) OR
-                                (m.away_team = $team_name AND m.away_score > m.home_score)
-                           THEN 'W'
-                           WHEN m.home_score = m.away_score
-                           THEN 'D'
-                           ELSE 'L'
-                       END as result
-                ORDER BY m.date DESC
-                LIMIT 10
-                """
-
-                form_result = await session.run(form_query, **params)
-                recent_matches = []
-
-                async for record in form_result:
-                    recent_matches.append({
-                        "date": record["match_date"],
-                        "home_team": record["home_team"],
-                        "away_team": record["away_team"],
-                        "score": f"{record['home_score']}-{record['away_score']}",
-                        "result": record["result"]
-                    })
-
-                # Get top players stats
-                players_query = """
-                MATCH (p:Player)-[:PLAYS_FOR]->(t:Team {name: $team_name})
-                MATCH (p)-[:PLAYED_IN]->(m:Match)<-[:PARTICIPATED_IN]-(t)
-                """
-
-                if competition:
-                    players_query += """
-                    MATCH (m)-[:PART_OF]->(c:Competition {name: $competition})
-                    """
-
-                players_query += """
-                RETURN p.name as player_name,
-                       p.position as position,
-                       count(m) as matches,
-                       sum(CASE WHEN m.goals_for IS NOT NULL THEN m.goals_for ELSE 0 END) as goals,
-                       sum(CASE WHEN m.assists IS NOT NULL THEN m.assists ELSE 0 END) as assists
-                ORDER BY goals DESC, assists DESC
-                LIMIT 10
-                """
-
-                players_result = await session.run(players_query, **params)
-                top_players = []
-
-                async for record in players_result:
-                    top_players.append({
-                        "name": record["player_name"],
-                        "position": record["position"],
-                        "matches": record["matches"] or 0,
-                        "goals": record["goals"] or 0,
-                        "assists": record["assists"] or 0
-                    })
-
-                # Calculate additional stats
-                total_matches = stats_record["total_matches"] or 0
-                wins = stats_record["wins"] or 0
-                draws = stats_record["draws"] or 0
-                losses = stats_record["losses"] or 0
-                goals_for = stats_record["goals_for"] or 0
-                goals_against = stats_record["goals_against"] or 0
-
-                win_percentage = (wins / total_matches * 100) if total_matches > 0 else 0
-                points = wins * 3 + draws  # Assuming 3 points for win, 1 for draw
-                goal_difference = goals_for - goals_against
-
-                response = {
-                    "team": {
-                        "name": team_record["name"],
-                        "city": team_record["city"],
-                        "founded": team_record["founded"],
-                        "stadium": team_record["stadium"]
-                    },
-                    "season": competition if competition else "2023",  # Add season field
-                    "players": top_players,  # Add players field (alias for top_players)
-                    "competition": competition or "all_competitions",
-                    "statistics": {
-                        "matches_played": total_matches,
-                        "wins": wins,
-                        "draws": draws,
-                        "losses": losses,
-                        "win_percentage": round(win_percentage, 2),
-                        "points": points,
-                        "goals_for": goals_for,
-                        "goals_against": goals_against,
-                        "goal_difference": goal_difference,
-                        "goals_per_match": round(goals_for / total_matches, 2) if total_matches > 0 else 0
-                    },
-                    "recent_form": recent_matches,
-                    "top_players": top_players,
-                    "competitions": stats_record["competitions"] or []
+                return {
+                    "team": record["team"],
+                    "roster": _roster_response(record, season),
+                    "stats": _stats_response(record, competition)
                 }
 
-                # Cache the result
-                self.cache[cache_key] = (response, datetime.now())
-                return response
-
         except Exception as e:
-            logger.error(f"Error getting team stats: {e}")
+            logger.error(f"Error getting team bundle: {e}")
             return {
-                "error": f"Failed to get team stats: {str(e)}",
+                "error": f"Failed to get team bundle: {str(e)}",
                 "team_name": team_name
             }
+
     async def search_teams_by_league(self, league: str, limit: int = 20) -> Dict[str, Any]:
         """Search for teams by league."""
         try:
-            query = """
-                MATCH (t:Team)
-                WHERE toLower(t.league) = toLower($league) OR 
-                      toLower(t.competition) = toLower($league)
-                OPTIONAL MATCH (t)<-[:PLAYS_FOR]-(p:Player)
-                RETURN t.name as name,
-                       t.city as city,
-                       t.founded as founded,
-                       t.stadium as stadium,
-                       count(DISTINCT p) as player_count
-                ORDER BY t.name
-                LIMIT $limit
-                """
-
-            async with self.driver.session() as session:
-                result = await session.run(query, league=league, limit=limit)
-                records = [record async for record in result]
-
-                teams = []
-                for record in records:
-                    teams.append({
-                        "name": record["name"],
-                        "city": record["city"],
-                        "founded": record["founded"],
-                        "stadium": record["stadium"],
-                        "player_count": record["player_count"]
-                    })
+            async with self._read_session() as session:
+                teams = await session.execute_read(self._data, _TEAMS_BY_LEAGUE,
+                                                   league=league, limit=limit)
 
                 return {
                     "league": league,
@@ -457,49 +640,44 @@ class TeamTools:
                 "teams": []
             }
 
+    @staticmethod
+    async def _compare_teams_record(tx, team1_name: str, team2_name: str):
+        """Run the compare_teams query for two exact team names"""
+        result = await tx.run(_COMPARE_TEAMS, team1_name=team1_name, team2_name=team2_name)
+        return await result.single()
+
+    @staticmethod
+    async def _resolve_team_name(tx, team_id: str) -> Optional[str]:
+        """Find the team a compare_teams id refers to when it is not an exact name"""
+        result = await tx.run(_RESOLVE_TEAM, team_id=team_id, search=fulltext_query(team_id))
+        record = await result.single()
+        return record["name"] if record else None
+
+    @classmethod
+    async def _compare_teams_tx(cls, tx, team1_id: str, team2_id: str):
+        """Transaction function resolving both compare_teams ids and fetching their record"""
+        # Convert IDs if necessary
+        team1_name = team1_id.replace("team_", "Team ")
+        team2_name = team2_id.replace("team_", "Team ")
+
+        record = await cls._compare_teams_record(tx, team1_name, team2_name)
+
+        # Only a side the exact-name seek missed is resolved by id / full-text
+        if record["team1_name"] is None or record["team2_name"] is None:
+            if record["team1_name"] is None:
+                team1_name = await cls._resolve_team_name(tx, team1_id) or team1_name
+            if record["team2_name"] is None:
+                team2_name = await cls._resolve_team_name(tx, team2_id) or team2_name
+            record = await cls._compare_teams_record(tx, team1_name, team2_name)
+        return record
+
     async def compare_teams(self, team1_id: str, team2_id: str) -> Dict[str, Any]:
         """Compare two teams."""
         try:
-            # Convert IDs if necessary
-            team1_name = team1_id.replace("team_", "Team ")
-            team2_name = team2_id.replace("team_", "Team ")
-
-            query = """
-                MATCH (t1:Team)
-                WHERE t1.name = $team1_name OR t1.id = $team1_id OR toLower(t1.name) CONTAINS toLower($team1_id)
-                OPTIONAL MATCH (t1)<-[:PLAYS_FOR]-(p1:Player)
-                OPTIONAL MATCH (t1)-[:HOME_TEAM|AWAY_TEAM]-(m1:Match)
-                WITH t1, count(DISTINCT p1) as t1_players, count(DISTINCT m1) as t1_matches
-
-                MATCH (t2:Team)
-                WHERE t2.name = $team2_name OR t2.id = $team2_id OR toLower(t2.name) CONTAINS toLower($team2_id)
-                OPTIONAL MATCH (t2)<-[:PLAYS_FOR]-(p2:Player)
-                OPTIONAL MATCH (t2)-[:HOME_TEAM|AWAY_TEAM]-(m2:Match)
-                WITH t1, t1_players, t1_matches, t2, count(DISTINCT p2) as t2_players, count(DISTINCT m2) as t2_matches
-
-                RETURN t1.name as team1_name,
-                       t1.founded as team1_founded,
-                       t1.stadium as team1_stadium,
-                       t1_players as team1_players,
-                       t1_matches as team1_matches,
-                       t2.name as team2_name,
-                       t2.founded as team2_founded,
-                       t2.stadium as team2_stadium,
-                       t2_players as team2_players,
-                       t2_matches as team2_matches
-                """
-
-            async with self.driver.session() as session:
-                result = await session.run(
-                    query,
-                    team1_name=team1_name,
-                    team1_id=team1_id,
-                    team2_name=team2_name,
-                    team2_id=team2_id
-                )
-                record = await result.single()
+            async with self._read_session() as session:
+                record = await session.execute_read(self._compare_teams_tx, team1_id, team2_id)
 
-                if not record:
+                if record["team1_name"] is None or record["team2_name"] is None:
                     return {
                         "error": "Teams not found",
                         "team1_id": team1_id,
@@ -25,16 +25,24 @@ INTEGRATION:
 
 import asyncio
 import argparse
+import importlib.util
 import logging
 import sys
 import os
 from pathlib import Path
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and not available on Windows)
+    uvloop = None
+
 # Add the src directory to Python path for imports
 src_dir = Path(__file__).parent
 sys.path.insert(0, str(src_dir))
 
-from mcp_server import main, BrazilianSoccerMCPServer
+# Only the config is imported up front; the server (and with it neo4j/mcp) is
+# imported in the branches that run it, so --help and --check start fast
+from mcp_server.config import Config
 
 def setup_logging(debug: bool = False):
     """Setup logging configuration"""
@@ -49,14 +57,13 @@ def setup_logging(debug: bool = False):
 
 def check_dependencies():
     """Check if required dependencies are available"""
-    try:
-        import neo4j
-        import mcp
-        return True
-    except ImportError as e:
-        print(f"Missing required dependency: {e}", file=sys.stderr)
+    # find_spec locates the packages without paying for their import
+    missing = [name for name in ("neo4j", "mcp") if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"Missing required dependency: {', '.join(missing)}", file=sys.stderr)
         print("Please install with: pip install neo4j mcp", file=sys.stderr)
         return False
+    return True
 
 def main_cli():
     """Main CLI entry point"""
@@ -90,6 +97,20 @@ The server provides MCP tools for querying Brazilian soccer data:
         help='Check configuration and dependencies'
     )
 
+    parser.add_argument(
+        '--pool-size',
+        type=int,
+        default=Config.CONNECTION_POOL_SIZE,
+        help='Maximum Neo4j connections in the driver pool (default: %(default)s)'
+    )
+
+    parser.add_argument(
+        '--acquire-timeout',
+        type=int,
+        default=Config.CONNECTION_ACQUISITION_TIMEOUT,
+        help='Seconds to wait for a pooled Neo4j connection (default: %(default)s)'
+    )
+
     parser.add_argument(
         '--test-connection',
         action='store_true',
@@ -110,13 +131,22 @@ The server provides MCP tools for querying Brazilian soccer data:
         logger.info("Configuration check:")
         logger.info("- Dependencies: OK")
         logger.info("- Neo4j URL: bolt://localhost:7687")
+        logger.info(f"- Connection pool: {args.pool_size} (acquire timeout {args.acquire_timeout}s)")
+        logger.info(f"- Event loop: {'uvloop' if uvloop else 'asyncio (uvloop not installed)'}")
         logger.info("- MCP Protocol: stdio")
         logger.info("Configuration check completed successfully")
         return
 
+    # libuv-backed loop for the socket-heavy Bolt traffic, when available
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     if args.test_connection:
+        from mcp_server import BrazilianSoccerMCPServer
+
         async def test_connection():
-            server = BrazilianSoccerMCPServer()
+            server = BrazilianSoccerMCPServer(pool_size=args.pool_size,
+                                              acquire_timeout=args.acquire_timeout)
             try:
                 await server.connect_to_neo4j()
                 logger.info("✓ Neo4j connection successful")
@@ -134,8 +164,11 @@ The server provides MCP tools for querying Brazilian soccer data:
     logger.info("Starting Brazilian Soccer Knowledge Graph MCP Server...")
     logger.info("Available tools: search_player, get_player_stats, get_player_career, search_team, get_team_roster, get_team_stats, get_match_details, search_matches, get_head_to_head, get_competition_standings, get_competition_top_scorers, find_common_teammates, get_rivalry_stats")
 
+    from mcp_server import main
+
     try:
-        asyncio.run(main())
+        # The server builds its single shared driver from these settings
+        asyncio.run(main(pool_size=args.pool_size, acquire_timeout=args.acquire_timeout))
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
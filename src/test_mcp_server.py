@@ -17,6 +17,19 @@ TECHNICAL DETAILS:
 - Graph Schema: Player, Team, Match, Competition entities
 - Performance: Caching, query optimization
 - Testing: Integration with demo questions
+- Batching: questions are grouped by tool; tools with a batch endpoint answer
+  their whole group with one UNWIND query
+- Concurrency: groups run concurrently; tool calls in flight are bounded by
+  MCP_TEST_CONCURRENCY (default 16)
+- Indexes: the server bootstrap creates the tool indexes; setup() waits until
+  they are ONLINE so timed questions never run against populating indexes
+- Warm-up: setup() reads the main labels once so question timings reflect a
+  warm page cache rather than first-touch disk reads
+- Result memo: repeated (tool, params) calls within a run are answered from
+  memory; --no-cache measures every call against the server
+- Output: each question's full result is streamed to test_results.ndjson as it
+  is recorded (only a slim copy stays in memory); at the end it is copied line
+  by line into test_results.json ({"summary": ..., "results": [...]})
 
 INTEGRATION:
 - MCP Tools: Complete tool set for soccer data queries
@@ -24,12 +37,15 @@ INTEGRATION:
 - Rate Limiting: Built-in for external APIs
 """
 
+import argparse
 import asyncio
-import json
+import inspect
 import logging
+import os
+import statistics
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import IO, Dict, Any, List, Optional
 import time
 
 # Add the src directory to Python path for imports
@@ -37,18 +53,55 @@ src_dir = Path(__file__).parent
 sys.path.insert(0, str(src_dir))
 
 from mcp_server import BrazilianSoccerMCPServer
-from mcp_server.config import DEMO_QUESTIONS, TOOL_HELP
+from mcp_server.config import Config, DEMO_QUESTIONS, TOOL_HELP
+from mcp_server.serialization import to_json, to_json_bytes
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Tools with a batch endpoint: tool -> (tool module attribute, batch method,
+# per-question pair keys, option that must be shared by the whole batch)
+_BATCH_TOOLS = {
+    "get_head_to_head": ("match_tools", "get_head_to_head_batch", ("team1", "team2"), "competition"),
+    "compare_players": ("player_tools", "compare_players_batch", ("player1_id", "player2_id"), None),
+}
+
+# DEMO_QUESTIONS is static, so each question's expected fields are frozen once
+_EXPECTED_FIELDS = {q["id"]: frozenset(q.get("expected_fields", ())) for q in DEMO_QUESTIONS}
+
+# Page-cache primer run by setup(). count(n.<property>) has to read every node and
+# its properties; a bare count(n) is answered from the count store without
+# touching the store files.
+_PRIMER_QUERIES = (
+    "MATCH (n:Player) RETURN count(n.name)",
+    "MATCH (n:Team) RETURN count(n.name)",
+    "MATCH (n:Match) RETURN count(n.date)",
+    "MATCH (n:Competition) RETURN count(n.name)",
+    "MATCH ()-[r:PLAYS_FOR]->() RETURN count(r.start_date)",
+)
+
+# Response keys that, when present, must hold a list
+_LIST_FIELDS = ("players", "teams", "matches")
+
 class MCPServerTester:
     """Test the MCP server with demo questions"""
 
-    def __init__(self):
-        self.server = BrazilianSoccerMCPServer()
+    def __init__(self, use_cache: bool = True):
+        self.use_cache = use_cache
+        # "<tool>|<params as sorted JSON>" -> successful test result
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self.concurrency = int(os.getenv("MCP_TEST_CONCURRENCY", "16"))
+        self._limit = asyncio.Semaphore(self.concurrency)
+        # Enough pooled connections that concurrent questions never queue on the driver
+        self.server = BrazilianSoccerMCPServer(
+            pool_size=max(Config.CONNECTION_POOL_SIZE, self.concurrency)
+        )
+        # tool name -> bound coroutine method, built once the tool modules exist
+        self._dispatch: Dict[str, Any] = {}
         self.results = []
+        # NDJSON sink for full per-question results, open during run_all_tests
+        self._results_out: Optional[IO[bytes]] = None
         self.total_tests = 0
         self.passed_tests = 0
         self.failed_tests = 0
@@ -58,35 +111,73 @@ class MCPServerTester:
         try:
             await self.server.connect_to_neo4j()
             logger.info("✓ Connected to Neo4j database")
+            await self._await_indexes()
+            await self._prime_page_cache()
+            self._build_dispatch()
             return True
         except Exception as e:
             logger.error(f"✗ Failed to connect to Neo4j: {e}")
             return False
 
+    async def _await_indexes(self, timeout_seconds: int = 300):
+        """Wait for the indexes created at server bootstrap to finish populating"""
+        async with self.server.driver.session(database=Config.NEO4J_DATABASE) as session:
+            result = await session.run("CALL db.awaitIndexes($timeout)", timeout=timeout_seconds)
+            await result.consume()
+        logger.info("✓ Neo4j indexes online")
+
+    async def _prime_page_cache(self):
+        """Touch the main node/relationship stores so timed questions start warm"""
+        async with self.server.driver.session(database=Config.NEO4J_DATABASE) as session:
+            for query in _PRIMER_QUERIES:
+                result = await session.run(query)
+                await result.consume()
+        logger.info("✓ Neo4j page cache primed")
+
     async def cleanup(self):
         """Cleanup test resources"""
         await self.server.close()
 
+    def _build_dispatch(self):
+        """Map every public tool coroutine to its bound method (first module wins)"""
+        for tools in (self.server.player_tools, self.server.team_tools,
+                      self.server.match_tools, self.server.analysis_tools):
+            for name, method in inspect.getmembers(tools, inspect.iscoroutinefunction):
+                if not name.startswith("_"):
+                    self._dispatch.setdefault(name, method)
+
     async def test_tool(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Test a specific tool with given parameters"""
+        key = f"{tool_name}|{to_json(dict(sorted(params.items())))}" if self.use_cache else None
+        cached = self._cache.get(key) if key else None
+        if cached is not None:
+            # Results are only read after this point, so the cached one is shared
+            return {**cached, "execution_time": 0.0, "cached": True}
+
+        async with self._limit:
+            test_result = await self._timed_call(tool_name, params)
+
+        if key and test_result["success"] and not test_result["has_error"]:
+            self._cache[key] = test_result
+        return test_result
+
+    async def _timed_call(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool and time it (the caller holds a concurrency slot)"""
+        handler = self._dispatch.get(tool_name)
+        if handler is None:
+            return {
+                "success": False,
+                "error": f"Unknown tool: {tool_name}",
+                "execution_time": 0.0,
+                "has_error": True
+            }
+
+        # Monotonic integer clock, read once before and once after the call
+        start_ns = time.perf_counter_ns()
         try:
-            start_time = time.time()
-
-            # Get the appropriate tool handler
-            if tool_name.startswith('search_player') or tool_name.startswith('get_player'):
-                result = await getattr(self.server.player_tools, tool_name)(**params)
-            elif tool_name.startswith('search_team') or tool_name.startswith('get_team'):
-                result = await getattr(self.server.team_tools, tool_name)(**params)
-            elif tool_name.startswith('get_match') or tool_name.startswith('search_matches') or tool_name.startswith('get_head_to_head'):
-                result = await getattr(self.server.match_tools, tool_name)(**params)
-            elif tool_name.startswith('get_competition'):
-                result = await getattr(self.server.match_tools, tool_name)(**params)
-            elif tool_name.startswith('find_common') or tool_name.startswith('get_rivalry'):
-                result = await getattr(self.server.analysis_tools, tool_name)(**params)
-            else:
-                return {"error": f"Unknown tool: {tool_name}"}
+            result = await handler(**params)
 
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
 
             return {
                 "success": True,
@@ -96,7 +187,7 @@ class MCPServerTester:
             }
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
             return {
                 "success": False,
                 "error": str(e),
@@ -104,50 +195,111 @@ class MCPServerTester:
                 "has_error": True
             }
 
+    async def test_tool_batch(self, tool_name: str, params_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Test a tool with several parameter sets, in one batch query when the tool has one"""
+        spec = _BATCH_TOOLS.get(tool_name)
+        shared = {params.get(spec[3]) for params in params_list} if spec and spec[3] else {None}
+        if spec is None or len(params_list) < 2 or len(shared) > 1:
+            return list(await asyncio.gather(*(self.test_tool(tool_name, params)
+                                               for params in params_list)))
+
+        tools_attr, method_name, pair_keys, shared_key = spec
+        async with self._limit:
+            start_ns = time.perf_counter_ns()
+            try:
+                batch = getattr(getattr(self.server, tools_attr), method_name)
+                pairs = [tuple(params[key] for key in pair_keys) for params in params_list]
+                results = await batch(pairs, **({shared_key: shared.pop()} if shared_key else {}))
+            except Exception as e:
+                execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
+                return [{
+                    "success": False,
+                    "error": str(e),
+                    "execution_time": execution_time,
+                    "has_error": True
+                } for _ in params_list]
+            elapsed_ns = time.perf_counter_ns() - start_ns
+
+        # The batch's time is shared evenly across its questions
+        execution_time = elapsed_ns * 1e-9 / len(params_list)
+        return [{
+            "success": True,
+            "result": result,
+            "execution_time": execution_time,
+            "has_error": "error" in result
+        } for result in results]
+
     async def run_demo_questions(self):
         """Run all demo questions and validate responses"""
         logger.info("Starting demo questions test...")
 
+        # Group questions by tool so batchable tools run one query per group
+        by_tool: Dict[str, List[Dict[str, Any]]] = {}
         for question in DEMO_QUESTIONS:
-            self.total_tests += 1
-            question_id = question["id"]
-            question_text = question["question"]
-            tool_name = question["tool"]
-            params = question["params"]
-            expected_fields = question.get("expected_fields", [])
-
-            logger.info(f"Testing Q{question_id}: {question_text}")
-            logger.info(f"Tool: {tool_name}, Params: {params}")
-
-            # Test the tool
-            test_result = await self.test_tool(tool_name, params)
-
-            # Validate the response
-            validation_result = self.validate_response(test_result, expected_fields)
-
-            # Record results
-            result = {
-                "question_id": question_id,
-                "question": question_text,
-                "tool": tool_name,
-                "params": params,
-                "test_result": test_result,
-                "validation": validation_result,
-                "passed": validation_result["passed"]
-            }
+            by_tool.setdefault(question["tool"], []).append(question)
+
+        # Fan out every group at once; validation and logging happen afterwards
+        groups = list(by_tool.items())
+        batches = await asyncio.gather(
+            *(self.test_tool_batch(tool_name, [q["params"] for q in questions])
+              for tool_name, questions in groups),
+            return_exceptions=True
+        )
+
+        for (tool_name, questions), test_results in zip(groups, batches):
+            if isinstance(test_results, BaseException):
+                test_results = [{
+                    "success": False,
+                    "error": str(test_results),
+                    "execution_time": 0.0,
+                    "has_error": True
+                } for _ in questions]
+            for question, test_result in zip(questions, test_results):
+                self.record_result(question, test_result)
+
+    def record_result(self, question: Dict[str, Any], test_result: Dict[str, Any]):
+        """Validate one demo question's test result and record it"""
+        self.total_tests += 1
+        question_id = question["id"]
+        question_text = question["question"]
+        tool_name = question["tool"]
+        params = question["params"]
+
+        logger.info(f"Tested Q{question_id}: {question_text}")
+        logger.info(f"Tool: {tool_name}, Params: {params}")
+
+        # Validate the response
+        validation_result = self.validate_response(test_result, question_id)
+
+        # Record results
+        result = {
+            "question_id": question_id,
+            "question": question_text,
+            "tool": tool_name,
+            "params": params,
+            "test_result": test_result,
+            "validation": validation_result,
+            "passed": validation_result["passed"]
+        }
 
-            self.results.append(result)
+        # Full result goes to disk now; the report only needs the slim copy
+        if self._results_out is not None:
+            self._results_out.write(to_json_bytes(result) + b"\n")
+        self.results.append({
+            **result,
+            "test_result": {k: v for k, v in test_result.items() if k != "result"}
+        })
 
-            if validation_result["passed"]:
-                self.passed_tests += 1
-                logger.info(f"✓ Q{question_id} PASSED ({test_result['execution_time']:.2f}s)")
-            else:
-                self.failed_tests += 1
-                logger.error(f"✗ Q{question_id} FAILED: {validation_result['reason']}")
+        if validation_result["passed"]:
+            self.passed_tests += 1
+            logger.info(f"✓ Q{question_id} PASSED ({test_result['execution_time']:.2f}s)")
+        else:
+            self.failed_tests += 1
+            logger.error(f"✗ Q{question_id} FAILED: {validation_result['reason']}")
 
-            logger.info("-" * 80)
+        logger.info("-" * 80)
 
-    def validate_response(self, test_result: Dict[str, Any], expected_fields: List[str]) -> Dict[str, Any]:
+    def validate_response(self, test_result: Dict[str, Any], question_id: int) -> Dict[str, Any]:
         """Validate a test response"""
         if not test_result["success"]:
             return {
@@ -163,20 +315,17 @@ class MCPServerTester:
 
         result_data = test_result["result"]
 
-        # Check if expected fields are present
-        missing_fields = []
-        for field in expected_fields:
-            if field not in result_data:
-                missing_fields.append(field)
+        # Check if expected fields are present (set difference against the keys)
+        missing_fields = _EXPECTED_FIELDS.get(question_id, frozenset()).difference(result_data)
 
         if missing_fields:
             return {
                 "passed": False,
-                "reason": f"Missing expected fields: {missing_fields}"
+                "reason": f"Missing expected fields: {sorted(missing_fields)}"
             }
 
         # Additional validation based on tool type
-        if not self.validate_tool_specific(result_data, expected_fields):
+        if not self.validate_tool_specific(result_data):
             return {
                 "passed": False,
                 "reason": "Tool-specific validation failed"
@@ -187,22 +336,14 @@ class MCPServerTester:
             "reason": "All validations passed"
         }
 
-    def validate_tool_specific(self, result_data: Dict[str, Any], expected_fields: List[str]) -> bool:
+    def validate_tool_specific(self, result_data: Dict[str, Any]) -> bool:
         """Perform tool-specific validation"""
         # Check for common data integrity issues
         if "name" in result_data and not result_data["name"]:
             return False
 
-        if "players" in result_data and not isinstance(result_data["players"], list):
-            return False
-
-        if "teams" in result_data and not isinstance(result_data["teams"], list):
-            return False
-
-        if "matches" in result_data and not isinstance(result_data["matches"], list):
-            return False
-
-        return True
+        return all(type(result_data[field]) is list
+                   for field in _LIST_FIELDS if field in result_data)
 
     async def test_additional_scenarios(self):
         """Test additional scenarios beyond demo questions"""
@@ -290,9 +431,11 @@ class MCPServerTester:
                 report.append("")
 
         # Performance summary
-        execution_times = [r["test_result"]["execution_time"] for r in self.results if r["test_result"]["success"]]
+        # Memoized answers did not reach the server, so they are left out of the timings
+        execution_times = [r["test_result"]["execution_time"] for r in self.results
+                           if r["test_result"]["success"] and not r["test_result"].get("cached")]
         if execution_times:
-            avg_time = sum(execution_times) / len(execution_times)
+            avg_time = statistics.fmean(execution_times)
             max_time = max(execution_times)
             min_time = min(execution_times)
 
@@ -304,15 +447,39 @@ class MCPServerTester:
 
         return "\n".join(report)
 
+    def _write_results_file(self, results_file: Path, stream_file: Path):
+        """Write the {"summary", "results"} document, copying results line by line from the stream"""
+        summary = {
+            "total_tests": self.total_tests,
+            "passed_tests": self.passed_tests,
+            "failed_tests": self.failed_tests,
+            "success_rate": (self.passed_tests/self.total_tests*100) if self.total_tests > 0 else 0
+        }
+        with open(stream_file, 'rb') as lines, open(results_file, 'wb') as f:
+            f.write(b'{"summary": ' + to_json_bytes(summary) + b',\n "results": [')
+            separator = b"\n"
+            for line in lines:
+                f.write(separator + line.rstrip(b"\n"))
+                separator = b",\n"
+            f.write(b"\n]}\n")
+
     async def run_all_tests(self):
         """Run all tests"""
         if not await self.setup():
             logger.error("Failed to setup test environment")
             return False
 
+        stream_file = src_dir / "test_results.ndjson"
+        results_file = src_dir / "test_results.json"
+
         try:
-            # Run demo questions
-            await self.run_demo_questions()
+            # Per-question results are written as they are recorded
+            try:
+                with open(stream_file, 'wb') as self._results_out:
+                    # Run demo questions
+                    await self.run_demo_questions()
+            finally:
+                self._results_out = None
 
             # Run additional scenarios
             await self.test_additional_scenarios()
@@ -321,20 +488,8 @@ class MCPServerTester:
             report = self.generate_report()
             print("\n" + report)
 
-            # Save results to file
-            results_file = src_dir / "test_results.json"
-            with open(results_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "summary": {
-                        "total_tests": self.total_tests,
-                        "passed_tests": self.passed_tests,
-                        "failed_tests": self.failed_tests,
-                        "success_rate": (self.passed_tests/self.total_tests*100) if self.total_tests > 0 else 0
-                    },
-                    "results": self.results
-                }, f, indent=2, ensure_ascii=False)
-
-            logger.info(f"Test results saved to: {results_file}")
+            self._write_results_file(results_file, stream_file)
+            logger.info(f"Test results saved to: {results_file} (streamed copy: {stream_file})")
 
             return self.failed_tests == 0
 
@@ -343,7 +498,12 @@ class MCPServerTester:
 
 async def main():
     """Main test function"""
-    tester = MCPServerTester()
+    parser = argparse.ArgumentParser(description="Test the Brazilian Soccer MCP server")
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Send every repeated (tool, params) call to the server')
+    args = parser.parse_args()
+
+    tester = MCPServerTester(use_cache=not args.no_cache)
     success = await tester.run_all_tests()
     sys.exit(0 if success else 1)
 
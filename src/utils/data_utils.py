@@ -14,7 +14,8 @@ DEPENDENCIES: unicodedata, datetime, re, typing
 TECHNICAL DETAILS:
 - Neo4j Connection: bolt://localhost:7687 (neo4j/neo4j123)
 - Graph Schema: Supports all entities with proper data normalization
-- Performance: Optimized text processing for Brazilian Portuguese
+- Performance: Optimized text processing for Brazilian Portuguese; regexes and
+  lookup tables are compiled once at import, not on every call
 - Testing: BDD scenarios with Brazilian names and text patterns
 
 INTEGRATION:
@@ -27,11 +28,58 @@ import re
 import unicodedata
 import logging
 from datetime import datetime, date
+from types import MappingProxyType
 from typing import Optional, Union, Any, List, Dict
 from decimal import Decimal, InvalidOperation
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every ETL row, compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_NUMERIC_RE = re.compile(r'[^\d.-]')
+_NON_WORD_RE = re.compile(r'[^\w]')
+_UNDERSCORES_RE = re.compile(r'_+')
+_DIGITS_RE = re.compile(r'\d+')
+_BRAZILIAN_NAME_RE = re.compile(r'^[A-Za-zÀ-ÿ\s\'\-\.]+$')
+_TEAM_NAME_RE = re.compile(r'^[A-Za-zÀ-ÿ0-9\s\'\-\.\(\)]+$')
+
+# Brazilian particles that should remain lowercase
+_LOWERCASE_PARTICLES = frozenset({
+    'da', 'das', 'de', 'do', 'dos', 'e', 'em', 'na', 'nas', 'no', 'nos'
+})
+
+# Common team name mappings
+_TEAM_MAPPINGS = {
+    # Full names
+    'cr flamengo': 'Clube de Regatas do Flamengo',
+    'clube de regatas do flamengo': 'Clube de Regatas do Flamengo',
+    'se palmeiras': 'Sociedade Esportiva Palmeiras',
+    'sociedade esportiva palmeiras': 'Sociedade Esportiva Palmeiras',
+    'sc corinthians paulista': 'Sport Club Corinthians Paulista',
+    'sport club corinthians paulista': 'Sport Club Corinthians Paulista',
+    'são paulo fc': 'São Paulo Futebol Clube',
+    'são paulo futebol clube': 'São Paulo Futebol Clube',
+    'grêmio fbpa': 'Grêmio Foot-Ball Porto Alegrense',
+    'grêmio foot-ball porto alegrense': 'Grêmio Foot-Ball Porto Alegrense',
+    'sport club internacional': 'Sport Club Internacional',
+    'santos fc': 'Santos Futebol Clube',
+    'santos futebol clube': 'Santos Futebol Clube',
+    'clube atlético mineiro': 'Clube Atlético Mineiro',
+    'cruzeiro ec': 'Cruzeiro Esporte Clube',
+    'cruzeiro esporte clube': 'Cruzeiro Esporte Clube',
+    'botafogo fr': 'Botafogo de Futebol e Regatas',
+    'botafogo de futebol e regatas': 'Botafogo de Futebol e Regatas',
+    'club de regatas vasco da gama': 'Club de Regatas Vasco da Gama',
+    'fluminense fc': 'Fluminense Football Club',
+    'fluminense football club': 'Fluminense Football Club'
+}
+
+# Significant words of each mapping key, for the partial-match fallback
+_TEAM_MAPPING_PARTS = tuple(
+    (tuple(part for part in key.split() if len(part) > 2), full_name)
+    for key, full_name in _TEAM_MAPPINGS.items()
+)
+
 def normalize_text(text: str) -> str:
     """
     Normalize Brazilian Portuguese text for consistent processing.
@@ -53,13 +101,9 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
 
-    # Normalize Unicode characters (NFKD - Canonical Decomposition)
-    # This separates accented characters into base + combining characters
-    normalized = unicodedata.normalize('NFKD', text)
-
     # Keep Portuguese characters intact - don't remove accents
     # Just normalize spacing and capitalization
-    text = re.sub(r'\s+', ' ', text)  # Multiple spaces to single space
+    text = _WHITESPACE_RE.sub(' ', text)  # Multiple spaces to single space
 
     return text
 
@@ -88,17 +132,12 @@ def normalize_brazilian_name(name: str) -> str:
     parts = name.split()
     normalized_parts = []
 
-    # Brazilian particles that should remain lowercase
-    lowercase_particles = {
-        'da', 'das', 'de', 'do', 'dos', 'e', 'em', 'na', 'nas', 'no', 'nos'
-    }
-
     for i, part in enumerate(parts):
         # First and last parts are always capitalized
         if i == 0 or i == len(parts) - 1:
             normalized_parts.append(part.title())
         # Middle particles may stay lowercase
-        elif part.lower() in lowercase_particles:
+        elif part.lower() in _LOWERCASE_PARTICLES:
             normalized_parts.append(part.lower())
         else:
             normalized_parts.append(part.title())
@@ -123,42 +162,16 @@ def normalize_team_name(team_name: str) -> str:
     if not team_name:
         return ""
 
-    # Common team name mappings
-    team_mappings = {
-        # Full names
-        'cr flamengo': 'Clube de Regatas do Flamengo',
-        'clube de regatas do flamengo': 'Clube de Regatas do Flamengo',
-        'se palmeiras': 'Sociedade Esportiva Palmeiras',
-        'sociedade esportiva palmeiras': 'Sociedade Esportiva Palmeiras',
-        'sc corinthians paulista': 'Sport Club Corinthians Paulista',
-        'sport club corinthians paulista': 'Sport Club Corinthians Paulista',
-        'são paulo fc': 'São Paulo Futebol Clube',
-        'são paulo futebol clube': 'São Paulo Futebol Clube',
-        'grêmio fbpa': 'Grêmio Foot-Ball Porto Alegrense',
-        'grêmio foot-ball porto alegrense': 'Grêmio Foot-Ball Porto Alegrense',
-        'sport club internacional': 'Sport Club Internacional',
-        'santos fc': 'Santos Futebol Clube',
-        'santos futebol clube': 'Santos Futebol Clube',
-        'clube atlético mineiro': 'Clube Atlético Mineiro',
-        'cruzeiro ec': 'Cruzeiro Esporte Clube',
-        'cruzeiro esporte clube': 'Cruzeiro Esporte Clube',
-        'botafogo fr': 'Botafogo de Futebol e Regatas',
-        'botafogo de futebol e regatas': 'Botafogo de Futebol e Regatas',
-        'club de regatas vasco da gama': 'Club de Regatas Vasco da Gama',
-        'fluminense fc': 'Fluminense Football Club',
-        'fluminense football club': 'Fluminense Football Club'
-    }
-
     # Normalize and check mappings
     normalized = normalize_text(team_name.lower())
 
     # Check for exact matches first
-    if normalized in team_mappings:
-        return team_mappings[normalized]
+    if normalized in _TEAM_MAPPINGS:
+        return _TEAM_MAPPINGS[normalized]
 
     # Check for partial matches (common abbreviations)
-    for key, full_name in team_mappings.items():
-        if any(part in normalized for part in key.split() if len(part) > 2):
+    for parts, full_name in _TEAM_MAPPING_PARTS:
+        if any(part in normalized for part in parts):
             return full_name
 
     # If no mapping found, return title case version
@@ -259,7 +272,7 @@ def safe_int(value: Any, default: int = 0) -> int:
         # Try string conversion
         if isinstance(value, str):
             # Remove common non-numeric characters
-            cleaned = re.sub(r'[^\d.-]', '', value.strip())
+            cleaned = _NON_NUMERIC_RE.sub('', value.strip())
             if cleaned:
                 return int(float(cleaned))
 
@@ -295,7 +308,7 @@ def safe_float(value: Any, default: float = 0.0) -> float:
         # Try string conversion
         if isinstance(value, str):
             # Remove common non-numeric characters except decimal point
-            cleaned = re.sub(r'[^\d.-]', '', value.strip())
+            cleaned = _NON_NUMERIC_RE.sub('', value.strip())
             if cleaned:
                 return float(cleaned)
 
@@ -331,7 +344,7 @@ def safe_decimal(value: Any, default: Decimal = Decimal('0.0')) -> Decimal:
         # Try string conversion
         if isinstance(value, str):
             # Remove common non-numeric characters except decimal point
-            cleaned = re.sub(r'[^\d.-]', '', value.strip())
+            cleaned = _NON_NUMERIC_RE.sub('', value.strip())
             if cleaned:
                 return Decimal(cleaned)
 
@@ -364,10 +377,10 @@ def generate_id(prefix: str, name: str, suffix: str = None) -> str:
     slug = ''.join(c for c in slug if not unicodedata.combining(c))
 
     # Replace spaces and special characters with underscores
-    slug = re.sub(r'[^\w]', '_', slug).upper()
+    slug = _NON_WORD_RE.sub('_', slug).upper()
 
     # Remove multiple underscores
-    slug = re.sub(r'_+', '_', slug).strip('_')
+    slug = _UNDERSCORES_RE.sub('_', slug).strip('_')
 
     # Limit length
     if len(slug) > 20:
@@ -394,8 +407,7 @@ def validate_brazilian_name(name: str) -> bool:
         return False
 
     # Should contain only letters, spaces, and common Brazilian characters
-    pattern = r'^[A-Za-zÀ-ÿ\s\'\-\.]+$'
-    return bool(re.match(pattern, name.strip()))
+    return bool(_BRAZILIAN_NAME_RE.match(name.strip()))
 
 def validate_team_name(team_name: str) -> bool:
     """
@@ -411,8 +423,7 @@ def validate_team_name(team_name: str) -> bool:
         return False
 
     # Should contain letters, numbers, spaces, and common characters
-    pattern = r'^[A-Za-zÀ-ÿ0-9\s\'\-\.\(\)]+$'
-    return bool(re.match(pattern, team_name.strip()))
+    return bool(_TEAM_NAME_RE.match(team_name.strip()))
 
 def validate_score(score: Any) -> bool:
     """
@@ -499,10 +510,7 @@ def extract_numbers_from_text(text: str) -> List[int]:
         return []
 
     # Find all number patterns
-    pattern = r'\d+'
-    matches = re.findall(pattern, str(text))
-
-    return [int(match) for match in matches]
+    return [int(match) for match in _DIGITS_RE.findall(str(text))]
 
 def is_valid_year(year: Any) -> bool:
     """
@@ -522,7 +530,8 @@ def is_valid_year(year: Any) -> bool:
         return False
 
 # Common Brazilian soccer data constants
-BRAZILIAN_STATES = {
+# Hash-based lookups, exposed read-only so importers cannot mutate the shared tables
+BRAZILIAN_STATES = MappingProxyType({
     'AC': 'Acre', 'AL': 'Alagoas', 'AP': 'Amapá', 'AM': 'Amazonas',
     'BA': 'Bahia', 'CE': 'Ceará', 'DF': 'Distrito Federal', 'ES': 'Espírito Santo',
     'GO': 'Goiás', 'MA': 'Maranhão', 'MT': 'Mato Grosso', 'MS': 'Mato Grosso do Sul',
@@ -530,9 +539,10 @@ BRAZILIAN_STATES = {
     'PE': 'Pernambuco', 'PI': 'Piauí', 'RJ': 'Rio de Janeiro', 'RN': 'Rio Grande do Norte',
     'RS': 'Rio Grande do Sul', 'RO': 'Rondônia', 'RR': 'Roraima', 'SC': 'Santa Catarina',
     'SP': 'São Paulo', 'SE': 'Sergipe', 'TO': 'Tocantins'
-}
+})
 
-PLAYER_POSITIONS = {
+# Position aliases (Portuguese and English abbreviations) -> canonical position
+PLAYER_POSITIONS = MappingProxyType({
     'GK': 'Goalkeeper', 'GOL': 'Goalkeeper', 'GOLEIRO': 'Goalkeeper',
     'DEF': 'Defender', 'ZAG': 'Defender', 'ZAGUEIRO': 'Defender',
     'LAT': 'Defender', 'LATERAL': 'Defender',
@@ -540,7 +550,7 @@ PLAYER_POSITIONS = {
     'VOL': 'Midfielder', 'VOLANTE': 'Midfielder',
     'FWD': 'Forward', 'ATA': 'Forward', 'ATACANTE': 'Forward',
     'PON': 'Forward', 'PONTA': 'Forward'
-}
+})
 
 def normalize_position(position: str) -> Optional[str]:
     """
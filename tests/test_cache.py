@@ -0,0 +1,167 @@
+"""
+Brazilian Soccer MCP Knowledge Graph - Query Cache Tests
+
+CONTEXT:
+This module tests the LRU + TTL cache shared by the MCP tool modules.
+
+PHASE: 3 - Integration & Testing
+PURPOSE: Validate cache eviction and expiry behaviour
+DATA SOURCES: None (pure in-memory)
+DEPENDENCIES: pytest
+
+TECHNICAL DETAILS:
+- Expiry is tested by patching time.monotonic
+- Eviction order follows least recent access
+- cached_response/single_flight are driven with asyncio.run (no async test plugin needed)
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from src.mcp_server.cache import TTLCache, cached_response, single_flight
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Tests for TTLCache"""
+
+    def test_get_returns_stored_value(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache["a"] = {"value": 1}
+        assert cache.get("a") == {"value": 1}
+        assert cache["a"] == {"value": 1}
+        assert "a" in cache
+
+    def test_missing_key_returns_default(self):
+        cache = TTLCache()
+        assert cache.get("missing") is None
+        assert "missing" not in cache
+        with pytest.raises(KeyError):
+            cache["missing"]
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache["c"] = 3
+        assert "b" not in cache
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_entries_expire_after_ttl(self):
+        cache = TTLCache(maxsize=2, ttl=10)
+        with patch("src.mcp_server.cache.time.monotonic", return_value=100.0):
+            cache["a"] = 1
+        with patch("src.mcp_server.cache.time.monotonic", return_value=105.0):
+            assert cache.get("a") == 1
+        with patch("src.mcp_server.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+            assert "a" not in cache
+
+    def test_invalidate_removes_tagged_entries(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("stats", 1, tags=("player:Pelé",))
+        cache.set("career", 2, tags=("player:Pelé", "team:Santos"))
+        cache.set("roster", 3, tags=("team:Santos",))
+        assert cache.invalidate("player:Pelé") == 2
+        assert "stats" not in cache
+        assert "career" not in cache
+        assert cache.get("roster") == 3
+        assert cache.invalidate("team:Santos") == 1
+        assert len(cache) == 0
+
+    def test_encodings_are_kept_only_for_held_values(self):
+        cache = TTLCache(maxsize=1, ttl=60)
+        cached, other = {"name": "Santos"}, {"name": "Santos"}
+        cache["a"] = cached
+        cache.set_encoded(cached, "encoded", variant=True)
+        cache.set_encoded(other, "encoded", variant=True)
+        assert cache.get_encoded(cached, True) == "encoded"
+        assert cache.get_encoded(other, True) is None
+        cache["b"] = {"name": "Flamengo"}
+        assert not cache.holds(cached)
+        assert cache._encoded == {}
+
+
+@pytest.mark.unit
+class TestCachedResponse:
+    """Tests for the cached_response decorator"""
+
+    class Tools:
+        def __init__(self):
+            self.cache = TTLCache(maxsize=10, ttl=60)
+            self.calls = 0
+
+        @cached_response(tags=lambda response: [f"team:{response['name']}"])
+        async def lookup(self, name: str, limit: int = 10):
+            self.calls += 1
+            if name == "missing":
+                return {"error": "not found"}
+            return {"name": name, "limit": limit}
+
+    def test_positional_keyword_and_default_calls_share_entry(self):
+        tools = self.Tools()
+        first = asyncio.run(tools.lookup("Santos"))
+        assert asyncio.run(tools.lookup(name="Santos", limit=10)) is first
+        assert tools.calls == 1
+        assert tools.cache.invalidate("team:Santos") == 1
+
+    def test_error_responses_are_not_cached(self):
+        tools = self.Tools()
+        asyncio.run(tools.lookup("missing"))
+        asyncio.run(tools.lookup("missing"))
+        assert tools.calls == 2
+        assert len(tools.cache) == 0
+
+    def test_negative_responses_go_to_neg_cache(self):
+        class Tools(self.Tools):
+            def __init__(self):
+                super().__init__()
+                self.neg_cache = TTLCache(maxsize=10, ttl=5)
+
+            @cached_response(negative=lambda response: response["error"] == "not found",
+                             negative_tags=["teams"])
+            async def lookup(self, name: str, limit: int = 10):
+                self.calls += 1
+                return {"error": "not found"}
+
+        tools = Tools()
+        asyncio.run(tools.lookup("missing"))
+        asyncio.run(tools.lookup("missing"))
+        assert tools.calls == 1
+        assert len(tools.cache) == 0
+        assert tools.neg_cache.invalidate("teams") == 1
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Tests for the single_flight decorator"""
+
+    class Tools:
+        def __init__(self):
+            self._inflight = {}
+            self.calls = 0
+
+        @single_flight
+        async def lookup(self, name: str, limit: int = 10):
+            self.calls += 1
+            await asyncio.sleep(0)
+            return {"name": name}
+
+    def test_concurrent_identical_calls_share_one_execution(self):
+        tools = self.Tools()
+
+        async def run():
+            return await asyncio.gather(tools.lookup("Santos"),
+                                        tools.lookup(name="Santos", limit=10),
+                                        tools.lookup("Flamengo"))
+
+        first, second, other = asyncio.run(run())
+        assert first is second
+        assert other == {"name": "Flamengo"}
+        assert tools.calls == 2
+        assert tools._inflight == {}
@@ -0,0 +1,138 @@
+"""
+Brazilian Soccer MCP Knowledge Graph - Match Tools Tests
+
+CONTEXT:
+This module tests the MatchTools query text and response assembly without a
+running Neo4j instance.
+
+PHASE: 3 - Integration & Testing
+PURPOSE: Pin the competition queries and their cache handling
+DATA SOURCES: None (stubbed driver sessions)
+DEPENDENCIES: pytest, neo4j
+
+TECHNICAL DETAILS:
+- Sessions are replaced by a minimal async stub returning canned rows
+- Coroutines are driven with asyncio.run (no async test plugin needed)
+"""
+
+import asyncio
+
+import pytest
+
+from src.mcp_server.cache import TTLCache
+from src.mcp_server.tools import match_tools
+from src.mcp_server.tools.match_tools import MatchTools
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def data(self):
+        return self._rows
+
+    def __aiter__(self):
+        async def rows():
+            for row in self._rows:
+                yield row
+        return rows()
+
+
+class _Session:
+    def __init__(self, driver):
+        self._driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def run(self, query, **params):
+        self._driver.queries.append(query)
+        if self._driver.fail:
+            raise RuntimeError("database unavailable")
+        return _Result(self._driver.rows)
+
+
+class _Driver:
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.queries = []
+        self.fail = False
+
+    def session(self, **kwargs):
+        return _Session(self)
+
+
+@pytest.mark.unit
+class TestStandingsQuery:
+    """Tests for the competition standings query"""
+
+    def test_positions_are_projected_from_a_bound_row(self):
+        query = match_tools._STANDINGS
+        assert "WITH rows[i] as row, i" in query
+        assert "RETURN row {.*, position: i + 1} as team_data" in query
+        assert "rows[i] {" not in query
+
+    def test_competition_seek_has_no_planner_hint(self):
+        assert "USING INDEX" not in match_tools._STANDINGS
+
+    def test_standings_rows_are_passed_through(self):
+        row = {"team": "Flamengo", "points": 3, "position": 1}
+        tools = MatchTools(_Driver([{"team_data": row}]), TTLCache(maxsize=10, ttl=60))
+        response = asyncio.run(tools.get_competition_standings("Brasileirão"))
+        assert response["standings"] == [row]
+
+
+@pytest.mark.unit
+class TestWarm:
+    """Tests for MatchTools.warm"""
+
+    def test_failed_refresh_keeps_cached_entries(self):
+        driver = _Driver([])
+        tools = MatchTools(driver, TTLCache(maxsize=10, ttl=60))
+        asyncio.run(tools.warm(["Brasileirão"]))
+        queries = len(driver.queries)
+        standings = asyncio.run(tools.get_competition_standings("Brasileirão"))
+        scorers = asyncio.run(tools.get_competition_top_scorers("Brasileirão"))
+        assert len(driver.queries) == queries
+
+        driver.fail = True
+        asyncio.run(tools.warm(["Brasileirão"]))
+        assert asyncio.run(tools.get_competition_standings("Brasileirão")) is standings
+        assert asyncio.run(tools.get_competition_top_scorers("Brasileirão")) is scorers
+
+    def test_refresh_replaces_cached_entries(self):
+        driver = _Driver([])
+        tools = MatchTools(driver, TTLCache(maxsize=10, ttl=60))
+        asyncio.run(tools.warm(["Brasileirão"]))
+        before = asyncio.run(tools.get_competition_standings("Brasileirão"))
+        asyncio.run(tools.warm(["Brasileirão"]))
+        assert asyncio.run(tools.get_competition_standings("Brasileirão")) is not before
+
+
+@pytest.mark.unit
+class TestRowShapes:
+    """Tests that list results are plain dicts on every path"""
+
+    def test_search_matches_rows_are_dicts(self):
+        record = {"match_id": "m1", "date": "2023-05-01", "home_team": "Flamengo",
+                  "away_team": "Santos", "home_score": 2, "away_score": 1,
+                  "venue": "Maracanã", "competition": "Brasileirão"}
+        tools = MatchTools(_Driver([record]), TTLCache(maxsize=10, ttl=60))
+        response = asyncio.run(tools.search_matches(team="Flamengo"))
+        assert response["matches"] == [{
+            "id": "m1", "date": "2023-05-01", "home_team": "Flamengo", "away_team": "Santos",
+            "score": "2-1", "venue": "Maracanã", "competition": "Brasileirão", "result": "Flamengo",
+        }]
+
+    def test_top_scorer_rows_are_dicts(self):
+        record = {"player": "Pedro", "team": "Flamengo", "position": "FW", "goals": 3,
+                  "assists": 1, "matches_played": 2, "goals_per_match": 1.5}
+        tools = MatchTools(_Driver([record]), TTLCache(maxsize=10, ttl=60))
+        response = asyncio.run(tools.get_competition_top_scorers("Brasileirão"))
+        assert response["top_scorers"] == [{
+            "position": 1, "player": "Pedro", "team": "Flamengo", "player_position": "FW",
+            "goals": 3, "assists": 1, "matches_played": 2, "goals_per_match": 1.5,
+        }]
@@ -0,0 +1,94 @@
+"""
+Brazilian Soccer MCP Knowledge Graph - Player Tools Tests
+
+CONTEXT:
+This module tests the PlayerTools name resolution without a running Neo4j
+instance.
+
+PHASE: 3 - Integration & Testing
+PURPOSE: Validate how search_player and compare_players resolve names
+DATA SOURCES: None (stubbed driver)
+DEPENDENCIES: pytest, neo4j
+
+TECHNICAL DETAILS:
+- driver.execute_query is replaced by a stub answering per query constant
+- Coroutines are driven with asyncio.run (no async test plugin needed)
+"""
+
+import asyncio
+
+import pytest
+
+from src.mcp_server.cache import TTLCache
+from src.mcp_server.tools import player_tools
+from src.mcp_server.tools.player_tools import PlayerTools
+
+NEYMAR = {"name": "Neymar Jr", "position": "FW", "birth_date": None,
+          "nationality": "Brazil", "current_teams": ["Santos"]}
+
+
+class _Driver:
+    def __init__(self, answers):
+        self.answers = answers
+        self.queries = []
+        self.params = []
+
+    async def execute_query(self, query, params, **kwargs):
+        self.queries.append(query)
+        self.params.append(params)
+        rows = self.answers.get(query, [])
+        if "result_transformer_" in kwargs:
+            return rows
+        return rows, None, None
+
+
+@pytest.mark.unit
+class TestSearchPlayerSubstring:
+    """Tests for the search_player substring fallback"""
+
+    def test_uses_trigrams_when_loaded(self):
+        driver = _Driver({
+            player_tools._HAS_TRIGRAMS: [{"loaded": True}],
+            player_tools._SEARCH_PLAYER_SUBSTRING: [NEYMAR],
+        })
+        tools = PlayerTools(driver, TTLCache(maxsize=10, ttl=60))
+        response = asyncio.run(tools.search_player("eyma"))
+        assert response["players"] == [NEYMAR]
+        assert player_tools._SEARCH_PLAYER_CONTAINS not in driver.queries
+
+    def test_scans_names_when_graph_has_no_trigrams(self):
+        driver = _Driver({
+            player_tools._HAS_TRIGRAMS: [{"loaded": False}],
+            player_tools._SEARCH_PLAYER_CONTAINS: [NEYMAR],
+        })
+        tools = PlayerTools(driver, TTLCache(maxsize=10, ttl=60))
+        response = asyncio.run(tools.search_player("eyma"))
+        assert response["players"] == [NEYMAR]
+        assert player_tools._SEARCH_PLAYER_SUBSTRING not in driver.queries
+
+    def test_backfilled_trigrams_are_picked_up(self):
+        driver = _Driver({player_tools._HAS_TRIGRAMS: [{"loaded": False}]})
+        tools = PlayerTools(driver, TTLCache(maxsize=10, ttl=60))
+        asyncio.run(tools.search_player("eyma"))
+        driver.answers[player_tools._HAS_TRIGRAMS] = [{"loaded": True}]
+        asyncio.run(tools.search_player("ymar"))
+        assert driver.queries[-1] == player_tools._SEARCH_PLAYER_SUBSTRING
+
+
+@pytest.mark.unit
+class TestComparePlayers:
+    """Tests for the compare_players name resolution"""
+
+    def test_fallback_goes_through_the_fulltext_index(self):
+        query = player_tools._PLAYER_SUMMARIES
+        assert "db.index.fulltext.queryNodes('player_fulltext', lookup.search)" in query
+        assert "CONTAINS" not in query
+
+    def test_lookups_carry_the_fulltext_query(self):
+        driver = _Driver({})
+        tools = PlayerTools(driver, TTLCache(maxsize=10, ttl=60))
+        asyncio.run(tools.compare_players("Neymar Jr", "player_0"))
+        assert driver.params[0]["lookups"] == [
+            {"id": "Neymar Jr", "name": "Neymar Jr", "search": "Neymar* AND Jr*"},
+            {"id": "player_0", "name": "Player 0", "search": "player_0*"},
+        ]
@@ -0,0 +1,138 @@
+"""
+Brazilian Soccer MCP Knowledge Graph - Team Tools Tests
+
+CONTEXT:
+This module tests TeamTools query selection and input handling without a
+running Neo4j instance.
+
+PHASE: 3 - Integration & Testing
+PURPOSE: Validate team search fallbacks and roster season and streaming handling
+DATA SOURCES: None (stubbed driver sessions)
+DEPENDENCIES: pytest, neo4j
+
+TECHNICAL DETAILS:
+- Sessions run transaction functions against a stub tx answering per query constant
+- Coroutines are driven with asyncio.run (no async test plugin needed)
+"""
+
+import asyncio
+
+import pytest
+
+from src.mcp_server.cache import TTLCache
+from src.mcp_server.tools import team_tools
+from src.mcp_server.tools.team_tools import TeamTools
+
+FLAMENGO = {"name": "Flamengo", "city": "Rio de Janeiro", "founded": 1895,
+            "stadium": "Maracanã", "capacity": 78838, "colors": None, "current_players": 30}
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def data(self):
+        return self._rows
+
+    async def single(self):
+        return self._rows[0] if self._rows else None
+
+
+class _Session:
+    def __init__(self, driver):
+        self._driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute_read(self, work, *args, **kwargs):
+        return await work(self, *args, **kwargs)
+
+    async def run(self, query, **params):
+        self._driver.calls.append((query, params))
+        return _Result(self._driver.answers.get(query, []))
+
+
+class _Driver:
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+
+    def session(self, **kwargs):
+        return _Session(self)
+
+
+@pytest.mark.unit
+class TestSearchTeam:
+    """Tests for TeamTools.search_team"""
+
+    def test_prefix_hits_skip_the_substring_scan(self):
+        driver = _Driver({team_tools._SEARCH_TEAM: [FLAMENGO]})
+        tools = TeamTools(driver, TTLCache(maxsize=10, ttl=60))
+        response = asyncio.run(tools.search_team("Flam"))
+        assert response["teams"] == [FLAMENGO]
+        assert [query for query, _ in driver.calls] == [team_tools._SEARCH_TEAM]
+
+    def test_infix_term_falls_back_to_substring_match(self):
+        driver = _Driver({team_tools._SEARCH_TEAM_SUBSTRING: [FLAMENGO]})
+        tools = TeamTools(driver, TTLCache(maxsize=10, ttl=60))
+        response = asyncio.run(tools.search_team("Mengo"))
+        assert response["teams"] == [FLAMENGO]
+        query, params = driver.calls[-1]
+        assert query == team_tools._SEARCH_TEAM_SUBSTRING
+        assert params["name"] == "mengo"
+
+
+@pytest.mark.unit
+class TestRosterSeason:
+    """Tests for the roster season filter"""
+
+    def test_undated_spells_pass_the_season_filter(self):
+        for query in (team_tools._ROSTER_CALL, team_tools._TEAM_ROSTER_ROWS):
+            assert "r.start_date IS NULL OR r.start_date <= $season_end" in query
+            assert "r.end_date IS NULL OR r.end_date >= $season_start" in query
+
+    def test_invalid_season_is_rejected_before_querying(self):
+        driver = _Driver({})
+        tools = TeamTools(driver, TTLCache(maxsize=10, ttl=60))
+        response = asyncio.run(tools.get_team_roster("Flamengo", season="abcd"))
+        assert response["error"].startswith("Invalid season 'abcd'")
+        assert driver.calls == []
+
+    def test_season_ranges_use_their_first_year(self):
+        bounds = team_tools._season_bounds("2023-2024")
+        assert team_tools._season_error("2023-2024") is None
+        assert bounds["season_start"].isoformat() == "2023-01-01"
+        assert bounds["season_end"].isoformat() == "2023-12-31"
+
+
+@pytest.mark.unit
+class TestStreamTeamRoster:
+    """Tests for TeamTools.stream_team_roster"""
+
+    def test_session_pulls_one_batch_per_round_trip(self):
+        driver = _Driver({})
+        opened = []
+        session = driver.session
+        driver.session = lambda **kwargs: opened.append(kwargs) or session(**kwargs)
+        tools = TeamTools(driver, TTLCache(maxsize=10, ttl=60))
+
+        async def drain():
+            return [item async for item in tools.stream_team_roster("Flamengo", batch_size=25)]
+
+        assert asyncio.run(drain()) == [{"error": "Team 'Flamengo' not found"}]
+        assert opened[0]["fetch_size"] == 25
+
+
+@pytest.mark.unit
+class TestRequiredIndexes:
+    """Tests for the team index bootstrap statements"""
+
+    def test_bootstrap_never_drops_indexes(self):
+        assert not any(s.startswith("DROP") for s in team_tools.REQUIRED_INDEXES)
+
+    def test_every_fallback_replaces_a_required_statement(self):
+        assert set(team_tools.INDEX_FALLBACKS) <= set(team_tools.REQUIRED_INDEXES)